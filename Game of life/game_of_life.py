@@ -1,18 +1,28 @@
+import argparse
+import numpy as np
+import os
 import pygame
 import sys
 import random
 
-# Initialize Pygame
-pygame.init()
+from life_cycles import CycleDetector, find_cycle
+from life_engines import ENGINE_NAMES, make_engine
+from life_history import HISTORY_BYTES, History
+from life_patterns import PatternDirectory, save_rle
+from life_rules import CONWAY, PRESET_RULES, Rule
+from life_scheduler import GenerationScheduler, RateMeter, StepWorker
+from life_view import GRID_LINES_FROM, Viewport
 
 # Constants
 WIDTH, HEIGHT = 1100, 900
 GRID_WIDTH = 800
 SIDEBAR_WIDTH = 300
 CELL_SIZE = 10
-BASE_FPS = 15  # 1x speed
-SPEED_LEVELS = [0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 8.0, 10.0]
-SPEED_LABELS = ["0.25x", "0.5x", "1x", "1.5x", "2x", "3x", "4x", "5x", "8x", "10x"]
+RENDER_FPS = 60  # frames per second, independent of simulation speed
+BASE_FPS = 15  # generations per second at 1x speed
+UNCAPPED = float("inf")  # step on a worker thread as fast as possible
+SPEED_LEVELS = [0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 8.0, 10.0, UNCAPPED]
+SPEED_LABELS = ["0.25x", "0.5x", "1x", "1.5x", "2x", "3x", "4x", "5x", "8x", "10x", "Max"]
 
 # Colors
 WHITE = (255, 255, 255)
@@ -23,6 +33,8 @@ CELL_COLOR = (20, 20, 20)
 GHOST_COLOR = (100, 160, 255, 120)
 GRID_BG = (245, 245, 245)
 GRID_LINE = (210, 210, 210)
+LAYER_KEY = (255, 0, 255)  # transparent colour of the cached grid-line layers
+DENSITY_MIN_SHADE = 0.35  # a single live cell in a density bin stays visible
 SIDEBAR_BG = (38, 38, 38)
 SIDEBAR_TEXT = (220, 220, 220)
 BUTTON_BG = (55, 55, 55)
@@ -30,9 +42,24 @@ BUTTON_HOVER = (75, 75, 95)
 BUTTON_ACTIVE = (70, 100, 160)
 BUTTON_BORDER = (80, 80, 80)
 CATEGORY_COLOR = (130, 170, 220)
+CYCLE_COLOR = (120, 200, 140)
 
 ROWS = HEIGHT // CELL_SIZE
 COLS = GRID_WIDTH // CELL_SIZE
+DEFAULT_ENGINE = "tiled"
+PATTERN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patterns")
+GHOST_MAX_PX = 4096  # larger stamps preview as an outline only
+PRESET_BUTTON_HEIGHT = 28
+PRESET_CATEGORY_HEIGHT = 26
+PRESET_PADDING = 4
+
+# Jump control: advance 2^k generations at once. Hashlife handles huge jumps;
+# the other engines step every generation, so their jumps are kept small.
+JUMP_DEFAULT_EXPONENT = 10
+JUMP_MAX_EXPONENT = 40
+BRUTE_JUMP_MAX_EXPONENT = 10
+NOTICE_MS = 4000  # how long a save/load message replaces the stamp hint
+NOTICE_COLOR = (230, 190, 90)
 
 # ─── PRESETS ───────────────────────────────────────────────────────────────────
 
@@ -365,12 +392,37 @@ PRESETS = {
 }
 
 
+def random_soup(rng=random):
+    """Cells for "Random Soup": 400 random cells around the board centre."""
+    cx, cy = ROWS // 2, COLS // 2
+    return [(cx + rng.randint(-15, 15), cy + rng.randint(-15, 15)) for _ in range(400)]
+
+
+def bomb_cells():
+    """Cells for "Bomb": a dense 12x12 filled square that explodes outward."""
+    return [(r, c) for r in range(12) for c in range(12)]
+
+
+def preset_cells(name, rng=random):
+    """Return the cells of a preset, generating the dynamic ones."""
+    if name == "Random Soup":
+        return random_soup(rng)
+    if name == "Bomb":
+        return bomb_cells()
+    return list(PRESETS.get(name, []))
+
+
 class GameOfLife:
-    def __init__(self):
+    def __init__(self, engine=DEFAULT_ENGINE, board_rows=ROWS, board_cols=COLS,
+                 pattern_dir=PATTERN_DIR, rule=CONWAY, history_bytes=HISTORY_BYTES):
+        pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Conway's Game of Life")
         self.clock = pygame.time.Clock()
-        self.grid = set()
+        self.board_rows = board_rows
+        self.board_cols = board_cols
+        self.rule = rule
+        self.engine = make_engine(engine, board_rows, board_cols, rule)
         self.running = False
         self.playing = False
         self.generation = 0
@@ -379,60 +431,98 @@ class GameOfLife:
         self.font_small = pygame.font.SysFont("Segoe UI", 13)
         self.font_title = pygame.font.SysFont("Segoe UI", 20, bold=True)
         self.font_cat = pygame.font.SysFont("Segoe UI", 14, bold=True)
+        self.font_hint = pygame.font.SysFont("Segoe UI", 11)
+        self._labels = {}  # slot -> ((text, colour), surface)
+        self._preset_list = None
+        self._preset_buttons = []
         self.scroll_offset = 0
         self.max_scroll = 0
         self.preset_rects = {}
         self.dragging = False
         self._drag_erase = False
+        self.panning = False
+        self._pan_moved = False
+        self.view = Viewport(GRID_WIDTH, HEIGHT, CELL_SIZE)
+        self.grid_rect = pygame.Rect(0, 0, GRID_WIDTH, HEIGHT)
         self.speed_index = 2  # Default 1x
+        self.scheduler = GenerationScheduler()
+        self.rate_meter = RateMeter()
+        self.gens_per_sec = 0.0
+        self.worker = None
+        self.worker_frame = None
+        self.cycles = CycleDetector()
+        self.cycle = None  # set while a detected cycle is being replayed
+        self.history = History(max_bytes=history_bytes)
+        self._history_dirty = True  # the universe changed since the last record
+        self.jump_exponent = JUMP_DEFAULT_EXPONENT
+        self.jump_rects = {}
+        self.rule_rects = {}
+        self.notice = None  # (text, expiry in ms) shown in place of the stamp hint
 
         # Stamp tool state
         self.stamp_name = None
         self.stamp_cells = []
         self.ghost_surface = None
+        self.ghost_size = (0, 0)
+        self._ghost_px = None
+
+        # Rendering caches
+        self._grid_overlays = {}
+        self._bin_key = None
+        self._tile_frame_key = None
+        self._tile_counts = None
+
+        self.patterns = PatternDirectory(pattern_dir)
+        self._build_sidebar_items()
 
-        # Build sidebar items
+    def _build_sidebar_items(self):
         self.sidebar_items = []
         for cat_name, preset_names in PRESET_CATEGORIES:
             self.sidebar_items.append(("category", cat_name))
             for p in preset_names:
                 self.sidebar_items.append(("preset", p))
+        # Only the file names are listed here; files are parsed when picked.
+        if self.patterns.names():
+            self.sidebar_items.append(("category", "Pattern Files"))
+            for name in self.patterns.names():
+                self.sidebar_items.append(("pattern", name))
+        self._preset_list = None
 
     # ── Stamp helpers ──
 
     def select_stamp(self, name):
         """Select a preset as the active stamp tool."""
         if name == "Clear":
-            self.grid.clear()
+            self.engine.clear()
             self.generation = 0
-            self.population = 0
+            self.universe_edited()
             self.stamp_name = None
             self.stamp_cells = []
             self.ghost_surface = None
             return
 
         if name == "Random Soup":
-            cx, cy = ROWS // 2, COLS // 2
-            for _ in range(400):
-                self.grid.add((cx + random.randint(-15, 15), cy + random.randint(-15, 15)))
-            self.population = len(self.grid)
+            self.engine.add_cells(random_soup())
+            self.universe_edited()
             self.stamp_name = None
             self.stamp_cells = []
             self.ghost_surface = None
             return
 
         if name == "Bomb":
-            # Generate a dense 12x12 filled square — causes massive explosion
-            cells = []
-            for r in range(12):
-                for c in range(12):
-                    cells.append((r, c))
+            cells = bomb_cells()
             self.stamp_name = name
             self.stamp_cells = cells
             self._build_ghost(cells)
             return
 
         cells = PRESETS.get(name, [])
+        if not cells and name in self.patterns:
+            try:
+                cells = self.patterns.cells(name)
+            except (OSError, ValueError) as exc:
+                self.show_notice(f"Could not load {name}: {exc}")
+                return
         if not cells:
             return
 
@@ -454,69 +544,323 @@ class GameOfLife:
             return
         max_r = max(r for r, c in cells) + 1
         max_c = max(c for r, c in cells) + 1
-        self.ghost_surface = pygame.Surface(
-            (max_c * CELL_SIZE, max_r * CELL_SIZE), pygame.SRCALPHA
-        )
+        z = self.view.cell_px
+        gap = 1 if z >= GRID_LINES_FROM else 0
+        self._ghost_px = z
+        self.ghost_size = (max_c * z, max_r * z)
+        if max(self.ghost_size) > GHOST_MAX_PX:
+            # Too big to pre-render; the preview shows the bounding box.
+            self.ghost_surface = None
+            return
+        self.ghost_surface = pygame.Surface(self.ghost_size, pygame.SRCALPHA)
         for r, c in cells:
-            rect = pygame.Rect(c * CELL_SIZE + 1, r * CELL_SIZE + 1, CELL_SIZE - 1, CELL_SIZE - 1)
+            rect = pygame.Rect(c * z + gap, r * z + gap, z - gap, z - gap)
             pygame.draw.rect(self.ghost_surface, GHOST_COLOR, rect)
 
     def place_stamp(self, grid_r, grid_c):
         """Place the current stamp at the given grid position (adds to existing)."""
-        for r, c in self.stamp_cells:
-            self.grid.add((grid_r + r, grid_c + c))
-        self.population = len(self.grid)
+        self.engine.add_cells((grid_r + r, grid_c + c) for r, c in self.stamp_cells)
+        self.universe_edited()
+
+    def universe_edited(self):
+        """Call after any edit: refresh the population and forget old cycles."""
+        self.population = self.engine.population
+        self.cycle = None
+        self.cycles.reset()
+        self._history_dirty = True
+
+    # ── Rewind ──
+
+    def record_history(self):
+        """Add the current state to the rewind buffer, once per frame at most."""
+        if self.worker or not self._history_dirty:
+            return
+        self.history.record(self.generation, self.engine.live_cells())
+        self._history_dirty = False
+
+    def rewind(self, frames):
+        """Move through recorded frames (negative = back) without recomputing.
+
+        Stepping forward past the newest frame computes one new generation.
+        """
+        self.playing = False
+        self.record_history()
+        restored = self.history.step(frames)
+        if restored is None:
+            if frames > 0:
+                self.step_generations(1)
+            return
+        self.generation, cells = restored
+        if self.cycle:
+            # The engine is one of the cycle's phases; don't overwrite it.
+            self.engine = make_engine(self.engine.name, self.board_rows, self.board_cols, self.rule)
+        self.engine.load(cells)
+        self.population = self.engine.population
+        self.cycle = None
+        self.cycles.reset()
+
+    def select_engine(self, name):
+        """Switch stepping engine, carrying the current universe across."""
+        if name == self.engine.name:
+            return
+        cells = self.engine.cells()
+        self.engine = make_engine(name, self.board_rows, self.board_cols, self.rule)
+        self.engine.load(cells)
+        self.universe_edited()
+
+    def max_jump_exponent(self):
+        if self.engine.name == "hashlife":
+            return JUMP_MAX_EXPONENT
+        return BRUTE_JUMP_MAX_EXPONENT
+
+    def change_jump(self, delta):
+        self.jump_exponent = max(0, min(JUMP_MAX_EXPONENT, self.jump_exponent + delta))
+
+    def jump(self):
+        """Advance 2^k generations in a single engine call."""
+        gens = 1 << min(self.jump_exponent, self.max_jump_exponent())
+        self.step_generations(gens)
+
+    def click_jump_control(self, mx, my):
+        """Handle a click on the sidebar jump buttons; True if one was hit."""
+        for key, rect in self.jump_rects.items():
+            if rect.collidepoint(mx, my):
+                if key == "minus":
+                    self.change_jump(-1)
+                elif key == "plus":
+                    self.change_jump(1)
+                else:
+                    self.jump()
+                return True
+        return False
+
+    def set_rule(self, rule):
+        """Switch the engine to another B/S rule, keeping the universe."""
+        self.rule = rule
+        self.engine.set_rule(rule)
+        self.universe_edited()
+
+    def cycle_rule(self, delta):
+        if self.rule in PRESET_RULES:
+            index = PRESET_RULES.index(self.rule) + delta
+        else:
+            index = 0 if delta > 0 else -1
+        self.set_rule(PRESET_RULES[index % len(PRESET_RULES)])
+
+    def click_rule_control(self, mx, my):
+        """Handle a click on the sidebar rule arrows; True if one was hit."""
+        for key, rect in self.rule_rects.items():
+            if rect.collidepoint(mx, my):
+                self.cycle_rule(-1 if key == "prev" else 1)
+                return True
+        return False
+
+    def export_rle(self):
+        """Save the current universe as RLE in the pattern directory."""
+        os.makedirs(self.patterns.path, exist_ok=True)
+        path = os.path.join(self.patterns.path, f"universe-gen{self.generation}.rle")
+        save_rle(path, self.engine.live_cells(), self.rule.notation,
+                 name=f"Generation {self.generation}")
+        self.patterns.refresh()
+        self._build_sidebar_items()
+        return path
+
+    def show_notice(self, text):
+        """Show a short message in the sidebar for NOTICE_MS."""
+        self.notice = (text, pygame.time.get_ticks() + NOTICE_MS)
+
+    def cycle_engine(self):
+        index = ENGINE_NAMES.index(self.engine.name)
+        self.select_engine(ENGINE_NAMES[(index + 1) % len(ENGINE_NAMES)])
 
     # ── Drawing ──
 
+    def capture_view(self, engine):
+        """Return (state, counts) for the current viewport.
+
+        ``counts`` holds live cells per density bin (per cell when zoomed
+        in). The step worker calls this from its own thread, so it reads
+        the view state once.
+        """
+        state = self.view.state
+        return state, engine.density_in_view(*self.view.layout(state))
+
+    def _grid_overlay(self, cell_px):
+        """Colour-keyed grid lines for one zoom level, drawn once and reused."""
+        overlay = self._grid_overlays.get(cell_px)
+        if overlay is None:
+            overlay = pygame.Surface((GRID_WIDTH + cell_px, HEIGHT + cell_px))
+            overlay.fill(LAYER_KEY)
+            overlay.set_colorkey(LAYER_KEY)
+            for x in range(0, overlay.get_width() + 1, cell_px):
+                pygame.draw.line(overlay, GRID_LINE, (x, 0), (x, overlay.get_height()))
+            for y in range(0, overlay.get_height() + 1, cell_px):
+                pygame.draw.line(overlay, GRID_LINE, (0, y), (overlay.get_width(), y))
+            self._grid_overlays[cell_px] = overlay
+        return overlay
+
     def draw_grid_lines(self):
-        for x in range(0, GRID_WIDTH + 1, CELL_SIZE):
-            pygame.draw.line(self.screen, GRID_LINE, (x, 0), (x, HEIGHT))
-        for y in range(0, HEIGHT + 1, CELL_SIZE):
-            pygame.draw.line(self.screen, GRID_LINE, (0, y), (GRID_WIDTH, y))
+        x, y, z = self.view.state
+        if z >= GRID_LINES_FROM:
+            self.screen.blit(self._grid_overlay(z), (0, 0), (x % z, y % z, GRID_WIDTH, HEIGHT))
 
     def draw_cells(self):
-        for (r, c) in self.grid:
-            x = c * CELL_SIZE
-            y = r * CELL_SIZE
-            if 0 <= x < GRID_WIDTH and 0 <= y < HEIGHT:
-                rect = pygame.Rect(x + 1, y + 1, CELL_SIZE - 1, CELL_SIZE - 1)
-                pygame.draw.rect(self.screen, CELL_COLOR, rect)
+        """Draw the viewport from its per-bin live counts.
+
+        Counts become one pixel per bin (cell colour when zoomed in, a shade
+        by density when zoomed out), blitted with surfarray and scaled up in
+        a single call. draw_grid_lines then adds the 1 px gaps between cells.
+        """
+        if self.worker:
+            if self.worker_frame is None:
+                return
+            state, counts = self.worker_frame
+        elif hasattr(self.engine, "take_dirty_tiles"):
+            state, counts = self._tiled_frame()
+        else:
+            state, counts = self.capture_view(self.engine)
+
+        x, y, z = state
+        top, left, _, _, block = self.view.layout(state)
+        small, scaled = self._bin_surfaces(counts.shape, block * z)
+        if block == 1:
+            pixels = np.where(counts.T > 0, small.map_rgb(CELL_COLOR), small.map_rgb(GRID_BG))
+        else:
+            shade = counts.T / (block * block)
+            shade = np.where(counts.T > 0, DENSITY_MIN_SHADE + (1 - DENSITY_MIN_SHADE) * shade, 0.0)
+            bg, fg = np.array(GRID_BG, dtype=float), np.array(CELL_COLOR, dtype=float)
+            pixels = (bg + (fg - bg) * shade[..., None]).astype(np.uint8)
+
+        pygame.surfarray.blit_array(small, pixels)
+        pygame.transform.scale(small, scaled.get_size(), scaled)
+        self.screen.blit(scaled, (0, 0), (x - left * z, y - top * z, GRID_WIDTH, HEIGHT))
+
+    def _bin_surfaces(self, shape, bin_px):
+        """One-pixel-per-bin surface and its scaled copy, reused across frames."""
+        key = (shape, bin_px)
+        if self._bin_key != key:
+            rows, cols = shape
+            self._bin_key = key
+            self._bin_small = pygame.Surface((cols, rows))
+            self._bin_scaled = pygame.Surface((cols * bin_px, rows * bin_px))
+        return self._bin_small, self._bin_scaled
+
+    def _tiled_frame(self):
+        """Viewport counts for the tiled engine, refreshing only dirty tiles."""
+        state = self.view.state
+        dirty = self.engine.take_dirty_tiles()
+        key = (self.engine, state)
+        if dirty is None or self.view.block_for(state[2]) != 1 or key != self._tile_frame_key:
+            self._tile_frame_key = key
+            self._tile_counts = self.capture_view(self.engine)[1]
+            return state, self._tile_counts
+
+        top, left, bottom, right, _ = self.view.layout(state)
+        tile = self.engine.TILE
+        for tr, tc in dirty:
+            r0, c0 = max(top, tr * tile), max(left, tc * tile)
+            r1, c1 = min(bottom, (tr + 1) * tile), min(right, (tc + 1) * tile)
+            if r0 < r1 and c0 < c1:
+                self._tile_counts[r0 - top:r1 - top, c0 - left:c1 - left] = (
+                    self.engine.density_in_view(r0, c0, r1, c1, 1)
+                )
+        return state, self._tile_counts
 
     def draw_stamp_preview(self):
-        if not self.stamp_name or not self.ghost_surface:
+        if not self.stamp_name or not self.stamp_cells:
             return
         mx, my = pygame.mouse.get_pos()
         if mx >= GRID_WIDTH:
             return
-        grid_c = mx // CELL_SIZE
-        grid_r = my // CELL_SIZE
-        self.screen.blit(self.ghost_surface, (grid_c * CELL_SIZE, grid_r * CELL_SIZE))
+        if self._ghost_px != self.view.cell_px:
+            self._build_ghost(self.stamp_cells)
+        grid_r, grid_c = self.view.screen_to_cell(mx, my)
+        pos = self.view.cell_to_screen(grid_r, grid_c)
+        if self.ghost_surface:
+            self.screen.blit(self.ghost_surface, pos)
+        else:
+            pygame.draw.rect(self.screen, GHOST_COLOR[:3], (pos, self.ghost_size), 1)
+
+    def _label(self, slot, font, text, color):
+        """Return the rendered text for a sidebar slot, re-rendering only on change."""
+        cached = self._labels.get(slot)
+        if cached is None or cached[0] != (text, color):
+            cached = ((text, color), font.render(text, True, color))
+            self._labels[slot] = cached
+        return cached[1]
+
+    def _render_preset_list(self):
+        """Pre-render the whole scrollable preset list with idle buttons."""
+        height = sum(
+            (PRESET_CATEGORY_HEIGHT if item_type == "category" else PRESET_BUTTON_HEIGHT) + PRESET_PADDING
+            for item_type, _ in self.sidebar_items
+        )
+        surface = pygame.Surface((SIDEBAR_WIDTH, max(1, height)))
+        surface.fill(SIDEBAR_BG)
+        self._preset_buttons = []
+        item_y = 0
+        for item_type, name in self.sidebar_items:
+            if item_type == "category":
+                cat_surf = self.font_cat.render(f"\u2500 {name} \u2500", True, CATEGORY_COLOR)
+                surface.blit(cat_surf, (10, item_y + 4))
+                item_y += PRESET_CATEGORY_HEIGHT + PRESET_PADDING
+            else:
+                rect = pygame.Rect(10, item_y, SIDEBAR_WIDTH - 20, PRESET_BUTTON_HEIGHT)
+                label = self.font_small.render(name, True, WHITE)
+                self._draw_button(surface, rect, label, BUTTON_BG)
+                self._preset_buttons.append((name, rect, label))
+                item_y += PRESET_BUTTON_HEIGHT + PRESET_PADDING
+        self._preset_list = surface
+
+    @staticmethod
+    def _draw_button(target, rect, label, bg):
+        pygame.draw.rect(target, bg, rect, border_radius=4)
+        pygame.draw.rect(target, BUTTON_BORDER, rect, 1, border_radius=4)
+        target.blit(label, label.get_rect(center=rect.center))
 
     def draw_sidebar(self):
         sidebar_rect = pygame.Rect(GRID_WIDTH, 0, SIDEBAR_WIDTH, HEIGHT)
         pygame.draw.rect(self.screen, SIDEBAR_BG, sidebar_rect)
 
         # Title
-        title = self.font_title.render("Game of Life", True, WHITE)
+        title = self._label("title", self.font_title, "Game of Life", WHITE)
         self.screen.blit(title, (GRID_WIDTH + 15, 12))
 
         # Stats
-        gen_text = self.font_small.render(
-            f"Gen: {self.generation}   Pop: {self.population}", True, SIDEBAR_TEXT
-        )
+        stats = f"Gen: {self.generation}   Pop: {self.population}"
+        if hasattr(self.engine, "active_tiles"):
+            stats += f"   Tiles: {self.engine.active_tiles}"
+        gen_text = self._label("stats", self.font_small, stats, SIDEBAR_TEXT)
         self.screen.blit(gen_text, (GRID_WIDTH + 15, 40))
+        if self.cycle:
+            cycle_text = f"stable, period {self.cycle.period}, since gen {self.cycle.since}"
+            cycle_surf = self._label("cycle", self.font_small, cycle_text, CYCLE_COLOR)
+        else:
+            cycle_surf = self._label("cycle", self.font_small, "evolving", (120, 120, 120))
+        self.screen.blit(cycle_surf, (GRID_WIDTH + 15, 58))
+        if self.history.rewound:
+            history_text = f"\u23ea {self.history.rewound} frames back"
+        else:
+            history_text = f"history {len(self.history)} frames \u00b7 {self.history.nbytes / (1 << 20):.1f} MB"
+        history_surf = self._label("history", self.font_small, history_text, (120, 120, 120))
+        history_x = WIDTH - 15 - history_surf.get_width()
+        if history_x > GRID_WIDTH + 25 + cycle_surf.get_width():
+            self.screen.blit(history_surf, (history_x, 58))
 
         # Status
         if self.playing:
-            status_surf = self.font.render("\u25b6 RUNNING", True, GREEN)
+            status_surf = self._label("status", self.font, "\u25b6 RUNNING", GREEN)
         else:
-            status_surf = self.font.render("\u23f8 PAUSED", True, RED)
-        self.screen.blit(status_surf, (GRID_WIDTH + 15, 60))
+            status_surf = self._label("status", self.font, "\u23f8 PAUSED", RED)
+        self.screen.blit(status_surf, (GRID_WIDTH + 15, 78))
+        engine_surf = self._label(
+            "engine", self.font_small, f"{self.engine.name} \u00b7 {self.gens_per_sec:,.0f} gen/s", SIDEBAR_TEXT
+        )
+        self.screen.blit(engine_surf, (WIDTH - 15 - engine_surf.get_width(), 80))
 
         # ── Speed Meter ──
-        y_speed = 84
-        speed_label = self.font_small.render("Speed:", True, SIDEBAR_TEXT)
+        y_speed = 102
+        speed_label = self._label("speed", self.font_small, "Speed:", SIDEBAR_TEXT)
         self.screen.blit(speed_label, (GRID_WIDTH + 15, y_speed))
 
         bar_x = GRID_WIDTH + 70
@@ -538,12 +882,45 @@ class GameOfLife:
             pygame.draw.rect(self.screen, bar_color, (bar_x, bar_y, fill_w, bar_h), border_radius=7)
 
         pygame.draw.rect(self.screen, (80, 80, 80), (bar_x, bar_y, bar_w, bar_h), 1, border_radius=7)
-        spd_text = self.font_small.render(SPEED_LABELS[self.speed_index], True, WHITE)
+        spd_text = self._label("speed value", self.font_small, SPEED_LABELS[self.speed_index], WHITE)
         spd_rect = spd_text.get_rect(center=(bar_x + bar_w // 2, bar_y + bar_h // 2))
         self.screen.blit(spd_text, spd_rect)
 
+        # ── Jump Control ──
+        y_jump = y_speed + 20
+        k = min(self.jump_exponent, self.max_jump_exponent())
+        jump_label = self._label("jump", self.font_small, f"Jump: 2^{k} = {1 << k:,} gens", SIDEBAR_TEXT)
+        self.screen.blit(jump_label, (GRID_WIDTH + 15, y_jump))
+        self.jump_rects = {}
+        btn_x = WIDTH - 105
+        mx, my = pygame.mouse.get_pos()
+        for key, label, btn_w in (("minus", "-", 22), ("plus", "+", 22), ("go", "Go", 40)):
+            rect = pygame.Rect(btn_x, y_jump, btn_w, 18)
+            bg = BUTTON_HOVER if rect.collidepoint(mx, my) else BUTTON_BG
+            self._draw_button(self.screen, rect, self._label(("jump", key), self.font_small, label, WHITE), bg)
+            self.jump_rects[key] = rect
+            btn_x += btn_w + 4
+
+        # ── Rule Selector ──
+        y_rule = y_jump + 22
+        self.rule_rects = {}
+        btn_x = WIDTH - 61
+        for key, label in (("prev", "<"), ("next", ">")):
+            rect = pygame.Rect(btn_x, y_rule, 22, 18)
+            bg = BUTTON_HOVER if rect.collidepoint(mx, my) else BUTTON_BG
+            self._draw_button(self.screen, rect, self._label(("rule", key), self.font_small, label, WHITE), bg)
+            self.rule_rects[key] = rect
+            btn_x += 26
+        rule_text = f"Rule: {self.rule.name}"
+        if self.rule.name != self.rule.notation:
+            rule_text += f" ({self.rule.notation})"
+        rule_label = self._label("rule", self.font_small, rule_text, SIDEBAR_TEXT)
+        if GRID_WIDTH + 15 + rule_label.get_width() > WIDTH - 66:
+            rule_label = self._label("rule", self.font_small, f"Rule: {self.rule.notation}", SIDEBAR_TEXT)
+        self.screen.blit(rule_label, (GRID_WIDTH + 15, y_rule))
+
         # ── Stamp Mode Indicator ──
-        y_mode = y_speed + 20
+        y_mode = y_rule + 24
         if self.stamp_name:
             mode_text = f"\U0001f528 Placing: {self.stamp_name}"
             mode_color = (100, 180, 255)
@@ -552,21 +929,27 @@ class GameOfLife:
             mode_text = "\u270f\ufe0f Draw Mode"
             mode_color = (180, 180, 180)
             hint_text = "Click a preset to stamp it"
-        mode_surf = self.font_small.render(mode_text, True, mode_color)
+        mode_surf = self._label("mode", self.font_small, mode_text, mode_color)
         self.screen.blit(mode_surf, (GRID_WIDTH + 15, y_mode))
-        hint_surf = pygame.font.SysFont("Segoe UI", 11).render(hint_text, True, (120, 120, 120))
+        hint_color = (120, 120, 120)
+        if self.notice and pygame.time.get_ticks() < self.notice[1]:
+            hint_text, hint_color = self.notice[0], NOTICE_COLOR
+        hint_surf = self._label("hint", self.font_hint, hint_text, hint_color)
         self.screen.blit(hint_surf, (GRID_WIDTH + 15, y_mode + 16))
 
         # Controls
         controls = [
             "Space: Play / Pause",
-            "C: Clear    R: Random",
+            "C: Clear    R: Random    S: Save RLE",
             "+/-: Speed    Click: Draw",
-            "Esc: Cancel stamp",
+            "E: Engine    Esc: Cancel stamp",
+            "[ / ]: Jump size    J: Jump",
+            "\u2190 / \u2192: Rewind / step  (Shift: x10)",
+            "Wheel: Zoom    Right-drag: Pan    Home: Reset view",
         ]
         y_off = y_mode + 38
-        for line in controls:
-            surf = self.font_small.render(line, True, (150, 150, 150))
+        for i, line in enumerate(controls):
+            surf = self._label(("controls", i), self.font_small, line, (150, 150, 150))
             self.screen.blit(surf, (GRID_WIDTH + 15, y_off))
             y_off += 18
 
@@ -576,116 +959,128 @@ class GameOfLife:
         y_off += 10
 
         # ── Scrollable preset area ──
+        # The list is pre-rendered; only the visible slice is blitted and
+        # the hovered and active buttons are redrawn on top.
         presets_top = y_off
         presets_height = HEIGHT - presets_top
-        preset_surface = pygame.Surface((SIDEBAR_WIDTH, presets_height))
-        preset_surface.fill(SIDEBAR_BG)
-
         clip_rect = pygame.Rect(GRID_WIDTH, presets_top, SIDEBAR_WIDTH, presets_height)
+        if self._preset_list is None:
+            self._render_preset_list()
+        self.max_scroll = max(0, self._preset_list.get_height() - presets_height + 10)
+        self.screen.blit(
+            self._preset_list, clip_rect,
+            pygame.Rect(0, self.scroll_offset, SIDEBAR_WIDTH, presets_height),
+        )
 
         mx, my = pygame.mouse.get_pos()
         self.preset_rects = {}
-        item_y = -self.scroll_offset
-        item_height_button = 28
-        item_height_cat = 26
-        padding = 4
-
-        total_height = 0
-        for item_type, _ in self.sidebar_items:
-            if item_type == "category":
-                total_height += item_height_cat + padding
-            else:
-                total_height += item_height_button + padding
-        self.max_scroll = max(0, total_height - presets_height + 10)
-
-        for item_type, name in self.sidebar_items:
-            if item_type == "category":
-                if 0 <= item_y + item_height_cat and item_y < presets_height:
-                    cat_surf = self.font_cat.render(f"\u2500 {name} \u2500", True, CATEGORY_COLOR)
-                    preset_surface.blit(cat_surf, (10, item_y + 4))
-                item_y += item_height_cat + padding
+        self.screen.set_clip(clip_rect)
+        for name, rect, label in self._preset_buttons:
+            btn_rect_screen = rect.move(GRID_WIDTH, presets_top - self.scroll_offset)
+            self.preset_rects[name] = btn_rect_screen
+            if self.stamp_name == name:
+                bg = BUTTON_ACTIVE
+            elif clip_rect.collidepoint(mx, my) and btn_rect_screen.collidepoint(mx, my):
+                bg = BUTTON_HOVER
             else:
-                btn_rect_local = pygame.Rect(10, item_y, SIDEBAR_WIDTH - 20, item_height_button)
-                btn_rect_screen = pygame.Rect(
-                    GRID_WIDTH + 10, presets_top + item_y, SIDEBAR_WIDTH - 20, item_height_button
-                )
-
-                if 0 <= item_y + item_height_button and item_y < presets_height:
-                    is_active = self.stamp_name == name
-                    hovered = clip_rect.collidepoint(mx, my) and btn_rect_screen.collidepoint(mx, my)
-
-                    if is_active:
-                        bg = BUTTON_ACTIVE
-                    elif hovered:
-                        bg = BUTTON_HOVER
-                    else:
-                        bg = BUTTON_BG
-
-                    pygame.draw.rect(preset_surface, bg, btn_rect_local, border_radius=4)
-                    pygame.draw.rect(preset_surface, BUTTON_BORDER, btn_rect_local, 1, border_radius=4)
-
-                    text_surf = self.font_small.render(name, True, WHITE)
-                    text_rect = text_surf.get_rect(center=btn_rect_local.center)
-                    preset_surface.blit(text_surf, text_rect)
-
-                self.preset_rects[name] = btn_rect_screen
-                item_y += item_height_button + padding
-
-        self.screen.blit(preset_surface, (GRID_WIDTH, presets_top))
+                continue
+            self._draw_button(self.screen, btn_rect_screen, label, bg)
+        self.screen.set_clip(None)
         self._presets_top = presets_top
 
     # ── Simulation ──
 
-    def get_neighbors(self, r, c):
-        count = 0
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                if (r + dr, c + dc) in self.grid:
-                    count += 1
-        return count
-
-    def update_grid(self):
-        if not self.playing:
+    def update_grid(self, gens=1):
+        if not self.playing or gens <= 0:
             return
-
-        new_grid = set()
-        candidates = set()
-
-        for (r, c) in self.grid:
-            candidates.add((r, c))
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    candidates.add((r + dr, c + dc))
-
-        for (r, c) in candidates:
-            neigh = self.get_neighbors(r, c)
-            alive = (r, c) in self.grid
-            if alive and neigh in (2, 3):
-                new_grid.add((r, c))
-            elif not alive and neigh == 3:
-                new_grid.add((r, c))
-
-        self.grid = new_grid
-        self.generation += 1
-        self.population = len(self.grid)
+        self.step_generations(gens)
+
+    def step_generations(self, gens):
+        """Advance the universe, or replay the detected cycle without computing."""
+        self.generation += gens
+        self._history_dirty = True
+        if self.cycle:
+            self.engine = self.cycle.phase_at(self.generation)
+        else:
+            self.engine.step(gens)
+            self.check_cycle(self.generation, self.engine.state_hash())
+        self.population = self.engine.population
+
+    def check_cycle(self, generation, state_hash):
+        """Record a generation's hash and switch to replay once it repeats."""
+        since = self.cycles.record(generation, state_hash)
+        if since is None:
+            return
+        self.stop_worker()
+        name = self.engine.name
+        self.cycle = find_cycle(
+            self.engine, generation, since,
+            lambda: make_engine(name, self.board_rows, self.board_cols, self.rule),
+            start=self.generation,
+        )
+        if self.cycle is None:
+            self.cycles.give_up()
+
+    def advance(self, dt):
+        """Run however many generations this frame owes at the current speed."""
+        speed = SPEED_LEVELS[self.speed_index]
+        if self.playing and speed == UNCAPPED and not self.cycle:
+            if not self.worker:
+                self.start_worker()
+            snapshot = self.worker.take_snapshot()
+            if snapshot:
+                self.generation, self.population, self.worker_frame, state_hash = snapshot
+                self._history_dirty = True
+                self.check_cycle(self.generation, state_hash)
+        else:
+            self.stop_worker()
+            if speed == UNCAPPED:
+                gens = self.scheduler.max_per_frame
+            else:
+                gens = self.scheduler.due(BASE_FPS * speed, dt)
+            self.update_grid(gens)
+        self.gens_per_sec = self.rate_meter.update(self.generation)
+
+    def start_worker(self):
+        """Hand the engine to a background thread for uncapped stepping."""
+        self.worker_frame = self.capture_view(self.engine)
+        self.worker = StepWorker(self.engine, self.generation, self.capture_view)
+        self.worker.start()
+
+    def stop_worker(self):
+        """Take the engine back from the worker before touching it."""
+        if not self.worker:
+            return
+        self.worker.stop()
+        self.generation = self.worker.generation
+        self.population = self.engine.population
+        self.worker = None
+        self.worker_frame = None
+        self._tile_frame_key = None  # tiles changed behind the cached counts' back
+        self.scheduler.reset()
 
     # ── Input ──
 
     def handle_input(self):
         for event in pygame.event.get():
+            if event.type == pygame.KEYDOWN or (
+                event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+            ) or (event.type == pygame.MOUSEMOTION and self.dragging):
+                # Any edit needs the engine back from the worker thread; it
+                # restarts next frame if the speed is still uncapped.
+                self.stop_worker()
+
             if event.type == pygame.QUIT:
                 self.running = False
 
             # ── MOUSEWHEEL (pygame 2.x proper scroll) ──
             elif event.type == pygame.MOUSEWHEEL:
-                mx, _ = pygame.mouse.get_pos()
+                mx, my = pygame.mouse.get_pos()
                 if mx > GRID_WIDTH:
                     self.scroll_offset -= event.y * 35
                     self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
+                else:
+                    self.view.zoom_at(mx, my, event.y)
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 mx, my = pygame.mouse.get_pos()
@@ -698,7 +1093,12 @@ class GameOfLife:
                     if mx > GRID_WIDTH:
                         self.scroll_offset = min(self.max_scroll, self.scroll_offset + 35)
 
-                # Right-click cancels stamp
+                # Right/middle drag pans the grid; a right click that
+                # doesn't move cancels the stamp on release.
+                elif event.button in (2, 3) and mx < GRID_WIDTH:
+                    self.panning = True
+                    self._pan_moved = False
+
                 elif event.button == 3:
                     if self.stamp_name:
                         self.stamp_name = None
@@ -708,52 +1108,77 @@ class GameOfLife:
                 # Left click
                 elif event.button == 1:
                     if mx > GRID_WIDTH:
+                        if self.click_jump_control(mx, my) or self.click_rule_control(mx, my):
+                            continue
                         for name, rect in self.preset_rects.items():
                             if rect.collidepoint(mx, my) and my >= self._presets_top:
                                 self.select_stamp(name)
                                 break
                     else:
-                        grid_c = mx // CELL_SIZE
-                        grid_r = my // CELL_SIZE
+                        grid_r, grid_c = self.view.screen_to_cell(mx, my)
 
                         if self.stamp_name and self.stamp_cells:
                             self.place_stamp(grid_r, grid_c)
                         else:
-                            if (grid_r, grid_c) in self.grid:
-                                self.grid.remove((grid_r, grid_c))
+                            if self.engine.is_alive(grid_r, grid_c):
+                                self.engine.set_cell(grid_r, grid_c, False)
                                 self.dragging = True
                                 self._drag_erase = True
                             else:
-                                self.grid.add((grid_r, grid_c))
+                                self.engine.set_cell(grid_r, grid_c, True)
                                 self.dragging = True
                                 self._drag_erase = False
-                            self.population = len(self.grid)
+                            self.universe_edited()
 
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:
                     self.dragging = False
+                elif event.button in (2, 3) and self.panning:
+                    self.panning = False
+                    if event.button == 3 and not self._pan_moved and self.stamp_name:
+                        self.stamp_name = None
+                        self.stamp_cells = []
+                        self.ghost_surface = None
+
+            elif event.type == pygame.MOUSEMOTION and self.panning:
+                self.view.pan(*event.rel)
+                self._pan_moved = True
 
             elif event.type == pygame.MOUSEMOTION and self.dragging and not self.stamp_name:
                 mx, my = pygame.mouse.get_pos()
                 if mx < GRID_WIDTH:
-                    grid_c = mx // CELL_SIZE
-                    grid_r = my // CELL_SIZE
-                    if self._drag_erase:
-                        self.grid.discard((grid_r, grid_c))
-                    else:
-                        self.grid.add((grid_r, grid_c))
-                    self.population = len(self.grid)
+                    grid_r, grid_c = self.view.screen_to_cell(mx, my)
+                    self.engine.set_cell(grid_r, grid_c, not self._drag_erase)
+                    self.universe_edited()
 
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     self.playing = not self.playing
                 elif event.key == pygame.K_c:
-                    self.grid.clear()
+                    self.engine.clear()
                     self.playing = False
                     self.generation = 0
-                    self.population = 0
+                    self.universe_edited()
                 elif event.key == pygame.K_r:
                     self.select_stamp("Random Soup")
+                elif event.key == pygame.K_e:
+                    self.cycle_engine()
+                elif event.key == pygame.K_s:
+                    try:
+                        self.show_notice(f"Saved {os.path.basename(self.export_rle())}")
+                    except OSError as exc:
+                        self.show_notice(f"Could not save: {exc}")
+                elif event.key == pygame.K_LEFTBRACKET:
+                    self.change_jump(-1)
+                elif event.key == pygame.K_RIGHTBRACKET:
+                    self.change_jump(1)
+                elif event.key == pygame.K_j:
+                    self.jump()
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    frames = 10 if event.mod & pygame.KMOD_SHIFT else 1
+                    self.rewind(-frames if event.key == pygame.K_LEFT else frames)
+                elif event.key == pygame.K_HOME:
+                    self.view.reset()
                 elif event.key == pygame.K_ESCAPE:
                     self.stamp_name = None
                     self.stamp_cells = []
@@ -768,23 +1193,70 @@ class GameOfLife:
     def run(self):
         self.running = True
         while self.running:
-            self.screen.fill(GRID_BG)
+            dt = self.clock.tick(RENDER_FPS) / 1000.0
             self.handle_input()
-            self.update_grid()
+            self.advance(dt)
+            self.record_history()
 
-            self.draw_grid_lines()
             self.draw_cells()
+            self.draw_grid_lines()
             self.draw_stamp_preview()
             self.draw_sidebar()
 
             pygame.display.flip()
-            current_fps = int(BASE_FPS * SPEED_LEVELS[self.speed_index])
-            self.clock.tick(max(1, current_fps))
 
+        self.stop_worker()
         pygame.quit()
         sys.exit()
 
 
-if __name__ == "__main__":
-    game = GameOfLife()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conway's Game of Life")
+    parser.add_argument("--engine", default=DEFAULT_ENGINE,
+                        help=f"stepping engine: {', '.join(ENGINE_NAMES)} ('all' with --bench)")
+    parser.add_argument("--bench", nargs="?", const="all", metavar="PRESET",
+                        help="run headless and benchmark PRESET (default: every preset)")
+    parser.add_argument("--scaling", nargs="?", type=int, const=4096, metavar="SIZE",
+                        help="benchmark the parallel engine with 1, 2, 4 and 8 workers")
+    parser.add_argument("--census", nargs="?", type=int, const=1000, metavar="SOUPS",
+                        help="classify the ash of SOUPS random soups (default 1000)")
+    parser.add_argument("--workers", type=int,
+                        help="processes for --census (default: one per CPU)")
+    parser.add_argument("--gens", type=int,
+                        help="generations per benchmark run (default 1000, or 10 with --scaling)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for Random Soup in benchmarks (first soup with --census)")
+    parser.add_argument("--rule", default=CONWAY.notation,
+                        help="Life-like rule in B/S notation, e.g. B36/S23 (default B3/S23)")
+    parser.add_argument("--history-mb", type=float, default=HISTORY_BYTES / (1 << 20), metavar="MB",
+                        help="memory budget of the rewind buffer (default %(default)g)")
+    parser.add_argument("--patterns", default=PATTERN_DIR, metavar="DIR",
+                        help="folder of .rle/.lif/.mc files listed in the sidebar")
+    args = parser.parse_args(argv)
+    try:
+        rule = Rule.parse(args.rule)
+    except ValueError as exc:
+        parser.error(str(exc))
+    rule = next((preset for preset in PRESET_RULES if preset == rule), rule)
+
+    if args.bench:
+        from life_bench import run_benchmarks
+        run_benchmarks(args.bench, args.gens or 1000, args.engine, args.seed, rule)
+        return
+    if args.census:
+        from life_census import run_census
+        run_census(args.census, args.workers, args.engine, args.seed, rule)
+        return
+    if args.scaling:
+        from life_bench import run_scaling
+        run_scaling(args.scaling, args.gens or 10, seed=args.seed)
+        return
+
+    if args.engine not in ENGINE_NAMES:
+        parser.error(f"unknown engine {args.engine!r}")
+    game = GameOfLife(engine=args.engine, pattern_dir=args.patterns, rule=rule,
+                      history_bytes=int(args.history_mb * (1 << 20)))
     game.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Hashlife engine for Conway's Game of Life.
+
+The universe is a quadtree of canonical (hash-consed) nodes: two nodes with
+the same contents are the same object, so repeated structure is stored once
+and the memoized result of advancing a node is shared by every copy of it.
+Advancing a level-k node by 2^j generations (j <= k - 2) returns its centre
+half, and jumps of millions of generations cost only as much as the number
+of distinct nodes the pattern produces.
+
+HashlifeEngine speaks the same interface as the engines in life_engines.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from life_rules import CONWAY
+
+MIN_LEVEL = 3
+DEFAULT_RESULT_CACHE = 1 << 19   # memoized (node, j) -> successor entries
+DEFAULT_NODE_LIMIT = 1 << 20     # canonical nodes kept before collecting
+
+
+class Node:
+    """A 2^k x 2^k square of the universe; leaves (k == 0) are single cells."""
+
+    __slots__ = ("k", "nw", "ne", "sw", "se", "n")
+
+    def __init__(self, k, nw, ne, sw, se, n):
+        self.k = k
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.n = n
+
+
+OFF = Node(0, None, None, None, None, 0)
+ON = Node(0, None, None, None, None, 1)
+
+
+class HashlifeEngine:
+    """Memoized quadtree engine on the unbounded plane.
+
+    ``origin`` is the world (row, col) of the root node's top-left corner.
+    The result cache is an LRU bounded by ``result_cache_size``; when the
+    canonical node table grows past ``node_limit`` it is rebuilt from the
+    current root, which drops every node the pattern no longer uses.
+    """
+
+    name = "hashlife"
+
+    def __init__(self, rows=90, cols=80, result_cache_size=DEFAULT_RESULT_CACHE,
+                 node_limit=DEFAULT_NODE_LIMIT):
+        # The plane is unbounded, so the viewport size is not needed.
+        self.result_cache_size = result_cache_size
+        self.node_limit = node_limit
+        self._nodes = {}
+        self._results = OrderedDict()
+        self._empty = [OFF]
+        self.root = self.empty(MIN_LEVEL)
+        self.origin = (0, 0)
+        self.rule = CONWAY
+
+    def set_rule(self, rule):
+        if rule != self.rule:
+            self.rule = rule
+            self._results.clear()  # memoized futures were for the old rule
+
+    # ── Canonical nodes ──
+
+    def join(self, nw, ne, sw, se):
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(nw.k + 1, nw, ne, sw, se, nw.n + ne.n + sw.n + se.n)
+            self._nodes[key] = node
+        return node
+
+    def empty(self, k):
+        while len(self._empty) <= k:
+            e = self._empty[-1]
+            self._empty.append(self.join(e, e, e, e))
+        return self._empty[k]
+
+    def centre(self, node):
+        """Return the node one level up with ``node`` in its middle."""
+        z = self.empty(node.k - 1)
+        return self.join(
+            self.join(z, z, z, node.nw), self.join(z, z, node.ne, z),
+            self.join(z, node.sw, z, z), self.join(node.se, z, z, z),
+        )
+
+    def inner(self, node):
+        """Return the central half of ``node``."""
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    # ── Stepping ──
+
+    def _life_4x4(self, node):
+        """Advance the centre 2x2 of a level-2 node by one generation."""
+        rows = [
+            [node.nw.nw.n, node.nw.ne.n, node.ne.nw.n, node.ne.ne.n],
+            [node.nw.sw.n, node.nw.se.n, node.ne.sw.n, node.ne.se.n],
+            [node.sw.nw.n, node.sw.ne.n, node.se.nw.n, node.se.ne.n],
+            [node.sw.sw.n, node.sw.se.n, node.se.sw.n, node.se.se.n],
+        ]
+        lookup = self.rule.lookup
+        bits = []
+        for r in (1, 2):
+            for c in (1, 2):
+                neigh = (
+                    rows[r - 1][c - 1] + rows[r - 1][c] + rows[r - 1][c + 1]
+                    + rows[r][c - 1] + rows[r][c + 1]
+                    + rows[r + 1][c - 1] + rows[r + 1][c] + rows[r + 1][c + 1]
+                )
+                bits.append(ON if lookup[rows[r][c] * 9 + neigh] else OFF)
+        return self.join(*bits)
+
+    def successor(self, node, j):
+        """Return the centre of ``node`` advanced 2^min(j, k - 2) generations."""
+        if node.n == 0:
+            return node.nw
+        if node.k == 2:
+            j = 0
+        else:
+            j = min(j, node.k - 2)
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            return result
+
+        if node.k == 2:
+            result = self._life_4x4(node)
+        else:
+            a, b, c, d = node.nw, node.ne, node.sw, node.se
+            join, succ = self.join, self.successor
+            c1 = succ(join(a.nw, a.ne, a.sw, a.se), j)
+            c2 = succ(join(a.ne, b.nw, a.se, b.sw), j)
+            c3 = succ(join(b.nw, b.ne, b.sw, b.se), j)
+            c4 = succ(join(a.sw, a.se, c.nw, c.ne), j)
+            c5 = succ(join(a.se, b.sw, c.ne, d.nw), j)
+            c6 = succ(join(b.sw, b.se, d.nw, d.ne), j)
+            c7 = succ(join(c.nw, c.ne, c.sw, c.se), j)
+            c8 = succ(join(c.ne, d.nw, c.se, d.sw), j)
+            c9 = succ(join(d.nw, d.ne, d.sw, d.se), j)
+            if j < node.k - 2:
+                # Each c_i is already 2^j ahead; stitch their centres together.
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # Two half-steps of 2^(k-3) generations each.
+                result = join(
+                    succ(join(c1, c2, c4, c5), j), succ(join(c2, c3, c5, c6), j),
+                    succ(join(c4, c5, c7, c8), j), succ(join(c5, c6, c8, c9), j),
+                )
+
+        self._results[key] = result
+        if len(self._results) > self.result_cache_size:
+            self._results.popitem(last=False)
+        return result
+
+    def _advance_pow2(self, j):
+        root = self.root
+        r0, c0 = self.origin
+        while root.k < j + 2:
+            r0 -= 1 << (root.k - 1)
+            c0 -= 1 << (root.k - 1)
+            root = self.centre(root)
+        # Two more levels of padding leave room for the pattern to grow by
+        # up to 2^j cells on every side.
+        for _ in range(2):
+            r0 -= 1 << (root.k - 1)
+            c0 -= 1 << (root.k - 1)
+            root = self.centre(root)
+        shift = 1 << (root.k - 2)
+        self.root = self.successor(root, j)
+        self.origin = (r0 + shift, c0 + shift)
+        self._crop()
+
+    def _crop(self):
+        root = self.root
+        r0, c0 = self.origin
+        while root.k > MIN_LEVEL:
+            middle = self.inner(root)
+            if middle.n != root.n:
+                break
+            r0 += 1 << (root.k - 2)
+            c0 += 1 << (root.k - 2)
+            root = middle
+        self.root = root
+        self.origin = (r0, c0)
+
+    def step(self, n=1):
+        j = 0
+        while n > 0 and self.root.n:
+            if n & 1:
+                self._advance_pow2(j)
+            n >>= 1
+            j += 1
+        if len(self._nodes) > self.node_limit:
+            self.collect()
+
+    # ── Memory management ──
+
+    def collect(self):
+        """Rebuild the canonical tables, keeping only nodes under the root."""
+        self._nodes = {}
+        self._results = OrderedDict()
+        self._empty = [OFF]
+        seen = {id(OFF): OFF, id(ON): ON}
+
+        def rebuild(node):
+            copy = seen.get(id(node))
+            if copy is None:
+                copy = self.join(rebuild(node.nw), rebuild(node.ne),
+                                 rebuild(node.sw), rebuild(node.se))
+                seen[id(node)] = copy
+            return copy
+
+        self.root = rebuild(self.root)
+        # Never thrash: leave headroom above whatever the pattern needs.
+        self.node_limit = max(self.node_limit, 2 * len(self._nodes))
+
+    # ── Import / export ──
+
+    def _build(self, k, top, left, cells):
+        if not cells:
+            return self.empty(k)
+        if k == 0:
+            return ON
+        half = 1 << (k - 1)
+        quads = ([], [], [], [])
+        for r, c in cells:
+            quads[(2 if r >= top + half else 0) + (1 if c >= left + half else 0)].append((r, c))
+        return self.join(
+            self._build(k - 1, top, left, quads[0]),
+            self._build(k - 1, top, left + half, quads[1]),
+            self._build(k - 1, top + half, left, quads[2]),
+            self._build(k - 1, top + half, left + half, quads[3]),
+        )
+
+    def load(self, cells):
+        cells = list(set(cells))
+        if not cells:
+            self.root = self.empty(MIN_LEVEL)
+            self.origin = (0, 0)
+            return
+        top = min(r for r, _ in cells)
+        left = min(c for _, c in cells)
+        extent = max(max(r for r, _ in cells) - top, max(c for _, c in cells) - left) + 1
+        k = max(MIN_LEVEL, (extent - 1).bit_length())
+        self.root = self._build(k, top, left, cells)
+        self.origin = (top, left)
+
+    def live_cells(self):
+        r0, c0 = self.origin
+        size = 1 << self.root.k
+        return self.cells_in_view(r0, c0, r0 + size, c0 + size)
+
+    def cells_in_view(self, top, left, bottom, right):
+        stack = [(self.root, self.origin[0], self.origin[1])]
+        while stack:
+            node, r, c = stack.pop()
+            size = 1 << node.k
+            if node.n == 0 or r >= bottom or c >= right or r + size <= top or c + size <= left:
+                continue
+            if node.k == 0:
+                yield (r, c)
+                continue
+            half = size >> 1
+            stack.append((node.nw, r, c))
+            stack.append((node.ne, r, c + half))
+            stack.append((node.sw, r + half, c))
+            stack.append((node.se, r + half, c + half))
+
+    def density_in_view(self, top, left, bottom, right, block):
+        """Count live cells per block x block bin without visiting every cell.
+
+        A node that lies inside a single bin adds its whole population at
+        once, so zoomed-out views of huge patterns stay cheap.
+        """
+        rows, cols = -(-(bottom - top) // block), -(-(right - left) // block)
+        counts = np.zeros((rows, cols), dtype=np.int64)
+        stack = [(self.root, self.origin[0], self.origin[1])]
+        while stack:
+            node, r, c = stack.pop()
+            size = 1 << node.k
+            if node.n == 0 or r >= bottom or c >= right or r + size <= top or c + size <= left:
+                continue
+            br, bc = (r - top) // block, (c - left) // block
+            if (r >= top and c >= left and r + size <= bottom and c + size <= right
+                    and (r + size - 1 - top) // block == br
+                    and (c + size - 1 - left) // block == bc):
+                counts[br, bc] += node.n
+                continue
+            half = size >> 1
+            stack.append((node.nw, r, c))
+            stack.append((node.ne, r, c + half))
+            stack.append((node.sw, r + half, c))
+            stack.append((node.se, r + half, c + half))
+        return counts
+
+    def cells(self):
+        return set(self.live_cells())
+
+    # ── Editing ──
+
+    def clear(self):
+        self.load(())
+
+    def _contains(self, r, c):
+        r0, c0 = self.origin
+        size = 1 << self.root.k
+        return r0 <= r < r0 + size and c0 <= c < c0 + size
+
+    def is_alive(self, r, c):
+        if not self._contains(r, c):
+            return False
+        node = self.root
+        r -= self.origin[0]
+        c -= self.origin[1]
+        while node.k > 0:
+            if node.n == 0:
+                return False
+            half = 1 << (node.k - 1)
+            if r < half:
+                node = node.nw if c < half else node.ne
+            else:
+                node = node.sw if c < half else node.se
+            r %= half
+            c %= half
+        return node is ON
+
+    def _set(self, node, r, c, leaf):
+        if node.k == 0:
+            return leaf
+        half = 1 << (node.k - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if r < half:
+            if c < half:
+                nw = self._set(nw, r, c, leaf)
+            else:
+                ne = self._set(ne, r, c - half, leaf)
+        else:
+            if c < half:
+                sw = self._set(sw, r - half, c, leaf)
+            else:
+                se = self._set(se, r - half, c - half, leaf)
+        return self.join(nw, ne, sw, se)
+
+    def set_cell(self, r, c, alive):
+        if not alive and not self.is_alive(r, c):
+            return
+        if self.root.n == 0:
+            self.origin = (r, c)
+        while not self._contains(r, c):
+            half = 1 << (self.root.k - 1)
+            self.root = self.centre(self.root)
+            self.origin = (self.origin[0] - half, self.origin[1] - half)
+        self.root = self._set(self.root, r - self.origin[0], c - self.origin[1],
+                              ON if alive else OFF)
+
+    def add_cells(self, cells):
+        for r, c in cells:
+            self.set_cell(r, c, True)
+
+    @property
+    def population(self):
+        return self.root.n
+
+    def state_hash(self):
+        # Canonical nodes already share every repeated state; cycle
+        # detection adds nothing here.
+        return None
@@ -0,0 +1,123 @@
+"""
+Headless benchmark for the Game of Life engines.
+
+Runs presets through one or more engines without opening a window and
+prints generations per second, peak traced memory and a hash of the final
+population (equal hashes mean the engines agree cell for cell).
+
+    python game_of_life.py --bench                    # every preset
+    python game_of_life.py --bench "Gosper Glider Gun" --gens 5000 --engine all
+    python game_of_life.py --scaling 4096 --gens 20   # parallel engine speedup
+"""
+
+import hashlib
+import random
+import time
+import tracemalloc
+
+import numpy as np
+
+from game_of_life import COLS, PRESET_CATEGORIES, PRESETS, ROWS, preset_cells
+from life_engines import ENGINE_NAMES, make_engine
+from life_parallel import ParallelEngine
+
+SCALING_WORKERS = (1, 2, 4, 8)
+SCALING_DENSITY = 0.3
+
+
+def population_hash(cells):
+    """Order-independent fingerprint of a set of live cells."""
+    digest = hashlib.sha1()
+    for r, c in sorted(cells):
+        digest.update(f"{r},{c};".encode())
+    return digest.hexdigest()[:16]
+
+
+def bench_preset(preset, gens, engine_name, seed=0, rule=None):
+    """Benchmark one preset on one engine and return a result dict.
+
+    Timing and memory come from separate runs, since tracemalloc slows
+    pure-Python engines down enough to skew the timing.
+    """
+    cells = preset_cells(preset, random.Random(seed))
+
+    engine = make_engine(engine_name, ROWS, COLS, rule)
+    engine.load(cells)
+    start = time.perf_counter()
+    engine.step(gens)
+    elapsed = time.perf_counter() - start
+    final = engine.cells()
+
+    tracemalloc.start()
+    traced = make_engine(engine_name, ROWS, COLS, rule)
+    traced.load(cells)
+    traced.step(gens)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "preset": preset,
+        "engine": engine_name,
+        "gens": gens,
+        "gens_per_sec": gens / elapsed if elapsed > 0 else float("inf"),
+        "peak_kib": peak / 1024,
+        "population": len(final),
+        "hash": population_hash(final),
+    }
+
+
+def run_benchmarks(preset, gens, engine, seed=0, rule=None):
+    """Benchmark a preset (or "all") on an engine (or "all") and print a table."""
+    if preset == "all":
+        presets = [name for _, names in PRESET_CATEGORIES for name in names]
+    elif preset in PRESETS:
+        presets = [preset]
+    else:
+        raise SystemExit(f"Unknown preset {preset!r}")
+    if engine == "all":
+        engines = ENGINE_NAMES
+    elif engine in ENGINE_NAMES:
+        engines = [engine]
+    else:
+        raise SystemExit(f"Unknown engine {engine!r}; choose from {', '.join(ENGINE_NAMES)} or all")
+
+    print(f"{'preset':<22} {'engine':<9} {'gens':>7} {'gens/s':>11} {'peak KiB':>10} {'pop':>8}  hash")
+    results = []
+    for name in presets:
+        for engine_name in engines:
+            result = bench_preset(name, gens, engine_name, seed, rule)
+            results.append(result)
+            print(
+                f"{name:<22} {engine_name:<9} {gens:>7} {result['gens_per_sec']:>11.1f} "
+                f"{result['peak_kib']:>10.1f} {result['population']:>8}  {result['hash']}"
+            )
+    return results
+
+
+def run_scaling(size=4096, gens=10, workers=SCALING_WORKERS, seed=0):
+    """Time the parallel engine on a random size x size board per worker count.
+
+    Speedup is relative to one worker. Every run must end on the same hash.
+    """
+    rng = np.random.default_rng(seed)
+    board = rng.random((size, size), dtype=np.float32) < SCALING_DENSITY
+
+    print(f"{size}x{size} board, {gens} generations")
+    print(f"{'workers':>7} {'gens/s':>10} {'speedup':>8}  hash")
+    results = []
+    for count in workers:
+        engine = ParallelEngine(size, size, workers=count)
+        try:
+            engine.load_array(board)
+            engine.step()  # start the pool before timing
+            start = time.perf_counter()
+            engine.step(gens)
+            elapsed = time.perf_counter() - start
+            final_hash = engine.state_hash()
+        finally:
+            engine.close()
+        rate = gens / elapsed if elapsed > 0 else float("inf")
+        speedup = rate / results[0]["gens_per_sec"] if results else 1.0
+        results.append({"workers": count, "gens_per_sec": rate, "speedup": speedup, "hash": final_hash})
+        print(f"{count:>7} {rate:>10.2f} {speedup:>7.2f}x  {final_hash:016x}")
+    return results
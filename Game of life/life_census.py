@@ -0,0 +1,308 @@
+"""
+Random-soup census for the Game of Life.
+
+Runs many seeded "Random Soup" patterns until they settle, splits the ash
+into separate objects and counts each kind of object:
+
+    python game_of_life.py --census 2000 --workers 4
+
+A soup counts as settled once its population has been periodic for
+STABLE_WINDOW generations. The ash is then split into objects: 8-connected
+pieces that touch, or that change each other's births, at any point over
+MAX_OBJECT_PERIOD generations belong to one object, so a pulsar or a beacon
+is not split into the pieces it falls apart into in some phases. Each object
+is run on its own to find its period and motion, and hashed to a canonical
+form: the smallest normalised cell tuple over every phase and all eight
+rotations/reflections. Known forms are named (block, blinker, glider...);
+the rest get a code like "xs8_1a2b3c4d" (still life), "xp2_..." (oscillator)
+or "xq4_..." (spaceship). Objects that do not repeat on their own are
+counted as "unclassified".
+
+Soups are spread over a process pool in chunks, so the census doubles as a
+throughput benchmark for the unbounded engines.
+"""
+
+import hashlib
+import os
+import random
+import time
+from collections import Counter, defaultdict
+from multiprocessing import Pool
+
+from game_of_life import COLS, ROWS, random_soup
+from life_engines import SetEngine, make_engine
+from life_rules import CONWAY
+
+CENSUS_ENGINES = ("set", "dense", "tiled", "hashlife")  # gliders must fly off freely
+MAX_SOUP_GENS = 20000
+MAX_OBJECT_PERIOD = 30
+STABLE_WINDOW = 8 * MAX_OBJECT_PERIOD
+CHECK_EVERY = 30
+
+# Seed phases of named objects; their canonical forms are computed at import.
+NAMED_OBJECTS = {
+    "block": [(0, 0), (0, 1), (1, 0), (1, 1)],
+    "beehive": [(0, 1), (0, 2), (1, 0), (1, 3), (2, 1), (2, 2)],
+    "loaf": [(0, 1), (0, 2), (1, 0), (1, 3), (2, 1), (2, 3), (3, 2)],
+    "boat": [(0, 0), (0, 1), (1, 0), (1, 2), (2, 1)],
+    "ship": [(0, 0), (0, 1), (1, 0), (1, 2), (2, 1), (2, 2)],
+    "tub": [(0, 1), (1, 0), (1, 2), (2, 1)],
+    "pond": [(0, 1), (0, 2), (1, 0), (1, 3), (2, 0), (2, 3), (3, 1), (3, 2)],
+    "long boat": [(0, 0), (0, 1), (1, 0), (1, 2), (2, 1), (2, 3), (3, 2)],
+    "barge": [(0, 1), (1, 0), (1, 2), (2, 1), (2, 3), (3, 2)],
+    "mango": [(0, 1), (0, 2), (1, 0), (1, 3), (2, 1), (2, 4), (3, 2), (3, 3)],
+    "eater": [(0, 0), (0, 1), (1, 0), (1, 2), (2, 2), (3, 2), (3, 3)],
+    "blinker": [(0, 0), (0, 1), (0, 2)],
+    "toad": [(0, 1), (0, 2), (0, 3), (1, 0), (1, 1), (1, 2)],
+    "beacon": [(0, 0), (0, 1), (1, 0), (2, 3), (3, 2), (3, 3)],
+    "pulsar": [
+        (r, c) for r0, c0 in ((0, 2), (0, 8), (12, 2), (12, 8))
+        for r, c in ((r0, c0), (r0, c0 + 1), (r0, c0 + 2))
+    ] + [
+        (r, c) for r0, c0 in ((2, 0), (2, 5), (2, 7), (2, 12), (8, 0), (8, 5), (8, 7), (8, 12))
+        for r, c in ((r0, c0), (r0 + 1, c0), (r0 + 2, c0))
+    ] + [
+        (r, c) for r0, c0 in ((5, 2), (5, 8), (7, 2), (7, 8))
+        for r, c in ((r0, c0), (r0, c0 + 1), (r0, c0 + 2))
+    ],
+    "glider": [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)],
+    "LWSS": [(0, 1), (0, 4), (1, 0), (2, 0), (2, 4), (3, 0), (3, 1), (3, 2), (3, 3)],
+}
+
+
+# ── Objects ──
+
+def components(cells):
+    """Split cells into 8-connected components."""
+    unseen = set(cells)
+    while unseen:
+        start = unseen.pop()
+        group = [start]
+        stack = [start]
+        while stack:
+            r, c = stack.pop()
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    neighbour = (r + dr, c + dc)
+                    if neighbour in unseen:
+                        unseen.remove(neighbour)
+                        group.append(neighbour)
+                        stack.append(neighbour)
+        yield group
+
+
+def split_objects(cells, rule=CONWAY, generations=MAX_OBJECT_PERIOD):
+    """Group cells into objects that interact within `generations` steps.
+
+    In every generation each 8-connected piece is joined to the pieces its
+    cells touch in the previous generation, and to the pieces sharing a dead
+    neighbour that one of them alone would bring to life. Each object is the
+    set of starting cells in one joined group, so a pulsar or a beacon stays
+    whole in the phases where it falls apart into separate pieces.
+    """
+    engine = SetEngine()
+    engine.set_rule(rule)
+    engine.load(cells)
+    lookup = rule.lookup
+    parent = {}
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def join(a, b):
+        parent[find(a)] = find(b)
+
+    previous = None
+    current = set(cells)
+    for t in range(generations + 1):
+        if t:
+            engine.step()
+            previous, current = current, engine.cells()
+        for piece in components(current):
+            for cell in piece:
+                parent[(t, cell)] = (t, piece[0])
+
+        # A dead cell whose birth one piece would cause and another suppresses.
+        counts = defaultdict(Counter)
+        for r, c in current:
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    neighbour = (r + dr, c + dc)
+                    if neighbour not in current:
+                        counts[neighbour][parent[(t, (r, c))]] += 1
+        for pieces in counts.values():
+            if len(pieces) > 1 and not lookup[sum(pieces.values())]:
+                if any(lookup[count] for count in pieces.values()):
+                    first, *rest = pieces
+                    for piece in rest:
+                        join(piece, first)
+
+        if previous is not None:
+            for r, c in current:
+                for dr in (-1, 0, 1):
+                    for dc in (-1, 0, 1):
+                        neighbour = (r + dr, c + dc)
+                        if neighbour in previous:
+                            join((t, (r, c)), (t - 1, neighbour))
+
+    groups = defaultdict(list)
+    for cell in cells:
+        groups[find((0, cell))].append(cell)
+    return list(groups.values())
+
+
+# ── Canonical forms ──
+
+_SYMMETRIES = (
+    lambda r, c: (r, c), lambda r, c: (r, -c), lambda r, c: (-r, c), lambda r, c: (-r, -c),
+    lambda r, c: (c, r), lambda r, c: (c, -r), lambda r, c: (-c, r), lambda r, c: (-c, -r),
+)
+
+
+def _normalised(cells):
+    top = min(r for r, _ in cells)
+    left = min(c for _, c in cells)
+    return tuple(sorted((r - top, c - left) for r, c in cells))
+
+
+def canonical(phases):
+    """Smallest normalised form over all phases, rotations and reflections."""
+    return min(
+        _normalised([transform(r, c) for r, c in phase])
+        for phase in phases for transform in _SYMMETRIES
+    )
+
+
+def object_phases(cells, rule=CONWAY, max_period=MAX_OBJECT_PERIOD):
+    """Run an object alone; return (phases, moves) or None if it never repeats."""
+    engine = SetEngine()
+    engine.set_rule(rule)
+    engine.load(cells)
+    start = _normalised(cells)
+    phases = [list(cells)]
+    for _ in range(max_period):
+        engine.step()
+        current = engine.cells()
+        if not current:
+            return None
+        if _normalised(current) == start:
+            moves = min(current) != min(cells)
+            return phases, moves
+        phases.append(list(current))
+    return None
+
+
+def object_code(cells, rule=CONWAY):
+    """Classify one object by its canonical form."""
+    result = object_phases(cells, rule)
+    if result is None:
+        return "unclassified"
+    phases, moves = result
+    form = canonical(phases)
+    if rule == CONWAY and form in KNOWN_FORMS:
+        return KNOWN_FORMS[form]
+    digest = hashlib.sha1(repr(form).encode()).hexdigest()[:8]
+    if moves:
+        return f"xq{len(phases)}_{digest}"
+    if len(phases) > 1:
+        return f"xp{len(phases)}_{digest}"
+    return f"xs{len(form)}_{digest}"
+
+
+KNOWN_FORMS = {canonical(object_phases(cells)[0]): name for name, cells in NAMED_OBJECTS.items()}
+
+
+# ── Soups ──
+
+def _population_period(history):
+    """Smallest period of the population over the last STABLE_WINDOW gens."""
+    window = history[-STABLE_WINDOW:]
+    for period in range(1, MAX_OBJECT_PERIOD + 1):
+        if all(window[i] == window[i + period] for i in range(len(window) - period)):
+            return period
+    return None
+
+
+def settle(engine, max_gens=MAX_SOUP_GENS):
+    """Step until the population is periodic; return generations run or None."""
+    history = [engine.population]
+    for gen in range(1, max_gens + 1):
+        engine.step()
+        history.append(engine.population)
+        if engine.population == 0:
+            return gen
+        if gen >= STABLE_WINDOW and gen % CHECK_EVERY == 0 and _population_period(history):
+            return gen
+    return None
+
+
+def classify_ash(cells, rule=CONWAY):
+    """Count the objects in a settled pattern by code."""
+    return Counter(object_code(group, rule) for group in split_objects(cells, rule))
+
+
+def census_soup(seed, engine_name="tiled", rule=CONWAY):
+    """Run one soup; return (Counter of objects, generations, settled)."""
+    engine = make_engine(engine_name, ROWS, COLS, rule)
+    engine.load(random_soup(random.Random(seed)))
+    gens = settle(engine)
+    if gens is None:
+        return Counter(), MAX_SOUP_GENS, False
+    return classify_ash(engine.cells(), rule), gens, True
+
+
+def _census_chunk(task):
+    seeds, engine_name, rule = task
+    objects = Counter()
+    gens = unsettled = 0
+    for seed in seeds:
+        soup_objects, soup_gens, settled = census_soup(seed, engine_name, rule)
+        objects += soup_objects
+        gens += soup_gens
+        unsettled += not settled
+    return objects, gens, unsettled
+
+
+def run_census(soups=1000, workers=None, engine="tiled", seed=0, rule=CONWAY):
+    """Run soups seed..seed+soups-1 over a process pool and print a table."""
+    if engine not in CENSUS_ENGINES:
+        raise SystemExit(f"The census needs an unbounded engine: {', '.join(CENSUS_ENGINES)}")
+    workers = workers or os.cpu_count() or 1
+    seeds = list(range(seed, seed + soups))
+    chunk = max(1, min(50, soups // (workers * 4)))
+    tasks = [(seeds[i:i + chunk], engine, rule) for i in range(0, soups, chunk)]
+
+    objects = Counter()
+    gens = unsettled = 0
+    start = time.perf_counter()
+    if workers == 1:
+        results = map(_census_chunk, tasks)
+        pool = None
+    else:
+        pool = Pool(workers)
+        results = pool.imap_unordered(_census_chunk, tasks)
+    try:
+        for chunk_objects, chunk_gens, chunk_unsettled in results:
+            objects += chunk_objects
+            gens += chunk_gens
+            unsettled += chunk_unsettled
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    elapsed = time.perf_counter() - start
+
+    total = sum(objects.values())
+    print(f"{'object':<24} {'count':>9} {'share':>8}")
+    for name, count in objects.most_common():
+        print(f"{name:<24} {count:>9} {count / total:>8.2%}")
+    rate = soups / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"{soups} soups ({rule.notation}, {engine}, {workers} workers) in {elapsed:.1f}s: "
+        f"{rate:.2f} soups/s, {gens / elapsed:,.0f} gens/s, "
+        f"{gens / soups:.0f} gens per soup, {unsettled} unsettled"
+    )
+    return {"objects": objects, "soups_per_sec": rate, "gens": gens, "unsettled": unsettled}
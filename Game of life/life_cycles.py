@@ -0,0 +1,96 @@
+"""
+Cycle and stabilisation detection for the Game of Life.
+
+CycleDetector keeps a bounded table of state hashes by generation. Hashes
+may be recorded every generation or only every few (the step worker runs
+in batches); a repeated hash means the pattern cycles with a period that
+divides the gap. find_cycle() then pins down the exact period, checks the
+cells themselves so a hash collision can never freeze the board, and
+returns one engine per phase so the UI can replay the cycle instead of
+computing it.
+"""
+
+from collections import OrderedDict
+
+HISTORY_SIZE = 1024       # hashes remembered before the oldest are dropped
+MAX_REPLAY_PERIOD = 128   # longer cycles keep being computed
+
+
+class CycleDetector:
+    def __init__(self, size=HISTORY_SIZE):
+        self.size = size
+        self.seen = OrderedDict()
+        self.enabled = True
+
+    def reset(self):
+        """Forget history after the universe is edited."""
+        self.seen.clear()
+        self.enabled = True
+
+    def give_up(self):
+        """Stop looking until the next reset (the cycle is too long to replay)."""
+        self.seen.clear()
+        self.enabled = False
+
+    def record(self, generation, state_hash):
+        """Remember a hash; return the earlier generation it was seen at, if any."""
+        if state_hash is None or not self.enabled:
+            return None
+        earlier = self.seen.get(state_hash)
+        if earlier is not None and earlier < generation:
+            return earlier
+        self.seen[state_hash] = generation
+        if len(self.seen) > self.size:
+            self.seen.popitem(last=False)
+        return None
+
+
+class Cycle:
+    """A detected cycle: ``phases[i]`` is the engine at generation start + i (mod period).
+
+    ``since`` is the earlier generation with the same state as ``detected``,
+    the generation whose hash repeated, so the pattern is periodic from
+    ``since`` on. Hashes are only sampled, so it may have settled earlier.
+    """
+
+    def __init__(self, start, phases, since, detected):
+        self.start = start
+        self.phases = phases
+        self.since = since
+        self.detected = detected
+
+    @property
+    def period(self):
+        return len(self.phases)
+
+    def phase_at(self, generation):
+        return self.phases[(generation - self.start) % self.period]
+
+
+def find_cycle(engine, generation, since, make_engine, max_period=MAX_REPLAY_PERIOD, start=None):
+    """Step a copy of ``engine`` to find its period.
+
+    The state at ``generation`` was also seen at ``since``, so the period
+    divides the gap between them. ``start`` is the generation ``engine`` is
+    actually at, if it has moved on since the hash was recorded (the step
+    worker keeps going until it is stopped); it defaults to ``generation``.
+
+    ``make_engine()`` builds an empty engine of the same kind for each
+    phase. Returns a Cycle whose first phase is the current state, or None
+    if the state does not recur within max_period generations.
+    """
+    if start is None:
+        start = generation
+    start_hash = engine.state_hash()
+    start_cells = engine.cells()
+    phases = [engine]
+    probe = make_engine()
+    probe.load(start_cells)
+    for _ in range(min(generation - since, max_period)):
+        probe.step()
+        if probe.state_hash() == start_hash and probe.cells() == start_cells:
+            return Cycle(start, phases, since, generation)
+        phase = make_engine()
+        phase.load(probe.cells())
+        phases.append(phase)
+    return None
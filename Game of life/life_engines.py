@@ -0,0 +1,846 @@
+"""
+Stepping engines for Conway's Game of Life.
+
+Every engine stores the universe its own way but speaks the LifeEngine
+protocol below, so the pygame front end can swap them at runtime and the
+headless benchmark (life_bench.py) can drive them without a display.
+
+The set of (row, col) tuples is the common import/export format. The
+Hashlife engine lives in hashlife.py and is registered here with the rest.
+"""
+
+from typing import Iterable, Iterator, Optional, Protocol, Set, Tuple
+
+import numpy as np
+
+from hashlife import HashlifeEngine
+from life_rules import CONWAY
+
+Cell = Tuple[int, int]
+
+
+class LifeEngine(Protocol):
+    """What the UI and the benchmark need from a stepping engine."""
+
+    name: str
+
+    def load(self, cells: Iterable[Cell]) -> None:
+        """Replace the universe with the given live cells."""
+
+    def cells(self) -> Set[Cell]:
+        """Export the universe as a set of live cells."""
+
+    def live_cells(self) -> Iterator[Cell]:
+        """Iterate every live cell."""
+
+    def cells_in_view(self, top: int, left: int, bottom: int, right: int) -> Iterator[Cell]:
+        """Iterate live cells with top <= row < bottom and left <= col < right."""
+
+    def density_in_view(self, top: int, left: int, bottom: int, right: int,
+                        block: int) -> np.ndarray:
+        """Count live cells per block x block square of the view (see bin_cells)."""
+
+    def step(self, n: int = 1) -> None:
+        """Advance n generations."""
+
+    @property
+    def population(self) -> int:
+        """Number of live cells."""
+
+    def state_hash(self) -> Optional[int]:
+        """Zobrist hash of the live cells (see zobrist_xor), or None if unsupported."""
+
+    def set_rule(self, rule) -> None:
+        """Step with a life_rules.Rule from now on (Conway's B3/S23 by default)."""
+
+    def clear(self) -> None: ...
+
+    def add_cells(self, cells: Iterable[Cell]) -> None: ...
+
+    def is_alive(self, r: int, c: int) -> bool: ...
+
+    def set_cell(self, r: int, c: int, alive: bool) -> None: ...
+
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def zobrist_xor(rows, cols):
+    """XOR of the 64-bit Zobrist keys of the given cells.
+
+    A cell's key is splitmix64 of its packed coordinates, so the plane needs
+    no key table. XOR-ing the keys of the cells that flip each generation
+    keeps a whole-universe hash up to date incrementally.
+    """
+    rows = np.asarray(rows, dtype=np.int64).astype(np.uint64)
+    cols = np.asarray(cols, dtype=np.int64).astype(np.uint64)
+    x = (rows << np.uint64(32)) ^ (cols & np.uint64(0xFFFFFFFF))
+    x = x + _GOLDEN
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    x = x ^ (x >> np.uint64(31))
+    return int(np.bitwise_xor.reduce(x, initial=np.uint64(0)))
+
+
+def _cells_xor(cells):
+    cells = list(cells)
+    if not cells:
+        return 0
+    rc = np.array(cells, dtype=np.int64)
+    return zobrist_xor(rc[:, 0], rc[:, 1])
+
+
+def bin_shape(top, left, bottom, right, block):
+    return -(-(bottom - top) // block), -(-(right - left) // block)
+
+
+def bin_cells(cells, top, left, bottom, right, block):
+    """Count cells per block x block bin of a view; bin (0, 0) starts at top, left.
+
+    Cells outside the view must already have been filtered out.
+    """
+    counts = np.zeros(bin_shape(top, left, bottom, right, block), dtype=np.int32)
+    cells = list(cells)
+    if cells:
+        rc = np.array(cells, dtype=np.int64)
+        np.add.at(counts, ((rc[:, 0] - top) // block, (rc[:, 1] - left) // block), 1)
+    return counts
+
+
+def bin_board(board, origin, top, left, bottom, right, block):
+    """bin_cells for a 0/1 array whose [0, 0] is the world cell ``origin``."""
+    rows, cols = bin_shape(top, left, bottom, right, block)
+    view = np.zeros((rows * block, cols * block), dtype=np.int32)
+    r0, c0 = origin
+    h, w = board.shape
+    i0, i1 = max(0, top - r0), min(h, bottom - r0)
+    j0, j1 = max(0, left - c0), min(w, right - c0)
+    if i0 < i1 and j0 < j1:
+        view[i0 + r0 - top:i1 + r0 - top, j0 + c0 - left:j1 + c0 - left] = board[i0:i1, j0:j1]
+    if block == 1:
+        return view
+    return view.reshape(rows, block, cols, block).sum(axis=(1, 3))
+
+
+def board_cells_in_view(board, origin, top, left, bottom, right):
+    """cells_in_view for a 0/1 array whose [0, 0] is the world cell ``origin``."""
+    r0, c0 = origin
+    h, w = board.shape
+    i0, i1 = max(0, top - r0), min(h, bottom - r0)
+    j0, j1 = max(0, left - c0), min(w, right - c0)
+    if i0 >= i1 or j0 >= j1:
+        return iter(())
+    rs, cs = np.nonzero(board[i0:i1, j0:j1])
+    return zip((rs + i0 + r0).tolist(), (cs + j0 + c0).tolist())
+
+
+class ChunkIndex:
+    """Live cells bucketed into CHUNK x CHUNK squares.
+
+    Viewport queries only visit the chunks that overlap the view instead of
+    every live cell on the plane.
+    """
+
+    CHUNK = 32
+
+    def __init__(self, cells=()):
+        self.chunks = {}
+        for cell in cells:
+            self.add(cell)
+
+    def add(self, cell):
+        key = (cell[0] // self.CHUNK, cell[1] // self.CHUNK)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            self.chunks[key] = chunk = set()
+        chunk.add(cell)
+
+    def discard(self, cell):
+        key = (cell[0] // self.CHUNK, cell[1] // self.CHUNK)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            chunk.discard(cell)
+            if not chunk:
+                del self.chunks[key]
+
+    def cells_in_view(self, top, left, bottom, right):
+        n = self.CHUNK
+        cr0, cr1 = top // n, (bottom - 1) // n
+        cc0, cc1 = left // n, (right - 1) // n
+        if (cr1 - cr0 + 1) * (cc1 - cc0 + 1) <= len(self.chunks):
+            keys = [(cr, cc) for cr in range(cr0, cr1 + 1) for cc in range(cc0, cc1 + 1)]
+            found = ((key, self.chunks.get(key)) for key in keys)
+        else:
+            found = (
+                (key, chunk) for key, chunk in self.chunks.items()
+                if cr0 <= key[0] <= cr1 and cc0 <= key[1] <= cc1
+            )
+        for (cr, cc), chunk in found:
+            if not chunk:
+                continue
+            if top <= cr * n and (cr + 1) * n <= bottom and left <= cc * n and (cc + 1) * n <= right:
+                yield from chunk
+            else:
+                for r, c in chunk:
+                    if top <= r < bottom and left <= c < right:
+                        yield (r, c)
+
+
+class SetEngine:
+    """Sparse engine: a set of live (row, col) tuples on an unbounded plane.
+
+    A ChunkIndex over the set is built on the first viewport query and kept
+    up to date by edits and by each step's births and deaths, so drawing
+    never scans the plane.
+    """
+
+    name = "set"
+
+    def __init__(self, rows=90, cols=80):
+        # The plane is unbounded, so the viewport size is not needed.
+        self.grid = set()
+        self._index = None
+        self._hash = 0
+        self.rule = CONWAY
+
+    def set_rule(self, rule):
+        self.rule = rule
+
+    def _chunks(self):
+        if self._index is None:
+            self._index = ChunkIndex(self.grid)
+        return self._index
+
+    # ── Import / export ──
+
+    def load(self, cells):
+        self.grid = set(cells)
+        self._index = None
+        self._hash = _cells_xor(self.grid)
+
+    def cells(self):
+        return set(self.grid)
+
+    def live_cells(self):
+        return iter(self.grid)
+
+    def cells_in_view(self, top, left, bottom, right):
+        return self._chunks().cells_in_view(top, left, bottom, right)
+
+    def density_in_view(self, top, left, bottom, right, block):
+        return bin_cells(self.cells_in_view(top, left, bottom, right), top, left, bottom, right, block)
+
+    # ── Editing ──
+
+    def clear(self):
+        self.grid.clear()
+        self._index = None
+        self._hash = 0
+
+    def add_cells(self, cells):
+        new = set(cells) - self.grid
+        self.grid.update(new)
+        self._hash ^= _cells_xor(new)
+        if self._index is not None:
+            for cell in new:
+                self._index.add(cell)
+
+    def is_alive(self, r, c):
+        return (r, c) in self.grid
+
+    def set_cell(self, r, c, alive):
+        if alive == ((r, c) in self.grid):
+            return
+        self._hash ^= zobrist_xor([r], [c])
+        if alive:
+            self.grid.add((r, c))
+            if self._index is not None:
+                self._index.add((r, c))
+        else:
+            self.grid.discard((r, c))
+            if self._index is not None:
+                self._index.discard((r, c))
+
+    @property
+    def population(self):
+        return len(self.grid)
+
+    def state_hash(self):
+        return self._hash
+
+    # ── Simulation ──
+
+    def get_neighbors(self, r, c):
+        count = 0
+        for dr in [-1, 0, 1]:
+            for dc in [-1, 0, 1]:
+                if dr == 0 and dc == 0:
+                    continue
+                if (r + dr, c + dc) in self.grid:
+                    count += 1
+        return count
+
+    def step(self, n=1):
+        for _ in range(n):
+            new_grid = set()
+            candidates = set()
+
+            for (r, c) in self.grid:
+                candidates.add((r, c))
+                for dr in [-1, 0, 1]:
+                    for dc in [-1, 0, 1]:
+                        if dr == 0 and dc == 0:
+                            continue
+                        candidates.add((r + dr, c + dc))
+
+            lookup = self.rule.lookup
+            for (r, c) in candidates:
+                neigh = self.get_neighbors(r, c)
+                alive = (r, c) in self.grid
+                if lookup[alive * 9 + neigh]:
+                    new_grid.add((r, c))
+
+            changed = self.grid ^ new_grid
+            self._hash ^= _cells_xor(changed)
+            if self._index is not None:
+                for cell in changed:
+                    if cell in new_grid:
+                        self._index.add(cell)
+                    else:
+                        self._index.discard(cell)
+            self.grid = new_grid
+
+
+class DenseEngine:
+    """NumPy engine: a uint8 board stepped with vectorized neighbour sums.
+
+    The board is a window onto the unbounded plane. ``origin`` is the world
+    (row, col) of ``board[0, 0]``, and the window is re-fitted whenever live
+    cells come within ``EDGE`` cells of its border, so generations match the
+    set engine exactly no matter how far a pattern travels.
+    """
+
+    name = "dense"
+    EDGE = 2          # live cells must stay this far inside the board
+    MIN_MARGIN = 16   # dead cells kept around the pattern when re-fitting
+
+    def __init__(self, rows=90, cols=80):
+        self.rows = rows
+        self.cols = cols
+        self.origin = (0, 0)
+        self.board = self._new_board(rows, cols)
+        self._population = 0
+        self._hash = 0
+        self.rule = CONWAY
+
+    def set_rule(self, rule):
+        self.rule = rule
+
+    def _new_board(self, h, w):
+        return np.zeros((h, w), dtype=np.uint8)
+
+    # ── Import / export ──
+
+    def load(self, cells):
+        self.origin = (0, 0)
+        self.board = self._new_board(self.rows, self.cols)
+        self._population = 0
+        self._hash = 0
+        self.add_cells(cells)
+
+    def cells(self):
+        return set(self.live_cells())
+
+    def live_cells(self):
+        rs, cs = np.nonzero(self.board)
+        r0, c0 = self.origin
+        return zip((rs + r0).tolist(), (cs + c0).tolist())
+
+    def cells_in_view(self, top, left, bottom, right):
+        return board_cells_in_view(self.board, self.origin, top, left, bottom, right)
+
+    def density_in_view(self, top, left, bottom, right, block):
+        return bin_board(self.board, self.origin, top, left, bottom, right, block)
+
+    # ── Editing ──
+
+    def clear(self):
+        self.load(())
+
+    def add_cells(self, cells):
+        cells = list(cells)
+        if not cells:
+            return
+        rs = np.fromiter((r for r, _ in cells), dtype=np.int64, count=len(cells))
+        cs = np.fromiter((c for _, c in cells), dtype=np.int64, count=len(cells))
+        self._ensure_contains(int(rs.min()), int(cs.min()), int(rs.max()), int(cs.max()))
+        r0, c0 = self.origin
+        rs, cs = np.unique(np.stack([rs, cs]), axis=1)
+        born = self.board[rs - r0, cs - c0] == 0
+        self._hash ^= zobrist_xor(rs[born], cs[born])
+        self.board[rs - r0, cs - c0] = 1
+        self._population = int(np.count_nonzero(self.board))
+
+    def is_alive(self, r, c):
+        r0, c0 = self.origin
+        br, bc = r - r0, c - c0
+        if 0 <= br < self.board.shape[0] and 0 <= bc < self.board.shape[1]:
+            return bool(self.board[br, bc])
+        return False
+
+    def set_cell(self, r, c, alive):
+        if alive:
+            self.add_cells([(r, c)])
+        elif self.is_alive(r, c):
+            r0, c0 = self.origin
+            self.board[r - r0, c - c0] = 0
+            self._population -= 1
+            self._hash ^= zobrist_xor([r], [c])
+
+    @property
+    def population(self):
+        return self._population
+
+    def state_hash(self):
+        return self._hash
+
+    # ── Board window ──
+
+    def _touches_edge(self):
+        b, e = self.board, self.EDGE
+        return b[:e].any() or b[-e:].any() or b[:, :e].any() or b[:, -e:].any()
+
+    def _ensure_contains(self, top, left, bottom, right):
+        """Grow the window so world cells top..bottom, left..right fit inside."""
+        r0, c0 = self.origin
+        h, w = self.board.shape
+        e = self.EDGE
+        if top - e >= r0 and left - e >= c0 and bottom + e < r0 + h and right + e < c0 + w:
+            return
+        if self._population:
+            rs, cs = np.nonzero(self.board)
+            top = min(top, int(rs.min()) + r0)
+            left = min(left, int(cs.min()) + c0)
+            bottom = max(bottom, int(rs.max()) + r0)
+            right = max(right, int(cs.max()) + c0)
+        self._refit(top, left, bottom, right)
+
+    def _refit(self, top, left, bottom, right):
+        """Re-allocate the board around a live bounding box plus margin."""
+        margin_r = max(self.MIN_MARGIN, (bottom - top + 1) // 2)
+        margin_c = max(self.MIN_MARGIN, (right - left + 1) // 2)
+        new_r0 = top - margin_r
+        new_c0 = left - margin_c
+        new_h = max(self.rows, bottom - top + 1 + 2 * margin_r)
+        new_w = max(self.cols, right - left + 1 + 2 * margin_c)
+        self._reallocate(new_r0, new_c0, new_h, new_w)
+
+    def _reallocate(self, new_r0, new_c0, new_h, new_w):
+        """Move the live cells onto a fresh board with the given bounds."""
+        board = self._new_board(new_h, new_w)
+        rs, cs = np.nonzero(self.board)
+        r0, c0 = self.origin
+        board[rs + r0 - new_r0, cs + c0 - new_c0] = 1
+        self.board = board
+        self.origin = (new_r0, new_c0)
+
+    # ── Simulation ──
+
+    def step(self, n=1):
+        for _ in range(n):
+            if self._population == 0:
+                return
+            if self._touches_edge():
+                rs, cs = np.nonzero(self.board)
+                r0, c0 = self.origin
+                self._refit(int(rs.min()) + r0, int(cs.min()) + c0,
+                            int(rs.max()) + r0, int(cs.max()) + c0)
+            self._step_once()
+
+    def _step_once(self):
+        b = self.board
+        # Sum the eight neighbours of every interior cell. The outer ring is
+        # always dead (see EDGE), so it never needs computing itself.
+        neigh = (
+            b[:-2, :-2] + b[:-2, 1:-1] + b[:-2, 2:]
+            + b[1:-1, :-2] + b[1:-1, 2:]
+            + b[2:, :-2] + b[2:, 1:-1] + b[2:, 2:]
+        )
+        alive = b[1:-1, 1:-1]
+        new = np.zeros_like(b)
+        new[1:-1, 1:-1] = self.rule.table[alive * 9 + neigh]
+        rs, cs = np.nonzero(new != b)
+        self._hash ^= zobrist_xor(rs + self.origin[0], cs + self.origin[1])
+        self.board = new
+        self._population = int(np.count_nonzero(new))
+
+
+class TiledEngine(DenseEngine):
+    """Dense engine that only recomputes tiles whose neighbourhood changed.
+
+    The board is split into TILE x TILE tiles. A cell's next state depends
+    only on its 3x3 neighbourhood, so a tile can change this generation only
+    if it or one of its eight neighbour tiles changed last generation. All
+    active tiles are gathered and stepped in one batched NumPy pass; stable
+    tiles (still lifes, settled ash) cost nothing.
+
+    The board origin and size are kept on tile boundaries, so board tile
+    (i, j) is world tile (origin_row // TILE + i, origin_col // TILE + j).
+    Tiles changed since the last ``take_dirty_tiles`` call are remembered so
+    the renderer can skip stable tiles too.
+    """
+
+    name = "tiled"
+    TILE = 16
+
+    def __init__(self, rows=90, cols=80):
+        t = self.TILE
+        super().__init__(-(-rows // t) * t, -(-cols // t) * t)
+        self.active_tiles = 0
+
+    def set_rule(self, rule):
+        # Tiles that settled under the old rule may not be stable under
+        # the new one, so every tile is stepped again.
+        super().set_rule(rule)
+        self.changed[:] = True
+        self._dirty[:] = True
+
+    def _new_board(self, h, w):
+        # A permanent one-cell dead frame lets every tile read its halo
+        # through the same sliding-window view, edge tiles included.
+        self._frame = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        self._reset_tiles(h // self.TILE, w // self.TILE)
+        return self._frame[1:-1, 1:-1]
+
+    def _reset_tiles(self, th, tw):
+        self.changed = np.ones((th, tw), dtype=bool)
+        self._dirty = np.zeros((th, tw), dtype=bool)
+        self._dirty_all = True
+
+    def _reallocate(self, new_r0, new_c0, new_h, new_w):
+        t = self.TILE
+        top, left = new_r0 - new_r0 % t, new_c0 - new_c0 % t
+        new_h = -(-(new_r0 + new_h - top) // t) * t
+        new_w = -(-(new_c0 + new_w - left) // t) * t
+        super()._reallocate(top, left, new_h, new_w)
+
+    # ── Editing ──
+
+    def _mark(self, cells):
+        r0, c0 = self.origin
+        t = self.TILE
+        for r, c in cells:
+            self.changed[(r - r0) // t, (c - c0) // t] = True
+            self._dirty[(r - r0) // t, (c - c0) // t] = True
+
+    def add_cells(self, cells):
+        cells = list(cells)
+        super().add_cells(cells)
+        self._mark(cells)
+
+    def set_cell(self, r, c, alive):
+        if self.is_alive(r, c) == alive:
+            return
+        super().set_cell(r, c, alive)
+        self._mark([(r, c)])
+
+    # ── Rendering support ──
+
+    def take_dirty_tiles(self):
+        """Return world tiles changed since the last call, or None for all."""
+        if self._dirty_all:
+            self._dirty_all = False
+            self._dirty[:] = False
+            return None
+        ti, tj = np.nonzero(self._dirty)
+        self._dirty[:] = False
+        base_r, base_c = self.origin[0] // self.TILE, self.origin[1] // self.TILE
+        return list(zip((ti + base_r).tolist(), (tj + base_c).tolist()))
+
+    def tile_cells(self, tile_r, tile_c):
+        """Iterate the live world cells inside one world tile."""
+        t = self.TILE
+        return self.cells_in_view(tile_r * t, tile_c * t, (tile_r + 1) * t, (tile_c + 1) * t)
+
+    # ── Simulation ──
+
+    def _step_once(self):
+        t = self.TILE
+        th, tw = self.changed.shape
+
+        # Dilate last generation's changes by one tile in every direction.
+        grown = np.zeros((th + 2, tw + 2), dtype=bool)
+        for dr in range(3):
+            for dc in range(3):
+                grown[dr:dr + th, dc:dc + tw] |= self.changed
+        active = grown[1:-1, 1:-1]
+        ti, tj = np.nonzero(active)
+        self.active_tiles = len(ti)
+        changed = np.zeros_like(self.changed)
+        if not len(ti):
+            self.changed = changed
+            return
+
+        # (n, t+2, t+2) copies of every active tile plus its one-cell halo.
+        windows = np.lib.stride_tricks.sliding_window_view(self._frame, (t + 2, t + 2))
+        w = windows[ti * t, tj * t]
+        neigh = (
+            w[:, :-2, :-2] + w[:, :-2, 1:-1] + w[:, :-2, 2:]
+            + w[:, 1:-1, :-2] + w[:, 1:-1, 2:]
+            + w[:, 2:, :-2] + w[:, 2:, 1:-1] + w[:, 2:, 2:]
+        )
+        alive = w[:, 1:-1, 1:-1]
+        new = self.rule.table[alive * 9 + neigh]
+        flips = new != alive
+        flipped = flips.reshape(len(ti), -1).any(axis=1)
+        k, i, j = np.nonzero(flips)
+        self._hash ^= zobrist_xor(self.origin[0] + ti[k] * t + i, self.origin[1] + tj[k] * t + j)
+
+        # The windows are copies, so the board can be updated in place.
+        tiles = self.board.reshape(th, t, tw, t).transpose(0, 2, 1, 3)
+        tiles[ti[flipped], tj[flipped]] = new[flipped]
+        self._population += int(new.sum()) - int(alive.sum())
+        changed[ti[flipped], tj[flipped]] = True
+        self.changed = changed
+        self._dirty |= changed
+
+
+class PackedEngine:
+    """Bit-packed engine: each board row is stored as 64-bit words.
+
+    Bit ``i`` of word ``w`` in a row is column ``w * 64 + i``. Neighbour
+    counts are built with bitwise full adders, 64 cells per operation, and
+    the board takes one bit per cell instead of a byte. The board is fixed
+    at rows x cols; cells beyond a dead edge are always off, so generations
+    match the set engine for as long as the pattern stays on the board.
+    """
+
+    name = "packed"
+    boundary = "dead"
+    WORD = 64
+
+    def __init__(self, rows=90, cols=80):
+        self.rows = rows
+        self.cols = cols
+        self.nwords = (cols + self.WORD - 1) // self.WORD
+        self.words = np.zeros((rows, self.nwords), dtype=np.uint64)
+        # Bits past the last column in the final word must stay clear.
+        tail = cols - (self.nwords - 1) * self.WORD
+        self._tail_mask = np.uint64((1 << tail) - 1)
+        self._last_bit = tail - 1
+        self._population = 0
+        self._hash = 0
+        self.set_rule(CONWAY)
+
+    def set_rule(self, rule):
+        """Compile the rule into which 4-bit neighbour counts give life."""
+        self.rule = rule
+        self._birth = sorted(rule.birth)
+        self._survive = sorted(rule.survive)
+
+    # ── Packing ──
+
+    def _pack(self, dense):
+        padded = np.zeros((self.rows, self.nwords * self.WORD), dtype=np.uint8)
+        padded[:, :self.cols] = dense
+        packed = np.packbits(padded, axis=1, bitorder="little")
+        return packed.view("<u8").astype(np.uint64)
+
+    def _unpack(self):
+        as_bytes = self.words.astype("<u8").view(np.uint8)
+        return np.unpackbits(as_bytes, axis=1, bitorder="little")[:, :self.cols]
+
+    def _count(self):
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    def _wrap(self, r, c):
+        """Map a world cell onto the board, or None if it falls off."""
+        if self.boundary == "torus":
+            return r % self.rows, c % self.cols
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            return r, c
+        return None
+
+    # ── Import / export ──
+
+    def load(self, cells):
+        self.words = np.zeros((self.rows, self.nwords), dtype=np.uint64)
+        self._population = 0
+        self._hash = 0
+        self.add_cells(cells)
+
+    def cells(self):
+        return set(self.live_cells())
+
+    def live_cells(self):
+        rs, cs = np.nonzero(self._unpack())
+        return zip(rs.tolist(), cs.tolist())
+
+    def cells_in_view(self, top, left, bottom, right):
+        return board_cells_in_view(self._unpack(), (0, 0), top, left, bottom, right)
+
+    def density_in_view(self, top, left, bottom, right, block):
+        return bin_board(self._unpack(), (0, 0), top, left, bottom, right, block)
+
+    # ── Editing ──
+
+    def clear(self):
+        self.load(())
+
+    def add_cells(self, cells):
+        on_board = [p for p in (self._wrap(r, c) for r, c in cells) if p is not None]
+        if not on_board:
+            return
+        dense = self._unpack()
+        rs, cs = np.unique(np.array(on_board, dtype=np.int64), axis=0).T
+        born = dense[rs, cs] == 0
+        self._hash ^= zobrist_xor(rs[born], cs[born])
+        dense[rs, cs] = 1
+        self.words = self._pack(dense)
+        self._population = self._count()
+
+    def is_alive(self, r, c):
+        p = self._wrap(r, c)
+        if p is None:
+            return False
+        r, c = p
+        word = int(self.words[r, c // self.WORD])
+        return bool(word >> (c % self.WORD) & 1)
+
+    def set_cell(self, r, c, alive):
+        p = self._wrap(r, c)
+        if p is None or self.is_alive(*p) == alive:
+            return
+        r, c = p
+        self.words[r, c // self.WORD] ^= np.uint64(1 << (c % self.WORD))
+        self._population += 1 if alive else -1
+        self._hash ^= zobrist_xor([r], [c])
+
+    @property
+    def population(self):
+        return self._population
+
+    def state_hash(self):
+        return self._hash
+
+    # ── Simulation ──
+
+    def _west_east(self, x):
+        """Return (west, east): bit c holds the cell at column c-1 / c+1."""
+        one, top = np.uint64(1), np.uint64(self.WORD - 1)
+        west = x << one
+        west[:, 1:] |= x[:, :-1] >> top
+        east = x >> one
+        east[:, :-1] |= x[:, 1:] << top
+        if self.boundary == "torus":
+            last_word, last_bit = self.nwords - 1, np.uint64(self._last_bit)
+            west[:, 0] |= (x[:, last_word] >> last_bit) & one
+            east[:, last_word] |= (x[:, 0] & one) << last_bit
+        east[:, -1] &= self._tail_mask
+        west[:, -1] &= self._tail_mask
+        return west, east
+
+    def _north_south(self, x):
+        """Return (north, south): row r holds row r-1 / r+1."""
+        if self.boundary == "torus":
+            return np.roll(x, 1, axis=0), np.roll(x, -1, axis=0)
+        north = np.zeros_like(x)
+        north[1:] = x[:-1]
+        south = np.zeros_like(x)
+        south[:-1] = x[1:]
+        return north, south
+
+    def _step_once(self):
+        x = self.words
+        north, south = self._north_south(x)
+
+        # Each row triple as a 2-bit sum (ones, twos); the middle row leaves
+        # the cell itself out.
+        def row_sum(row):
+            w, e = self._west_east(row)
+            return w ^ row ^ e, (w & row) | (e & (w ^ row))
+
+        n0, n1 = row_sum(north)
+        s0, s1 = row_sum(south)
+        w, e = self._west_east(x)
+        m0, m1 = w ^ e, w & e
+
+        # Add the three 2-bit sums into a 4-bit count c3 c2 c1 c0.
+        a0 = n0 ^ s0
+        k = n0 & s0
+        a1 = n1 ^ s1 ^ k
+        a2 = (n1 & s1) | (k & (n1 ^ s1))
+        c0 = a0 ^ m0
+        k0 = a0 & m0
+        c1 = a1 ^ m1 ^ k0
+        k1 = (a1 & m1) | (k0 & (a1 ^ m1))
+        c2 = a2 ^ k1
+        c3 = a2 & k1
+
+        # Alive next: a birth count on a dead cell or a survival count on a
+        # live one. Each "count == k" is an AND of the four count bits.
+        bits = (c0, c1, c2, c3)
+        zero = np.zeros_like(x)
+
+        def equals(k):
+            eq = ~zero
+            for i, bit in enumerate(bits):
+                eq &= bit if k >> i & 1 else ~bit
+            return eq
+
+        born = zero.copy()
+        for k in self._birth:
+            born |= equals(k)
+        kept = zero.copy()
+        for k in self._survive:
+            kept |= equals(k)
+        new = (born & ~x) | (kept & x)
+        new[:, -1] &= self._tail_mask
+        diff = (new ^ x).astype("<u8").view(np.uint8)
+        rs, cs = np.nonzero(np.unpackbits(diff, axis=1, bitorder="little"))
+        self._hash ^= zobrist_xor(rs, cs)
+        self.words = new
+
+    def step(self, n=1):
+        for _ in range(n):
+            if self._population == 0:
+                return
+            self._step_once()
+            self._population = self._count()
+
+
+class TorusEngine(PackedEngine):
+    """Bit-packed engine whose edges wrap around to the opposite side."""
+
+    name = "torus"
+    boundary = "torus"
+
+
+def _parallel_engine(rows, cols):
+    # Imported on demand: life_parallel builds on the helpers in this module.
+    from life_parallel import ParallelEngine
+    return ParallelEngine(rows, cols)
+
+
+ENGINES = {
+    "set": SetEngine,
+    "dense": DenseEngine,
+    "tiled": TiledEngine,
+    "hashlife": HashlifeEngine,
+    "packed": PackedEngine,
+    "torus": TorusEngine,
+    "parallel": _parallel_engine,
+}
+ENGINE_NAMES = list(ENGINES)
+
+
+def make_engine(name, rows=90, cols=80, rule=None):
+    """Create an engine by name, sized for a rows x cols viewport."""
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine {name!r}; choose from {', '.join(ENGINE_NAMES)}")
+    engine = ENGINES[name](rows, cols)
+    if rule is not None:
+        engine.set_rule(rule)
+    return engine
@@ -0,0 +1,165 @@
+"""
+Rewind buffer for the Game of Life.
+
+History keeps recent generations so they can be scrubbed back and forth
+without recomputing them. Every KEYFRAME_INTERVAL frames the full set of
+live cells is stored; the frames in between only store the cells born and
+the cells that died since the previous frame. Cells are kept as (n, 2)
+int64 arrays, so a frame costs 16 bytes per changed cell.
+
+The buffer has a byte budget. When it is exceeded the oldest keyframe and
+the deltas that depend on it are dropped together.
+
+A frame is recorded per rendered frame, not per generation: at high speeds
+or after a jump one frame can span many generations.
+"""
+
+import numpy as np
+
+KEYFRAME_INTERVAL = 32      # frames between full snapshots
+HISTORY_BYTES = 64 << 20    # default memory budget for stored cells
+
+
+def _pack(cells):
+    return np.array(list(cells), dtype=np.int64).reshape(-1, 2)
+
+
+def _unpack(array):
+    return set(map(tuple, array.tolist()))
+
+
+class Frame:
+    """One recorded state: a keyframe of all cells, or a birth/death delta."""
+
+    __slots__ = ("generation", "keyframe", "born", "died")
+
+    def __init__(self, generation, keyframe=None, born=None, died=None):
+        self.generation = generation
+        self.keyframe = keyframe
+        self.born = born
+        self.died = died
+
+    @property
+    def nbytes(self):
+        if self.keyframe is not None:
+            return self.keyframe.nbytes
+        return self.born.nbytes + self.died.nbytes
+
+
+class History:
+    def __init__(self, keyframe_interval=KEYFRAME_INTERVAL, max_bytes=HISTORY_BYTES):
+        self.keyframe_interval = keyframe_interval
+        self.max_bytes = max_bytes
+        self.frames = []
+        self.nbytes = 0
+        self.cursor = -1          # index of the frame currently shown
+        self._cursor_cells = set()  # live cells at the cursor
+        self._since_keyframe = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def rewound(self):
+        """How many recorded frames lie ahead of the cursor."""
+        return len(self.frames) - 1 - self.cursor
+
+    def clear(self):
+        self.frames = []
+        self.nbytes = 0
+        self.cursor = -1
+        self._cursor_cells = set()
+        self._since_keyframe = 0
+
+    # ── Recording ──
+
+    def record(self, generation, cells):
+        """Append the state after the cursor, discarding any frames past it.
+
+        Returns False (and stores nothing) if nothing changed.
+        """
+        cells = set(cells)
+        if self.frames and self.frames[self.cursor].generation == generation \
+                and cells == self._cursor_cells:
+            return False
+        self._truncate()
+        born = cells - self._cursor_cells
+        died = self._cursor_cells - cells
+        if not self.frames or self._since_keyframe >= self.keyframe_interval \
+                or len(born) + len(died) >= len(cells):
+            frame = Frame(generation, keyframe=_pack(cells))
+            self._since_keyframe = 0
+        else:
+            frame = Frame(generation, born=_pack(born), died=_pack(died))
+            self._since_keyframe += 1
+        self.frames.append(frame)
+        self.nbytes += frame.nbytes
+        self.cursor = len(self.frames) - 1
+        self._cursor_cells = cells
+        self._evict()
+        return True
+
+    def _truncate(self):
+        while len(self.frames) - 1 > self.cursor:
+            self.nbytes -= self.frames.pop().nbytes
+        # Count the deltas since the newest remaining keyframe.
+        self._since_keyframe = 0
+        for frame in reversed(self.frames):
+            if frame.keyframe is not None:
+                break
+            self._since_keyframe += 1
+
+    def _evict(self):
+        """Drop the oldest keyframe and its deltas until under budget."""
+        while self.nbytes > self.max_bytes:
+            end = next(
+                (i for i in range(1, self.cursor + 1) if self.frames[i].keyframe is not None), None
+            )
+            if end is None:
+                return  # only the segment in use is left
+            for frame in self.frames[:end]:
+                self.nbytes -= frame.nbytes
+            del self.frames[:end]
+            self.cursor -= end
+
+    # ── Scrubbing ──
+
+    def step(self, frames):
+        """Move the cursor by up to ``frames`` (negative = back).
+
+        Returns (generation, cells) for the new position, or None if the
+        cursor could not move.
+        """
+        target = max(0, min(len(self.frames) - 1, self.cursor + frames))
+        if not self.frames or target == self.cursor:
+            return None
+        cells = self._cursor_cells
+        if abs(target - self.cursor) > self.keyframe_interval:
+            cells = self._rebuild(target)
+        elif target > self.cursor:
+            for frame in self.frames[self.cursor + 1:target + 1]:
+                cells = self._apply(cells, frame)
+        else:
+            for frame in reversed(self.frames[target + 1:self.cursor + 1]):
+                if frame.keyframe is not None:
+                    cells = self._rebuild(target)
+                    break
+                cells = (cells - _unpack(frame.born)) | _unpack(frame.died)
+        self.cursor = target
+        self._cursor_cells = cells
+        return self.frames[target].generation, set(cells)
+
+    def _rebuild(self, index):
+        start = index
+        while self.frames[start].keyframe is None:
+            start -= 1
+        cells = set()
+        for frame in self.frames[start:index + 1]:
+            cells = self._apply(cells, frame)
+        return cells
+
+    @staticmethod
+    def _apply(cells, frame):
+        if frame.keyframe is not None:
+            return _unpack(frame.keyframe)
+        return (cells - _unpack(frame.died)) | _unpack(frame.born)
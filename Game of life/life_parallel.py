@@ -0,0 +1,186 @@
+"""
+Multiprocess engine for very large dense Life boards.
+
+The board lives in two ``multiprocessing.shared_memory`` buffers, each with
+a one-cell dead frame. Every generation the rows are split into horizontal
+bands and a process pool steps them in parallel: a worker reads its band
+plus one halo row above and below straight out of the current buffer and
+writes the new band into the other one. The buffers then swap roles, so
+halo exchange is just reading a neighbour's rows and no full-board copy is
+ever made.
+
+Like the packed engine, the board is fixed at rows x cols with dead edges.
+"""
+
+import os
+import weakref
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from life_engines import _cells_xor, bin_board, board_cells_in_view, zobrist_xor
+from life_rules import CONWAY
+
+# Per-process view of the shared buffers, set up by _attach().
+_worker = {}
+
+
+def _attach(names, shape):
+    _worker["blocks"] = [SharedMemory(name=name) for name in names]
+    _worker["boards"] = [np.ndarray(shape, dtype=np.uint8, buffer=b.buf) for b in _worker["blocks"]]
+
+
+def _step_band(task):
+    """Step framed rows start..end of buffer ``src`` into the other buffer.
+
+    ``lookup`` is the rule's next-state table. Returns the band's new
+    population and the Zobrist XOR of its flips.
+    """
+    src, start, end, lookup = task
+    boards = _worker["boards"]
+    b = boards[src]
+    window = b[start - 1:end + 1]
+    neigh = (
+        window[:-2, :-2] + window[:-2, 1:-1] + window[:-2, 2:]
+        + window[1:-1, :-2] + window[1:-1, 2:]
+        + window[2:, :-2] + window[2:, 1:-1] + window[2:, 2:]
+    )
+    alive = window[1:-1, 1:-1]
+    new = np.frombuffer(lookup, dtype=np.uint8)[alive * 9 + neigh]
+    rs, cs = np.nonzero(new != alive)
+    boards[1 - src][start:end, 1:-1] = new
+    return int(np.count_nonzero(new)), zobrist_xor(rs + start - 1, cs)
+
+
+def _release(pool, blocks):
+    if pool is not None:
+        pool.terminate()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class ParallelEngine:
+    """Dense engine whose generations are computed by a pool of processes.
+
+    The pool is started on the first step, so engines that are only loaded
+    and drawn never spawn processes.
+    """
+
+    name = "parallel"
+
+    def __init__(self, rows=90, cols=80, workers=None):
+        self.rows = rows
+        self.cols = cols
+        self.workers = workers or os.cpu_count() or 1
+        shape = (rows + 2, cols + 2)
+        self._blocks = [SharedMemory(create=True, size=shape[0] * shape[1]) for _ in range(2)]
+        self._boards = [np.ndarray(shape, dtype=np.uint8, buffer=b.buf) for b in self._blocks]
+        for board in self._boards:
+            board[:] = 0
+        self._current = 0
+        self._pool = None
+        self._finalizer = weakref.finalize(self, _release, None, self._blocks)
+        self._population = 0
+        self._hash = 0
+        self.rule = CONWAY
+
+        edges = np.linspace(1, rows + 1, min(self.workers, rows) + 1).astype(int)
+        self._bands = list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+    @property
+    def board(self):
+        """The live rows x cols board, without its dead frame."""
+        return self._boards[self._current][1:-1, 1:-1]
+
+    def close(self):
+        """Stop the pool and free the shared buffers."""
+        self._finalizer()
+
+    def _start_pool(self):
+        names = [block.name for block in self._blocks]
+        self._pool = Pool(self.workers, initializer=_attach,
+                          initargs=(names, self._boards[0].shape))
+        self._finalizer.detach()
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._blocks)
+
+    # ── Import / export ──
+
+    def load(self, cells):
+        self.board[:] = 0
+        self._population = 0
+        self._hash = 0
+        self.add_cells(cells)
+
+    def load_array(self, board):
+        """Load a rows x cols 0/1 array directly (large boards)."""
+        self.board[:] = board != 0
+        rs, cs = np.nonzero(self.board)
+        self._population = len(rs)
+        self._hash = zobrist_xor(rs, cs)
+
+    def cells(self):
+        return set(self.live_cells())
+
+    def live_cells(self):
+        rs, cs = np.nonzero(self.board)
+        return zip(rs.tolist(), cs.tolist())
+
+    def cells_in_view(self, top, left, bottom, right):
+        return board_cells_in_view(self.board, (0, 0), top, left, bottom, right)
+
+    def density_in_view(self, top, left, bottom, right, block):
+        return bin_board(self.board, (0, 0), top, left, bottom, right, block)
+
+    # ── Editing ──
+
+    def clear(self):
+        self.load(())
+
+    def add_cells(self, cells):
+        on_board = {(r, c) for r, c in cells if 0 <= r < self.rows and 0 <= c < self.cols}
+        born = [(r, c) for r, c in on_board if not self.board[r, c]]
+        if not born:
+            return
+        rs, cs = np.array(born, dtype=np.int64).T
+        self.board[rs, cs] = 1
+        self._population += len(born)
+        self._hash ^= _cells_xor(born)
+
+    def is_alive(self, r, c):
+        return 0 <= r < self.rows and 0 <= c < self.cols and bool(self.board[r, c])
+
+    def set_cell(self, r, c, alive):
+        if not (0 <= r < self.rows and 0 <= c < self.cols) or self.is_alive(r, c) == alive:
+            return
+        self.board[r, c] = 1 if alive else 0
+        self._population += 1 if alive else -1
+        self._hash ^= zobrist_xor([r], [c])
+
+    @property
+    def population(self):
+        return self._population
+
+    def state_hash(self):
+        return self._hash
+
+    def set_rule(self, rule):
+        self.rule = rule
+
+    # ── Simulation ──
+
+    def step(self, n=1):
+        if self._pool is None and n > 0 and self._population:
+            self._start_pool()
+        for _ in range(n):
+            if self._population == 0:
+                return
+            lookup = self.rule.table.tobytes()
+            tasks = [(self._current, start, end, lookup) for start, end in self._bands]
+            population = 0
+            for band_population, band_hash in self._pool.map(_step_band, tasks):
+                population += band_population
+                self._hash ^= band_hash
+            self._population = population
+            self._current = 1 - self._current
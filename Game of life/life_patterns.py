@@ -0,0 +1,280 @@
+"""
+Pattern file import and export for the Game of Life.
+
+Readers take an open text stream and yield live (row, col) cells as they
+parse, so multi-megabyte patterns never have to be held as one string:
+
+    RLE         .rle        run-length encoded, read in fixed-size chunks
+    Life 1.06   .lif .life  one "x y" pair per line
+    Macrocell   .mc         Golly's quadtree format, one node per line
+
+Each reader accepts an optional ``info`` dict that it fills with header
+fields (name, rule) as they are read. write_rle() streams a set of cells
+back out as RLE. PatternDirectory indexes a folder of pattern files for the
+sidebar; files are only parsed when one is picked.
+"""
+
+import os
+import re
+from collections import OrderedDict
+
+READ_CHUNK = 1 << 16
+RLE_LINE_WIDTH = 70
+DEFAULT_RULE = "B3/S23"
+
+_RLE_TOKEN = re.compile(r"(\d*)([^\d\s])")
+_RLE_HEADER = re.compile(r"\s*x\s*=")
+
+
+# ── RLE ──
+
+def read_rle(stream, info=None, chunk_size=READ_CHUNK):
+    """Yield live cells from an RLE stream."""
+    info = {} if info is None else info
+    pending = ""
+    for line in iter(stream.readline, ""):
+        stripped = line.strip()
+        if stripped.startswith("#N"):
+            info["name"] = stripped[2:].strip()
+        elif stripped.startswith("#"):
+            continue
+        elif _RLE_HEADER.match(stripped):
+            for field in stripped.split(","):
+                key, _, value = field.partition("=")
+                if key.strip() == "rule":
+                    info["rule"] = value.strip()
+            break
+        elif stripped:
+            pending = line  # no header line: this is already pattern data
+            break
+
+    r = c = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        text = pending + chunk
+        pending = ""
+        if chunk:
+            # A run count may be cut off at the end of the chunk; keep it back.
+            end = len(text.rstrip("0123456789 \t\r\n"))
+            pending, text = text[end:], text[:end]
+        for match in _RLE_TOKEN.finditer(text):
+            count = int(match.group(1) or 1)
+            tag = match.group(2)
+            if tag in "b.":
+                c += count
+            elif tag == "$":
+                r += count
+                c = 0
+            elif tag == "!":
+                return
+            else:
+                for col in range(c, c + count):
+                    yield (r, col)
+                c += count
+        if not chunk:
+            return
+
+
+def write_rle(cells, stream, rule=DEFAULT_RULE, name=None):
+    """Write cells to ``stream`` as RLE, normalised to the top-left corner."""
+    cells = sorted(cells)
+    if cells:
+        top = cells[0][0]
+        left = min(c for _, c in cells)
+        height = cells[-1][0] - top + 1
+        width = max(c for _, c in cells) - left + 1
+    else:
+        top = left = height = width = 0
+
+    if name:
+        stream.write(f"#N {name}\n")
+    stream.write(f"x = {width}, y = {height}, rule = {rule}\n")
+
+    line = []
+    line_len = 0
+
+    def emit(count, tag):
+        nonlocal line_len
+        token = f"{count if count > 1 else ''}{tag}"
+        if line_len + len(token) > RLE_LINE_WIDTH:
+            stream.write("".join(line) + "\n")
+            line.clear()
+            line_len = 0
+        line.append(token)
+        line_len += len(token)
+
+    row, col = top, left
+    run = 0
+    for r, c in cells:
+        if r != row or c != col + run:
+            if run:
+                emit(run, "o")
+                col += run
+                run = 0
+            if r != row:
+                emit(r - row, "$")
+                row, col = r, left
+            if c != col:
+                emit(c - col, "b")
+                col = c
+        run += 1
+    if run:
+        emit(run, "o")
+    emit(1, "!")
+    stream.write("".join(line) + "\n")
+
+
+# ── Life 1.06 ──
+
+def read_life106(stream, info=None):
+    """Yield live cells from a Life 1.06 stream of "x y" lines."""
+    info = {} if info is None else info
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            if line.startswith("#Life") and "1.06" not in line:
+                raise ValueError(f"unsupported Life format: {line}")
+            if line.startswith("#N"):
+                info["name"] = line[2:].strip()
+            elif line.startswith("#R"):
+                info["rule"] = line[2:].strip()
+            continue
+        x, y = line.split()
+        yield (int(y), int(x))
+
+
+# ── Macrocell ──
+
+def read_macrocell(stream, info=None):
+    """Yield live cells from a macrocell stream.
+
+    Nodes are kept in their compact form while reading and only the root is
+    expanded, so repeated subtrees are parsed once.
+    """
+    info = {} if info is None else info
+    nodes = [None]  # node 0 is the empty node
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith("["):
+            continue
+        if line.startswith("#"):
+            if line.startswith("#R"):
+                info["rule"] = line[2:].strip()
+            elif line.startswith("#N"):
+                info["name"] = line[2:].strip()
+            continue
+        if line[0] in ".*$":
+            leaf = []
+            r = c = 0
+            for ch in line:
+                if ch == "$":
+                    r += 1
+                    c = 0
+                else:
+                    if ch == "*":
+                        leaf.append((r, c))
+                    c += 1
+            nodes.append((3, leaf))
+        else:
+            k, nw, ne, sw, se = (int(v) for v in line.split())
+            nodes.append((k, (nw, ne, sw, se)))
+    if len(nodes) == 1:
+        return
+
+    stack = [(len(nodes) - 1, 0, 0)]
+    while stack:
+        index, r, c = stack.pop()
+        if index == 0:
+            continue
+        k, children = nodes[index]
+        if isinstance(children, list):  # an 8x8 leaf
+            for lr, lc in children:
+                yield (r + lr, c + lc)
+            continue
+        half = 1 << (k - 1)
+        nw, ne, sw, se = children
+        stack.append((se, r + half, c + half))
+        stack.append((sw, r + half, c))
+        stack.append((ne, r, c + half))
+        stack.append((nw, r, c))
+
+
+# ── Files ──
+
+READERS = {
+    ".rle": read_rle,
+    ".lif": read_life106,
+    ".life": read_life106,
+    ".mc": read_macrocell,
+}
+
+
+def normalise(cells):
+    """Shift cells so the pattern's top-left corner is (0, 0)."""
+    cells = list(cells)
+    if not cells:
+        return cells
+    top = min(r for r, _ in cells)
+    left = min(c for _, c in cells)
+    return [(r - top, c - left) for r, c in cells]
+
+
+def load_pattern(path, info=None):
+    """Read a pattern file into a list of cells with its corner at (0, 0)."""
+    reader = READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"unknown pattern format: {path}")
+    with open(path, encoding="utf-8", errors="replace") as stream:
+        return normalise(reader(stream, info))
+
+
+def save_rle(path, cells, rule=DEFAULT_RULE, name=None):
+    with open(path, "w", encoding="utf-8") as stream:
+        write_rle(cells, stream, rule, name)
+
+
+class PatternDirectory:
+    """A folder of pattern files, listed on first use and parsed on demand.
+
+    Only file names are read until a pattern is picked. The most recently
+    loaded patterns are kept in a small LRU so browsing back and forth does
+    not re-parse large files.
+    """
+
+    CACHE_SIZE = 8
+
+    def __init__(self, path):
+        self.path = path
+        self._names = None
+        self._cache = OrderedDict()
+
+    def names(self):
+        if self._names is None:
+            try:
+                entries = os.listdir(self.path)
+            except OSError:
+                entries = []
+            self._names = sorted(
+                name for name in entries if os.path.splitext(name)[1].lower() in READERS
+            )
+        return self._names
+
+    def refresh(self):
+        self._names = None
+        self._cache.clear()
+
+    def __contains__(self, name):
+        return name in self.names()
+
+    def cells(self, name):
+        cells = self._cache.get(name)
+        if cells is None:
+            cells = load_pattern(os.path.join(self.path, name))
+            self._cache[name] = cells
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(name)
+        return cells
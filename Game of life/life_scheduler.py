@@ -0,0 +1,122 @@
+"""
+Simulation scheduling for the Game of Life front end.
+
+The window always renders at a steady frame rate. GenerationScheduler works
+out how many generations each frame owes for the chosen speed, and
+StepWorker runs the "uncapped" speed on a background thread, handing
+finished generations to the renderer as snapshots so drawing never holds
+the simulation back.
+"""
+
+import threading
+import time
+
+MAX_GENS_PER_FRAME = 64     # backlog beyond this is dropped, not chased
+WORKER_BATCH_SECONDS = 0.005
+RATE_WINDOW = 0.5           # seconds between gens/sec readings
+
+
+class GenerationScheduler:
+    """Converts a generations-per-second target into whole gens per frame."""
+
+    def __init__(self, max_per_frame=MAX_GENS_PER_FRAME):
+        self.max_per_frame = max_per_frame
+        self.pending = 0.0
+
+    def due(self, gens_per_sec, dt):
+        """Return how many generations to run for a frame lasting dt seconds."""
+        self.pending += gens_per_sec * dt
+        gens = int(self.pending)
+        self.pending -= gens
+        if gens > self.max_per_frame:
+            # Falling behind (slow engine or huge pattern): stay responsive
+            # rather than trying to catch up.
+            gens = self.max_per_frame
+            self.pending = 0.0
+        return gens
+
+    def reset(self):
+        self.pending = 0.0
+
+
+class RateMeter:
+    """Measures generations per second of wall-clock time."""
+
+    def __init__(self, window=RATE_WINDOW):
+        self.window = window
+        self.rate = 0.0
+        self._start = time.perf_counter()
+        self._start_gen = 0
+
+    def update(self, generation):
+        now = time.perf_counter()
+        elapsed = now - self._start
+        if elapsed >= self.window:
+            self.rate = max(0, generation - self._start_gen) / elapsed
+            self._start = now
+            self._start_gen = generation
+        return self.rate
+
+    def reset(self, generation):
+        self._start = time.perf_counter()
+        self._start_gen = generation
+        self.rate = 0.0
+
+
+class StepWorker:
+    """Steps an engine on a background thread as fast as it will go.
+
+    The worker owns the engine until stop() returns. Batches are sized to
+    take about WORKER_BATCH_SECONDS each. After a batch, if the renderer has
+    collected the previous snapshot, the worker calls ``capture(engine)``
+    and hands the result over for it to draw.
+    """
+
+    def __init__(self, engine, generation, capture):
+        self.engine = engine
+        self.generation = generation
+        self.population = engine.population
+        self.capture = capture
+        self._snapshot = None
+        self._wanted = threading.Event()
+        self._wanted.set()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="life-step-worker", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Stop stepping and wait for the current batch to finish."""
+        self._stopping.set()
+        self._thread.join()
+
+    def take_snapshot(self):
+        """Return (generation, population, frame, state_hash) if a new one is ready."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            self._snapshot = None
+            self._wanted.set()
+        return snapshot
+
+    def _run(self):
+        batch = 1
+        while not self._stopping.is_set():
+            if self.engine.population == 0:
+                time.sleep(WORKER_BATCH_SECONDS)
+            else:
+                start = time.perf_counter()
+                self.engine.step(batch)
+                elapsed = time.perf_counter() - start
+                self.generation += batch
+                self.population = self.engine.population
+
+                if elapsed < WORKER_BATCH_SECONDS / 2:
+                    batch *= 2
+                elif elapsed > WORKER_BATCH_SECONDS * 2 and batch > 1:
+                    batch //= 2
+
+            if self._wanted.is_set():
+                self._wanted.clear()
+                frame = self.capture(self.engine)
+                self._snapshot = (self.generation, self.population, frame, self.engine.state_hash())
@@ -0,0 +1,79 @@
+"""
+Zoomable, pannable viewport over the unbounded Life plane.
+
+Viewport maps screen pixels in the grid area to world cells. Its state is
+(x, y, cell_px), where x and y are the world pixels (cell * cell_px) at the
+grid area's top-left corner. The whole state is one tuple that is replaced
+on every change, so the step worker thread can read a consistent copy.
+
+At small cell sizes the view covers too many cells to draw one by one, and
+it is drawn as a density map instead: each bin of block x block cells
+becomes one shaded square.
+"""
+
+ZOOM_LEVELS = (1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 20, 24, 32, 40)
+DEFAULT_CELL_PX = 10
+DENSITY_BIN_PX = 4     # target on-screen size of one density bin
+GRID_LINES_FROM = 6    # cell sizes from here up get grid lines
+
+
+class Viewport:
+    def __init__(self, width, height, cell_px=DEFAULT_CELL_PX):
+        self.width = width
+        self.height = height
+        self.state = (0, 0, cell_px)
+
+    @property
+    def cell_px(self):
+        return self.state[2]
+
+    def reset(self):
+        self.state = (0, 0, DEFAULT_CELL_PX)
+
+    # ── Navigation ──
+
+    def pan(self, dx, dy):
+        """Move the view so the plane follows a drag of (dx, dy) pixels."""
+        x, y, z = self.state
+        self.state = (x - dx, y - dy, z)
+
+    def zoom_at(self, sx, sy, steps):
+        """Step through ZOOM_LEVELS, keeping the point under (sx, sy) fixed."""
+        x, y, z = self.state
+        index = ZOOM_LEVELS.index(z) if z in ZOOM_LEVELS else ZOOM_LEVELS.index(DEFAULT_CELL_PX)
+        new_z = ZOOM_LEVELS[max(0, min(len(ZOOM_LEVELS) - 1, index + steps))]
+        if new_z == z:
+            return
+        # Rescale the world pixel under the cursor, rounding down so the
+        # cell under it stays put.
+        self.state = ((x + sx) * new_z // z - sx, (y + sy) * new_z // z - sy, new_z)
+
+    def screen_to_cell(self, sx, sy):
+        x, y, z = self.state
+        return (y + sy) // z, (x + sx) // z
+
+    def cell_to_screen(self, r, c):
+        x, y, z = self.state
+        return c * z - x, r * z - y
+
+    # ── Layout ──
+
+    @staticmethod
+    def block_for(cell_px):
+        """Cells per density bin side; 1 means cells are drawn individually."""
+        return max(1, DENSITY_BIN_PX // cell_px)
+
+    def layout(self, state=None):
+        """Return (top, left, bottom, right, block) covering the grid area.
+
+        The bounds are aligned to the density block, so bins stay fixed to
+        the plane while panning.
+        """
+        x, y, z = state or self.state
+        block = self.block_for(z)
+        top = y // z // block * block
+        left = x // z // block * block
+        bin_px = block * z
+        rows = -(-(self.height + y - top * z) // bin_px)
+        cols = -(-(self.width + x - left * z) // bin_px)
+        return top, left, top + rows * block, left + cols * block, block
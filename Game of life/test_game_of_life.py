@@ -0,0 +1,427 @@
+"""
+Tests for the Game of Life stepping engines.
+
+Every engine must produce exactly the same generations as the original
+set-based update rule.
+"""
+
+import io
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from game_of_life import PATTERN_DIR, PRESETS
+from hashlife import HashlifeEngine
+from life_bench import bench_preset
+from life_census import NAMED_OBJECTS, census_soup, classify_ash, object_code, split_objects
+from life_cycles import CycleDetector, find_cycle
+from life_engines import DenseEngine, PackedEngine, SetEngine, TiledEngine, TorusEngine, bin_cells
+from life_history import History
+from life_parallel import ParallelEngine
+from life_patterns import PatternDirectory, normalise, read_life106, read_macrocell, read_rle, write_rle
+from life_rules import PRESET_RULES, Rule
+from life_scheduler import GenerationScheduler, StepWorker
+from life_view import Viewport
+
+EQUIVALENCE_PRESETS = ["Glider", "Pulsar", "Gosper Glider Gun", "R-pentomino", "Max Spacefiller"]
+
+
+def random_soup(seed, size=30, count=400):
+    rng = random.Random(seed)
+    return {(rng.randint(0, size), rng.randint(0, size)) for _ in range(count)}
+
+
+def assert_same_generations(engine, cells, gens):
+    reference = SetEngine()
+    reference.load(cells)
+    engine.load(cells)
+    for gen in range(gens):
+        reference.step()
+        engine.step()
+        assert engine.cells() == reference.cells(), f"{engine.name} diverged at gen {gen + 1}"
+        assert engine.population == reference.population
+
+
+def test_dense_matches_set_engine_on_presets():
+    for name in EQUIVALENCE_PRESETS:
+        assert_same_generations(DenseEngine(), PRESETS[name], 120)
+
+
+def test_dense_matches_set_engine_on_random_soup():
+    assert_same_generations(DenseEngine(), random_soup(1), 200)
+
+
+def test_dense_follows_patterns_off_the_board():
+    # A glider placed at the corner heads towards negative coordinates and
+    # must keep moving instead of dying against the board edge.
+    glider = [(r, -c) for r, c in PRESETS["Glider"]]
+    assert_same_generations(DenseEngine(rows=10, cols=10), glider, 100)
+
+
+def test_tiled_matches_set_engine():
+    for name in EQUIVALENCE_PRESETS:
+        assert_same_generations(TiledEngine(), PRESETS[name], 120)
+    assert_same_generations(TiledEngine(), random_soup(5), 200)
+
+
+def test_tiled_skips_stable_tiles():
+    engine = TiledEngine(rows=64, cols=64)
+    block = [(r + 20, c + 20) for r, c in PRESETS["Block"]]
+    blinker = [(r + 50, c + 50) for r, c in PRESETS["Blinker"]]
+    engine.load(block + blinker)
+    engine.take_dirty_tiles()
+    for _ in range(4):
+        engine.step()
+    # Only the blinker's tile and its neighbours are recomputed.
+    assert engine.active_tiles <= 9
+    assert engine.take_dirty_tiles() == [(3, 3)]
+    assert engine.take_dirty_tiles() == []
+
+
+def test_dense_editing_round_trip():
+    engine = DenseEngine()
+    engine.set_cell(500, -300, True)
+    assert engine.is_alive(500, -300)
+    assert engine.population == 1
+    engine.set_cell(500, -300, False)
+    assert not engine.is_alive(500, -300)
+    assert engine.cells() == set()
+
+
+def test_hashlife_matches_set_engine_one_generation_at_a_time():
+    for name in EQUIVALENCE_PRESETS:
+        assert_same_generations(HashlifeEngine(), PRESETS[name], 100)
+
+
+def test_hashlife_jump_matches_single_steps():
+    reference = SetEngine()
+    reference.load(PRESETS["Gosper Glider Gun"])
+    reference.step(300)
+    engine = HashlifeEngine()
+    engine.load(PRESETS["Gosper Glider Gun"])
+    engine.step(256)
+    engine.step(44)
+    assert engine.cells() == reference.cells()
+
+
+def test_hashlife_result_cache_is_bounded():
+    engine = HashlifeEngine(result_cache_size=64)
+    engine.load(random_soup(2))
+    engine.step(200)
+    assert len(engine._results) <= 64
+
+    reference = SetEngine()
+    reference.load(random_soup(2))
+    reference.step(200)
+    assert engine.cells() == reference.cells()
+
+
+def test_packed_matches_set_engine_while_on_board():
+    for name in ["Pulsar", "Gosper Glider Gun", "R-pentomino"]:
+        cells = [(r + 50, c + 50) for r, c in PRESETS[name]]
+        assert_same_generations(PackedEngine(rows=140, cols=150), cells, 60)
+    soup = {(r + 30, c + 30) for r, c in random_soup(3)}
+    assert_same_generations(PackedEngine(rows=90, cols=90), soup, 60)
+
+
+def test_packed_dead_edge_clips_cells():
+    engine = PackedEngine(rows=10, cols=10)
+    engine.load([(0, 0), (-1, 4), (3, 12)])
+    assert engine.cells() == {(0, 0)}
+
+
+def test_parallel_bands_match_packed_engine():
+    soup = {(r + 30, c + 30) for r, c in random_soup(11)}
+    packed = PackedEngine(rows=90, cols=90)
+    packed.load(soup)
+    packed.step(40)
+    for workers in (1, 3):
+        engine = ParallelEngine(rows=90, cols=90, workers=workers)
+        try:
+            engine.load(soup)
+            engine.step(40)
+            assert engine.cells() == packed.cells()
+            assert engine.state_hash() == packed.state_hash()
+            for view in ((30, 40, 60, 70), (-100, -100, -5, -5)):
+                assert set(engine.cells_in_view(*view)) == set(packed.cells_in_view(*view))
+        finally:
+            engine.close()
+
+
+def test_torus_matches_wrapped_reference():
+    rows, cols = 20, 70  # cols not a multiple of 64 exercises the tail word
+    cells = {(r % rows, c % cols) for r, c in random_soup(4, size=80, count=600)}
+    board = np.zeros((rows, cols), dtype=np.uint8)
+    for r, c in cells:
+        board[r, c] = 1
+    engine = TorusEngine(rows, cols)
+    engine.load(cells)
+    for gen in range(60):
+        neigh = sum(
+            np.roll(np.roll(board, dr, axis=0), dc, axis=1)
+            for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+        )
+        board = ((neigh == 3) | ((neigh == 2) & (board == 1))).astype(np.uint8)
+        engine.step()
+        rs, cs = np.nonzero(board)
+        assert engine.cells() == set(zip(rs.tolist(), cs.tolist())), f"diverged at gen {gen + 1}"
+
+
+def test_cells_in_view_agrees_across_engines():
+    cells = random_soup(6)
+    for engine in (SetEngine(), DenseEngine(), TiledEngine(), HashlifeEngine(), PackedEngine()):
+        engine.load(cells)
+        engine.step(20)
+        expected = {(r, c) for r, c in engine.cells() if 5 <= r < 25 and 10 <= c < 22}
+        assert set(engine.cells_in_view(5, 10, 25, 22)) == expected, engine.name
+        assert set(engine.cells_in_view(-100, -100, -5, -5)) == set(), engine.name
+
+
+def test_density_in_view_agrees_across_engines():
+    cells = random_soup(7, size=60, count=1500)
+    for engine in (SetEngine(), DenseEngine(), TiledEngine(), HashlifeEngine(), PackedEngine()):
+        engine.load(cells)
+        engine.step(10)
+        live = engine.cells()
+        for view in ((0, 0, 64, 64, 1), (-8, 4, 40, 68, 4), (3, -5, 20, 30, 2)):
+            top, left, bottom, right, block = view
+            inside = [(r, c) for r, c in live if top <= r < bottom and left <= c < right]
+            expected = bin_cells(inside, *view)
+            assert (engine.density_in_view(*view) == expected).all(), (engine.name, view)
+
+
+def test_set_engine_chunk_index_follows_edits():
+    engine = SetEngine()
+    engine.load(random_soup(8))
+    assert set(engine.cells_in_view(0, 0, 40, 40)) == engine.cells()
+    engine.set_cell(35, 33, True)
+    engine.set_cell(-70, 500, True)
+    engine.set_cell(*next(iter(engine.cells())), False)
+    assert set(engine.cells_in_view(-100, -100, 100, 600)) == engine.cells()
+    index = engine._index
+    engine.step(30)
+    assert engine._index is index  # updated by the step, not rebuilt
+    assert set(engine.cells_in_view(-100, -100, 100, 600)) == engine.cells()
+    assert sum(map(len, index.chunks.values())) == engine.population
+
+
+def test_viewport_zoom_keeps_cell_under_cursor():
+    view = Viewport(800, 900)
+    view.pan(-123, 45)
+    before = view.screen_to_cell(300, 200)
+    for steps in (3, -5, 2, -20, 40):
+        view.zoom_at(300, 200, steps)
+        assert view.screen_to_cell(300, 200) == before
+    top, left, bottom, right, block = view.layout()
+    assert view.cell_px == 40 and block == 1
+    assert top <= before[0] < bottom and left <= before[1] < right
+
+
+def test_rle_reader_handles_any_chunk_split():
+    with open(os.path.join(PATTERN_DIR, "gosper-glider-gun.rle")) as f:
+        text = f.read()
+    expected = sorted(normalise(PRESETS["Gosper Glider Gun"]))
+    for chunk_size in (1, 2, 5, 64):
+        info = {}
+        cells = read_rle(io.StringIO(text), info, chunk_size=chunk_size)
+        assert sorted(cells) == expected
+        assert info == {"name": "Gosper glider gun", "rule": "B3/S23"}
+
+
+def test_rle_export_round_trip():
+    cells = random_soup(9, size=200, count=3000)
+    out = io.StringIO()
+    write_rle(cells, out)
+    assert all(len(line) <= 70 for line in out.getvalue().splitlines())
+    assert sorted(read_rle(io.StringIO(out.getvalue()))) == sorted(normalise(cells))
+
+
+def test_life106_and_macrocell_readers():
+    lif = "#Life 1.06\n#N Pi-heptomino\n0 0\n1 0\n2 0\n0 1\n2 1\n0 2\n-3 -9\n"
+    assert set(read_life106(io.StringIO(lif))) == {
+        (0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (-9, -3),
+    }
+    # Node 1 is an 8x8 leaf holding a glider; node 2 puts it in the nw and
+    # se corners of a 16x16 square.
+    mc = "[M2] (golly 2.0)\n#R B3/S23\n.*$..*$***$\n4 1 0 0 1\n"
+    glider = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+    assert set(read_macrocell(io.StringIO(mc))) == glider | {(r + 8, c + 8) for r, c in glider}
+
+
+def test_pattern_directory_loads_files_on_demand():
+    patterns = PatternDirectory(PATTERN_DIR)
+    assert "diehard.rle" in patterns.names()
+    assert patterns._cache == {}
+    engine = SetEngine()
+    engine.load(patterns.cells("diehard.rle"))
+    engine.step(129)
+    assert engine.population > 0
+    engine.step()
+    assert engine.population == 0
+
+
+def test_state_hash_is_updated_incrementally():
+    cells = {(r + 20, c + 20) for r, c in random_soup(10)}
+    for engine in (SetEngine(), DenseEngine(), TiledEngine(), PackedEngine(rows=90, cols=90)):
+        engine.load(cells)
+        for _ in range(40):
+            engine.step()
+        engine.set_cell(3, 4, not engine.is_alive(3, 4))
+        engine.add_cells([(5, 5), (5, 5), (6, 7)])
+        fresh = SetEngine()
+        fresh.load(engine.cells())
+        assert engine.state_hash() == fresh.state_hash(), engine.name
+
+
+def test_cycle_found_from_batched_hashes():
+    # Pulsar (period 3) plus a blinker (period 2): the whole board has period 6.
+    cells = list(PRESETS["Pulsar"]) + [(r + 40, c + 40) for r, c in PRESETS["Blinker"]]
+    engine = TiledEngine()
+    engine.load(cells)
+    detector = CycleDetector()
+    generation = 0
+    since = None
+    while since is None:
+        engine.step(4)  # hashes only seen every fourth generation, like the worker
+        generation += 4
+        since = detector.record(generation, engine.state_hash())
+    assert generation - since == 12
+
+    engine.step(2)  # the worker may run on past the recorded hash before it stops
+    cycle = find_cycle(engine, generation, since, TiledEngine, start=generation + 2)
+    assert cycle.period == 6 and (cycle.since, cycle.detected) == (since, generation)
+    reference = SetEngine()
+    reference.load(cells)
+    reference.step(generation + 1000)
+    assert cycle.phase_at(generation + 1000).cells() == reference.cells()
+
+
+def test_history_rewinds_without_recomputing():
+    engine = SetEngine()
+    engine.load(PRESETS["R-pentomino"])
+    history = History(keyframe_interval=8)
+    states = []
+    for gen in range(60):
+        states.append(engine.cells())
+        history.record(gen, engine.cells())
+        engine.step()
+    for frames, gen in ((-1, 58), (-20, 38), (-7, 31), (12, 43), (-43, 0), (100, 59)):
+        generation, cells = history.step(frames)
+        assert generation == gen and cells == states[gen]
+    assert history.step(1) is None
+
+    # Recording after a rewind discards the frames ahead of the cursor.
+    history.step(-10)
+    history.record(49, states[49] | {(50, 50)})
+    assert len(history) == 51 and history.rewound == 0
+
+
+def test_history_evicts_oldest_segment_under_budget():
+    engine = SetEngine()
+    engine.load(random_soup(2))
+    history = History(keyframe_interval=4, max_bytes=20000)
+    for gen in range(200):
+        history.record(gen, engine.cells())
+        engine.step()
+    assert history.nbytes <= 20000
+    assert history.frames[0].keyframe is not None
+    oldest = history.frames[0].generation
+    generation, cells = history.step(-len(history))
+    reference = SetEngine()
+    reference.load(random_soup(2))
+    reference.step(oldest)
+    assert generation == oldest and cells == reference.cells()
+
+
+def test_census_classifies_objects_in_any_orientation():
+    glider = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+    assert object_code([(-r + 7, c - 3) for c, r in glider]) == "glider"
+    assert object_code([(5, 5), (6, 5), (7, 5)]) == "blinker"
+    assert object_code([(0, 0), (0, 1), (0, 3), (1, 0), (1, 2), (1, 3)]).startswith("xs6_")  # snake
+    ash = [(0, 0), (0, 1), (1, 0), (1, 1), (0, 3), (0, 4), (1, 3), (1, 4), (9, 9), (9, 10), (9, 11)]
+    assert sorted(len(group) for group in split_objects(ash)) == [3, 4, 4]
+
+
+def test_census_keeps_objects_whole_in_every_phase():
+    pulsar = SetEngine()
+    pulsar.load((r + 20, c) for r, c in NAMED_OBJECTS["pulsar"])
+    beacon = [(0, 0), (0, 1), (1, 0), (2, 3), (3, 2), (3, 3)]  # 6-cell phase
+    for _ in range(3):
+        ash = pulsar.cells() | set(beacon)
+        assert classify_ash(ash) == {"pulsar": 1, "beacon": 1}
+        pulsar.step()
+
+
+def test_census_soup_is_reproducible():
+    objects, gens, settled = census_soup(3)
+    assert settled and objects == census_soup(3, "set")[0]
+    assert objects["unclassified"] < sum(objects.values())
+
+
+def test_rule_parsing():
+    assert Rule.parse("b36/s23") == Rule.parse("23/36") == Rule.parse("S23/B36")
+    assert Rule.parse("B2/S").survive == frozenset()
+    for bad in ("B0/S23", "B9/S23", "B3S23", "life"):
+        try:
+            Rule.parse(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad} was accepted")
+
+
+def test_engines_agree_under_other_rules():
+    cells = [(r + 30, c + 25) for r, c in random_soup(5)]
+    for rule in (r for r in PRESET_RULES if r.name in ("HighLife", "Seeds", "Day & Night")):
+        reference = SetEngine()
+        reference.set_rule(rule)
+        reference.load(cells)
+        reference.step(12)
+        for engine in (DenseEngine(), TiledEngine(), PackedEngine(), HashlifeEngine()):
+            engine.set_rule(rule)
+            engine.load(cells)
+            engine.step(12)
+            assert engine.cells() == reference.cells(), (rule, engine.name)
+
+    # Changing the rule must also reach tiles that settled under the old one.
+    block = [(40, 40), (40, 41), (41, 40), (41, 41)]
+    seeds = next(r for r in PRESET_RULES if r.name == "Seeds")
+    for engine in (SetEngine(), DenseEngine(), TiledEngine(), PackedEngine(), HashlifeEngine()):
+        engine.load(block)
+        engine.step(3)
+        engine.set_rule(seeds)
+        engine.step(1)
+        assert engine.population == 8, engine.name
+
+
+def test_headless_benchmark_hashes_agree():
+    hashes = {bench_preset("Acorn", 60, name)["hash"] for name in ("set", "dense", "tiled", "hashlife")}
+    assert len(hashes) == 1
+
+
+def test_scheduler_spreads_generations_over_frames():
+    scheduler = GenerationScheduler()
+    # 15 gens/sec rendered at 60 FPS: one generation every fourth frame.
+    assert sum(scheduler.due(15, 1 / 60) for _ in range(60)) in (14, 15)
+    # A long stall does not queue up an unbounded backlog.
+    assert scheduler.due(150, 10.0) == scheduler.max_per_frame
+
+
+def test_step_worker_hands_over_generations():
+    engine = DenseEngine()
+    engine.load(PRESETS["Acorn"])
+    worker = StepWorker(engine, 0, lambda e: list(e.cells_in_view(0, 0, 90, 80)))
+    worker.start()
+    deadline = time.time() + 5
+    while worker.generation < 50 and time.time() < deadline:
+        time.sleep(0.01)
+    worker.stop()
+    assert worker.generation >= 50
+    reference = SetEngine()
+    reference.load(PRESETS["Acorn"])
+    reference.step(worker.generation)
+    assert engine.cells() == reference.cells()
@@ -3,12 +3,17 @@ Meteor Defender - A fast-paced arcade survival game
 Defend Earth from waves of meteors!
 """
 
+import argparse
+import os
 import pygame
 import random
 import math
+import time
+import numpy as np
+from collections import OrderedDict, defaultdict, deque
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
 
 # Initialize Pygame
 pygame.init()
@@ -21,6 +26,18 @@ pygame.init()
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+TICK_RATE = 60  # fixed simulation steps per second
+MAX_FRAME_TIME = 0.25  # longest frame the simulation catches up on
+
+# Star field
+STAR_COUNT = 100
+MAX_STARS = 5000
+
+# Quality governor
+FRAME_BUDGET_MS = 1000 / FPS * 0.8  # update+draw time per frame, leaving room for flip
+GOVERNOR_WINDOW = 30        # frames in the rolling average
+GOVERNOR_RESTORE = 0.6      # step back up below this fraction of the budget...
+GOVERNOR_RESTORE_DELAY = 180  # ...held for this many frames after the last change
 
 # Colors
 COLOR_BACKGROUND = (10, 10, 26)  # Deep Space Blue
@@ -40,19 +57,27 @@ COLOR_LIVES = (255, 0, 0)
 COLOR_TIME_SLOW = (100, 100, 255)  # Blue tint for time slow effect
 COLOR_DASH = (255, 200, 100)  # Orange for dash effects
 
-# Game settings
-PLAYER_SPEED = 6
-BULLET_SPEED = 10
+# Game settings (speeds in pixels per second)
+PLAYER_SPEED = 360
+BULLET_SPEED = 600
 BULLET_COOLDOWN = 250  # milliseconds (pistol default)
-METEOR_BASE_SPEED = 2.0
-POWERUP_SPEED = 2
+METEOR_BASE_SPEED = 120.0
+POWERUP_SPEED = 120
 POWERUP_DROP_CHANCE = 0.15
 
+# Particle settings
+PARTICLE_CAPACITY = 20000
+PARTICLE_ALPHA_BUCKETS = 16  # fade levels with a pre-rendered sprite each
+PARTICLE_MAX_RADIUS = 8
+
 # Dash settings
-DASH_SPEED = 20
+DASH_SPEED = 1200  # pixels per second
 DASH_DURATION = 0.15  # seconds
 DASH_COOLDOWN = 4.0  # seconds
 
+# Headless stress runs
+WAVE_TIMEOUT = 600  # simulated seconds before a run is declared stalled
+
 # Time slow settings
 TIME_SLOW_MULTIPLIER = 0.3  # 30% speed
 TIME_SLOW_DURATION = 4.0  # seconds
@@ -88,6 +113,15 @@ METEOR_RADIUS = {
     MeteorSize.LARGE: 40
 }
 
+# Meteor sprite cache
+METEOR_SHAPES_PER_SIZE = 6            # outline templates shared by every meteor of a size
+METEOR_ROTATION_STEPS = 64            # pre-rendered angles per damage state
+METEOR_SPRITE_CACHE_BYTES = 64 << 20  # LRU budget across all shapes
+METEOR_COLORKEY = (0, 0, 0)
+
+SHIELD_RADIUS = 25
+COLLISION_CELL_SIZE = 2 * max(METEOR_RADIUS.values())  # spatial hash grid spacing
+
 # Power-up types
 class PowerUpType(Enum):
     RAPID_FIRE = 1
@@ -163,118 +197,371 @@ class GameState(Enum):
 
 
 # =============================================================================
-# STAR BACKGROUND
+# HELPERS
 # =============================================================================
 
-@dataclass
-class Star:
-    x: float
-    y: float
-    size: int
-    brightness: int
-    twinkle_speed: float
-    twinkle_offset: float
+# Fallback for objects created outside a Game; a Game passes its own seeded one.
+_default_rng = random.Random()
+
+
+def lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
+
+
+_fonts: dict = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """The default font at `size`, loaded once."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
 
+# =============================================================================
+# OBJECT POOLS
+# =============================================================================
+
+T = TypeVar("T")
+
+
+class Pool(Generic[T]):
+    """Free list of reusable game objects of one type.
+
+    acquire() reuses a released object when there is one, calling its
+    reset() with the constructor arguments, and only constructs a new one
+    otherwise. release() and compact() hand objects back. All O(1) per
+    object. `allocations` counts the objects actually constructed.
+    """
+
+    def __init__(self, factory: Callable[..., T]):
+        self.factory = factory
+        self.free: List[T] = []
+        self.allocations = 0
+
+    def acquire(self, *args) -> T:
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            return obj
+        self.allocations += 1
+        return self.factory(*args)
+
+    def release(self, obj: T):
+        self.free.append(obj)
+
+    def compact(self, live: List[T]):
+        """Remove inactive objects from `live` in place by swap-remove and release them.
+
+        Order is not preserved: each dead slot is filled with the last element.
+        """
+        i = 0
+        while i < len(live):
+            obj = live[i]
+            if obj.active:
+                i += 1
+                continue
+            last = live.pop()
+            if last is not obj:
+                live[i] = last
+            self.free.append(obj)
+
+
+# =============================================================================
+# STAR BACKGROUND
+# =============================================================================
 
 class StarField:
-    def __init__(self, num_stars: int = 100):
-        self.stars: List[Star] = []
-        for _ in range(num_stars):
-            self.stars.append(Star(
-                x=random.randint(0, SCREEN_WIDTH),
-                y=random.randint(0, SCREEN_HEIGHT),
-                size=random.randint(1, 3),
-                brightness=random.randint(100, 255),
-                twinkle_speed=random.uniform(0.02, 0.05),
-                twinkle_offset=random.uniform(0, math.pi * 2)
-            ))
+    """Scrolling, twinkling stars kept as parallel NumPy arrays.
+
+    Brightness is computed for every star in one vectorized pass and each
+    star is blitted from a sprite cached by size and grey level, all in one
+    Surface.blits call. While the stars do not move (pause and shop
+    screens) the whole field is drawn once into a colour-keyed layer and
+    that layer is reused.
+    """
+    
+    def __init__(self, num_stars: int = STAR_COUNT, rng: random.Random = _default_rng):
+        self.rng = np.random.default_rng(rng.getrandbits(64))
+        self.count = num_stars
+        self.x = self.rng.integers(0, SCREEN_WIDTH + 1, num_stars).astype(np.float32)
+        self.y = self.rng.integers(0, SCREEN_HEIGHT + 1, num_stars).astype(np.float32)
+        self.size = self.rng.integers(1, 4, num_stars).astype(np.int32)
+        self.brightness = self.rng.integers(100, 256, num_stars).astype(np.float32)
+        self.twinkle_speed = self.rng.uniform(0.02, 0.05, num_stars).astype(np.float32)
+        self.twinkle_offset = self.rng.uniform(0, math.pi * 2, num_stars).astype(np.float32)
         self.time = 0
+        self.visible = num_stars  # the first `visible` stars are drawn
+        self._sprites: dict = {}
+        self._layer: Optional[pygame.Surface] = None
+        self._moved = True
+    
+    def set_density(self, fraction: float):
+        """Draw only this fraction of the stars."""
+        visible = round(self.count * fraction)
+        if visible != self.visible:
+            self.visible = visible
+            self._moved = True
     
     def update(self, dt: float):
         self.time += dt
-        for star in self.stars:
-            star.y += star.size * 0.3  # Parallax effect
-            if star.y > SCREEN_HEIGHT:
-                star.y = 0
-                star.x = random.randint(0, SCREEN_WIDTH)
+        self.y += self.size * np.float32(18 * dt)  # Parallax effect
+        wrapped = np.flatnonzero(self.y > SCREEN_HEIGHT)
+        if len(wrapped):
+            self.y[wrapped] = 0
+            self.x[wrapped] = self.rng.integers(0, SCREEN_WIDTH + 1, len(wrapped))
+        self._moved = True
+    
+    def _sprite(self, key: int) -> pygame.Surface:
+        size, level = divmod(key, 256)
+        sprite = pygame.Surface((size * 2 + 1, size * 2 + 1))
+        pygame.draw.circle(sprite, (level, level, level), (size, size), size)
+        sprite.set_colorkey((0, 0, 0))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        return sprite
+    
+    def _blit_stars(self, surface: pygame.Surface):
+        n = self.visible
+        size = self.size[:n]
+        twinkle = np.sin(self.time * self.twinkle_speed[:n] + self.twinkle_offset[:n])
+        level = np.clip((self.brightness[:n] * (0.7 + 0.3 * twinkle)).astype(np.int32), 50, 255)
+        keys = size * 256 + level
+        sprites = self._sprites
+        for key in np.unique(keys).tolist():
+            if key not in sprites:
+                sprites[key] = self._sprite(key)
+        left = (self.x[:n].astype(np.int32) - size).tolist()
+        top = (self.y[:n].astype(np.int32) - size).tolist()
+        surface.blits(zip(map(sprites.__getitem__, keys.tolist()), zip(left, top)), doreturn=False)
     
     def draw(self, surface: pygame.Surface):
-        for star in self.stars:
-            twinkle = math.sin(self.time * star.twinkle_speed + star.twinkle_offset)
-            alpha = int(star.brightness * (0.7 + 0.3 * twinkle))
-            alpha = max(50, min(255, alpha))
-            color = (alpha, alpha, alpha)
-            pygame.draw.circle(surface, color, (int(star.x), int(star.y)), star.size)
+        if self._moved:
+            self._moved = False
+            self._layer = None
+            self._blit_stars(surface)
+            return
+        if self._layer is None:
+            layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._blit_stars(layer)
+            layer.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            self._layer = layer
+        surface.blit(self._layer, (0, 0))
 
 
 # =============================================================================
 # PARTICLE SYSTEM
 # =============================================================================
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    color: Tuple[int, int, int]
-    life: float
-    max_life: float
-    size: float
+class ParticleSystem:
+    """Fixed-capacity particle store kept as parallel NumPy arrays.
 
+    Live particles occupy slots [0, count). When particles die, the last
+    live ones are moved into their slots (swap-compaction), so the arrays
+    stay dense and no per-particle objects are ever created. Particles are
+    drawn from circle sprites cached by colour, radius and alpha bucket and
+    blitted in one Surface.blits call.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self._arrays = (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.size, self.color)
+        self.rng = np.random.default_rng(seed)
+        self.spawn_scale = 1.0  # lowered by the quality governor
+
+        self.colors: List[Tuple[int, int, int]] = []
+        self._color_ids: dict = {}
+        self._sprites: dict = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = self._color_ids[color] = len(self.colors)
+            self.colors.append(color)
+        return color_id
+
+    def _spawn(self, n: int) -> slice:
+        """Reserve up to n slots (scaled by spawn_scale, at least one);
+        particles beyond capacity are dropped."""
+        if self.spawn_scale != 1.0:
+            n = max(1, round(n * self.spawn_scale))
+        n = min(n, self.capacity - self.count)
+        slots = slice(self.count, self.count + n)
+        self.count += n
+        return slots
+
+    def create_explosion(self, x: float, y: float, color: Tuple[int, int, int],
+                         num_particles: int = 15, speed: float = 300.0):
+        slots = self._spawn(num_particles)
+        n = slots.stop - slots.start
+        angle = self.rng.uniform(0, math.pi * 2, n)
+        velocity = self.rng.uniform(speed * 0.5, speed * 1.5, n)
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = np.cos(angle) * velocity
+        self.vy[slots] = np.sin(angle) * velocity
+        self.color[slots] = self._color_id(color)
+        self.life[slots] = self.rng.uniform(0.3, 0.8, n)
+        self.max_life[slots] = 0.8
+        self.size[slots] = self.rng.uniform(2, 5, n)
 
-class ParticleSystem:
-    def __init__(self):
-        self.particles: List[Particle] = []
-    
-    def create_explosion(self, x: float, y: float, color: Tuple[int, int, int], 
-                         num_particles: int = 15, speed: float = 5.0):
-        for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            velocity = random.uniform(speed * 0.5, speed * 1.5)
-            self.particles.append(Particle(
-                x=x, y=y,
-                vx=math.cos(angle) * velocity,
-                vy=math.sin(angle) * velocity,
-                color=color,
-                life=random.uniform(0.3, 0.8),
-                max_life=0.8,
-                size=random.uniform(2, 5)
-            ))
-    
     def create_dash_trail(self, x: float, y: float, color: Tuple[int, int, int]):
         """Create trail particles for dash effect"""
-        for _ in range(5):
-            self.particles.append(Particle(
-                x=x + random.uniform(-10, 10),
-                y=y + random.uniform(-5, 5),
-                vx=random.uniform(-1, 1),
-                vy=random.uniform(-1, 1),
-                color=color,
-                life=random.uniform(0.2, 0.4),
-                max_life=0.4,
-                size=random.uniform(3, 6)
-            ))
-    
-    def update(self, dt: float, time_multiplier: float = 1.0):
-        for particle in self.particles[:]:
-            particle.x += particle.vx * time_multiplier
-            particle.y += particle.vy * time_multiplier
-            particle.life -= dt
-            particle.size *= 0.98
-            if particle.life <= 0:
-                self.particles.remove(particle)
-    
+        slots = self._spawn(5)
+        n = slots.stop - slots.start
+        self.x[slots] = x + self.rng.uniform(-10, 10, n)
+        self.y[slots] = y + self.rng.uniform(-5, 5, n)
+        self.vx[slots] = self.rng.uniform(-60, 60, n)
+        self.vy[slots] = self.rng.uniform(-60, 60, n)
+        self.color[slots] = self._color_id(color)
+        self.life[slots] = self.rng.uniform(0.2, 0.4, n)
+        self.max_life[slots] = 0.4
+        self.size[slots] = self.rng.uniform(3, 6, n)
+
+    def update(self, dt: float):
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
+        self.size[:n] *= 0.98 ** (dt * 60)  # shrink 2% per 1/60 s
+
+        alive = self.life[:n] > 0
+        new_count = int(np.count_nonzero(alive))
+        if new_count == n:
+            return
+        # Fill the dead slots below new_count with the live particles above it.
+        holes = np.flatnonzero(~alive[:new_count])
+        movers = np.flatnonzero(alive[new_count:]) + new_count
+        for array in self._arrays:
+            array[holes] = array[movers]
+        self.count = new_count
+
+    def _sprite(self, key: int) -> pygame.Surface:
+        color_id, rest = divmod(key, PARTICLE_MAX_RADIUS * PARTICLE_ALPHA_BUCKETS)
+        radius, bucket = divmod(rest, PARTICLE_ALPHA_BUCKETS)
+        radius += 1
+        alpha = min(255, (bucket * 2 + 1) * 128 // PARTICLE_ALPHA_BUCKETS)
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*self.colors[color_id], alpha), (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
     def draw(self, surface: pygame.Surface):
-        for particle in self.particles:
-            alpha = int(255 * (particle.life / particle.max_life))
-            alpha = max(0, min(255, alpha))
-            # Create a surface with per-pixel alpha
-            size = max(1, int(particle.size))
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color_with_alpha = (*particle.color, alpha)
-            pygame.draw.circle(particle_surface, color_with_alpha, (size, size), size)
-            surface.blit(particle_surface, (int(particle.x - size), int(particle.y - size)))
+        n = self.count
+        if n == 0:
+            return
+        alpha = np.clip(self.life[:n] / self.max_life[:n], 0.0, 1.0)
+        bucket = np.minimum((alpha * PARTICLE_ALPHA_BUCKETS).astype(np.int32), PARTICLE_ALPHA_BUCKETS - 1)
+        radius = np.clip(self.size[:n].astype(np.int32), 1, PARTICLE_MAX_RADIUS)
+        left = (self.x[:n] - radius).astype(np.int32)
+        top = (self.y[:n] - radius).astype(np.int32)
+        # One int per (colour, radius, alpha bucket) sprite.
+        keys = (self.color[:n] * PARTICLE_MAX_RADIUS + radius - 1) * PARTICLE_ALPHA_BUCKETS + bucket
+
+        sprites = self._sprites
+        for key in np.unique(keys).tolist():
+            if key not in sprites:
+                sprites[key] = self._sprite(key)
+        surface.blits(
+            zip(map(sprites.__getitem__, keys.tolist()), zip(left.tolist(), top.tolist())),
+            doreturn=False,
+        )
+
+
+# =============================================================================
+# COLLISION
+# =============================================================================
+
+class SpatialHash:
+    """Uniform grid of buckets for broadphase collision queries.
+
+    Rebuilt every tick: each object is added to every cell its bounding
+    circle overlaps, so a query inside one cell only has to look there.
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: dict = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, obj, x: float, y: float, radius: float):
+        size = self.cell_size
+        cells = self.cells
+        x0, x1 = int((x - radius) // size), int((x + radius) // size)
+        y0, y1 = int((y - radius) // size), int((y + radius) // size)
+        if x0 == x1 and y0 == y1:
+            keys = ((x0, y0),)
+        else:
+            keys = [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [obj]
+            else:
+                bucket.append(obj)
+
+    def query_circle(self, x: float, y: float, radius: float) -> list:
+        """Objects in any cell the circle overlaps, each listed once."""
+        size = self.cell_size
+        found = {}
+        for cx in range(int((x - radius) // size), int((x + radius) // size) + 1):
+            for cy in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                for obj in self.cells.get((cx, cy), ()):
+                    found[id(obj)] = obj
+        return list(found.values())
+
+    def query_segment(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Objects in any cell of the segment's bounding box, each listed once."""
+        size = self.cell_size
+        cx0, cx1 = sorted((int(x0 // size), int(x1 // size)))
+        cy0, cy1 = sorted((int(y0 // size), int(y1 // size)))
+        if cx0 == cx1 and cy0 == cy1:
+            return self.cells.get((cx0, cy0), [])
+        found = {}
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for obj in self.cells.get((cx, cy), ()):
+                    found[id(obj)] = obj
+        return list(found.values())
+
+
+def segment_circle_time(x0: float, y0: float, x1: float, y1: float, radius: float) -> Optional[float]:
+    """Earliest t in [0, 1] at which the point moving from (x0, y0) to
+    (x1, y1) is within `radius` of the origin, or None if it never is."""
+    c = x0 * x0 + y0 * y0 - radius * radius
+    if c <= 0:
+        return 0.0  # starts inside
+    dx = x1 - x0
+    dy = y1 - y0
+    a = dx * dx + dy * dy
+    b = 2 * (x0 * dx + y0 * dy)
+    if a == 0 or b >= 0:
+        return None  # not moving, or moving away
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+    t = (-b - math.sqrt(disc)) / (2 * a)
+    return t if t <= 1 else None
 
 
 # =============================================================================
@@ -285,10 +572,13 @@ class Player:
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.width = 30
         self.height = 35
         self.speed = PLAYER_SPEED
-        self.last_shot = 0
+        self.time_ms = 0.0  # simulation clock for cooldowns and power-ups
+        self.last_shot = -math.inf
         
         # Gun system
         self.current_gun = GunType.PISTOL
@@ -318,6 +608,9 @@ class Player:
         return GUN_COOLDOWNS[self.current_gun]
     
     def update(self, dt: float, keys_pressed: pygame.key.ScancodeWrapper):
+        self.prev_x, self.prev_y = self.x, self.y
+        self.time_ms += dt * 1000
+        
         # Update dash cooldown
         if self.dash_cooldown_timer > 0:
             self.dash_cooldown_timer -= dt
@@ -329,7 +622,7 @@ class Player:
                 self.is_dashing = False
             else:
                 # Move quickly in dash direction
-                self.x += self.dash_direction * DASH_SPEED
+                self.x += self.dash_direction * DASH_SPEED * dt
                 # Add trail position
                 self.dash_trail_positions.append((self.x, self.y, 1.0))
                 # Keep player on screen
@@ -349,11 +642,11 @@ class Player:
         
         # Movement
         if keys_pressed[pygame.K_a] or keys_pressed[pygame.K_LEFT]:
-            self.x -= self.speed
+            self.x -= self.speed * dt
             self.moving = True
             self.move_direction = -1
         if keys_pressed[pygame.K_d] or keys_pressed[pygame.K_RIGHT]:
-            self.x += self.speed
+            self.x += self.speed * dt
             self.moving = True
             self.move_direction = 1
         
@@ -361,7 +654,7 @@ class Player:
         self.x = max(self.width // 2, min(SCREEN_WIDTH - self.width // 2, self.x))
         
         # Update power-up timers
-        current_time = pygame.time.get_ticks()
+        current_time = self.time_ms
         if self.rapid_fire and current_time > self.rapid_fire_end:
             self.rapid_fire = False
         if self.multi_shot and current_time > self.multi_shot_end:
@@ -383,15 +676,16 @@ class Player:
         return False
     
     def can_shoot(self) -> bool:
-        current_time = pygame.time.get_ticks()
+        current_time = self.time_ms
         cooldown = self.bullet_cooldown // 2 if self.rapid_fire else self.bullet_cooldown
         return current_time - self.last_shot >= cooldown
     
-    def shoot(self) -> List['Bullet']:
+    def shoot(self, pool: Optional['Pool'] = None) -> List['Bullet']:
         if not self.can_shoot():
             return []
         
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = self.time_ms
+        make_bullet = pool.acquire if pool else Bullet
         bullets = []
         
         if self.multi_shot:
@@ -401,14 +695,14 @@ class Player:
                 rad = math.radians(angle)
                 vx = math.cos(rad) * BULLET_SPEED
                 vy = math.sin(rad) * BULLET_SPEED
-                bullets.append(Bullet(self.x, self.y - 20, vx, vy))
+                bullets.append(make_bullet(self.x, self.y - 20, vx, vy))
         else:
-            bullets.append(Bullet(self.x, self.y - 20, 0, -BULLET_SPEED))
+            bullets.append(make_bullet(self.x, self.y - 20, 0, -BULLET_SPEED))
         
         return bullets
     
     def apply_powerup(self, powerup_type: PowerUpType):
-        current_time = pygame.time.get_ticks()
+        current_time = self.time_ms
         
         if powerup_type == PowerUpType.RAPID_FIRE:
             self.rapid_fire = True
@@ -437,11 +731,14 @@ class Player:
         return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2,
                           self.width, self.height)
     
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        
         # Draw dash trail
-        for tx, ty, alpha in self.dash_trail_positions:
+        for tx, ty, fade in self.dash_trail_positions:
             trail_surface = pygame.Surface((30, 35), pygame.SRCALPHA)
-            trail_alpha = int(alpha * 100)
+            trail_alpha = int(fade * 100)
             points = [
                 (15, 5),      # Top point
                 (0, 30),      # Bottom left
@@ -455,13 +752,13 @@ class Player:
             shield_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
             pygame.draw.circle(shield_surface, (*COLOR_POWERUP_SHIELD, 100), (30, 30), 28)
             pygame.draw.circle(shield_surface, (*COLOR_POWERUP_SHIELD, 150), (30, 30), 28, 2)
-            surface.blit(shield_surface, (int(self.x - 30), int(self.y - 30)))
+            surface.blit(shield_surface, (int(x - 30), int(y - 30)))
         
         # Draw ship body (triangle pointing up)
         points = [
-            (self.x, self.y - 20),      # Top point
-            (self.x - 15, self.y + 15), # Bottom left
-            (self.x + 15, self.y + 15)  # Bottom right
+            (x, y - 20),      # Top point
+            (x - 15, y + 15), # Bottom left
+            (x + 15, y + 15)  # Bottom right
         ]
         
         # Change color if dashing
@@ -475,9 +772,9 @@ class Player:
         if self.moving or self.is_dashing:
             flame_height = 8 + math.sin(self.engine_flame) * 4
             flame_points = [
-                (self.x - 8, self.y + 15),
-                (self.x, self.y + 15 + flame_height),
-                (self.x + 8, self.y + 15)
+                (x - 8, y + 15),
+                (x, y + 15 + flame_height),
+                (x + 8, y + 15)
             ]
             pygame.draw.polygon(surface, (255, 150, 0), flame_points)
 
@@ -488,17 +785,23 @@ class Player:
 
 class Bullet:
     def __init__(self, x: float, y: float, vx: float, vy: float):
+        self.reset(x, y, vx, vy)
+    
+    def reset(self, x: float, y: float, vx: float, vy: float):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.vx = vx
         self.vy = vy
         self.width = 4
         self.height = 12
         self.active = True
     
-    def update(self, dt: float, time_multiplier: float = 1.0):
-        self.x += self.vx * time_multiplier
-        self.y += self.vy * time_multiplier
+    def update(self, dt: float):
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.vx * dt
+        self.y += self.vy * dt
         
         # Deactivate if off screen
         if self.y < -self.height or self.y > SCREEN_HEIGHT + self.height:
@@ -510,12 +813,15 @@ class Bullet:
         return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2,
                           self.width, self.height)
     
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        
         # Draw bullet with trail effect
-        trail_rect = pygame.Rect(self.x - self.width // 2, self.y, self.width, self.height + 4)
+        trail_rect = pygame.Rect(x - self.width // 2, y, self.width, self.height + 4)
         pygame.draw.rect(surface, (255, 200, 0), trail_rect)
         
-        bullet_rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2,
+        bullet_rect = pygame.Rect(x - self.width // 2, y - self.height // 2,
                                   self.width, self.height)
         pygame.draw.rect(surface, COLOR_BULLET, bullet_rect)
 
@@ -524,10 +830,40 @@ class Bullet:
 # METEOR
 # =============================================================================
 
+def _meteor_shapes(seed: int = 0) -> dict:
+    """Irregular outlines, METEOR_SHAPES_PER_SIZE per size, from a fixed seed."""
+    rng = random.Random(seed)
+    shapes = {}
+    for size, radius in METEOR_RADIUS.items():
+        shapes[size] = []
+        for _ in range(METEOR_SHAPES_PER_SIZE):
+            num_vertices = rng.randint(5, 8)
+            shape = []
+            for i in range(num_vertices):
+                angle = (i / num_vertices) * math.pi * 2
+                # Random radius variation for irregular shape
+                r = radius * rng.uniform(0.7, 1.0)
+                shape.append((r * math.cos(angle), r * math.sin(angle)))
+            shapes[size].append(tuple(shape))
+    return shapes
+
+
+METEOR_SHAPES = _meteor_shapes()
+
+
 class Meteor:
-    def __init__(self, x: float, y: float, size: MeteorSize, speed_multiplier: float = 1.0):
+    def __init__(self, x: float, y: float, size: MeteorSize, speed_multiplier: float = 1.0,
+                 rng: random.Random = _default_rng):
+        self.vertices: List[Tuple[float, float]] = []
+        self.reset(x, y, size, speed_multiplier, rng)
+    
+    def reset(self, x: float, y: float, size: MeteorSize, speed_multiplier: float = 1.0,
+              rng: random.Random = _default_rng):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.rng = rng
         self.size = size
         self.radius = METEOR_RADIUS[size]
         self.health = METEOR_HEALTH[size]
@@ -535,32 +871,30 @@ class Meteor:
         
         # Speed based on size and wave multiplier
         base_speed = METEOR_SPEED_MULTIPLIER[size] * METEOR_BASE_SPEED * speed_multiplier
-        self.vy = base_speed + random.uniform(-0.5, 0.5)
-        self.vx = random.uniform(-0.5, 0.5)
+        self.vy = base_speed + rng.uniform(-30, 30)
+        self.vx = rng.uniform(-30, 30)
         
-        # Rotation
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
+        # Rotation (degrees per second)
+        self.rotation = rng.uniform(0, 360)
+        self.rotation_speed = rng.uniform(-120, 120)
         
-        # Generate irregular polygon shape
-        self.num_vertices = random.randint(5, 8)
-        self.vertices = self._generate_vertices()
+        # Pick one of the size's outlines, so sprites are shared between meteors
+        self._set_shape(rng.randrange(METEOR_SHAPES_PER_SIZE))
         
         self.active = True
     
-    def _generate_vertices(self) -> List[Tuple[float, float]]:
-        vertices = []
-        for i in range(self.num_vertices):
-            angle = (i / self.num_vertices) * math.pi * 2
-            # Random radius variation for irregular shape
-            r = self.radius * random.uniform(0.7, 1.0)
-            vertices.append((r * math.cos(angle), r * math.sin(angle)))
-        return vertices
+    def _set_shape(self, index: int):
+        """Copy a shape template into self.vertices in place, so a pooled meteor reuses its list."""
+        self.shape_id = (self.size, index)
+        shape = METEOR_SHAPES[self.size][index]
+        self.num_vertices = len(shape)
+        self.vertices[:] = shape
     
-    def update(self, dt: float, time_multiplier: float = 1.0):
-        self.x += self.vx * time_multiplier
-        self.y += self.vy * time_multiplier
-        self.rotation += self.rotation_speed * time_multiplier
+    def update(self, dt: float):
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.rotation += self.rotation_speed * dt
         
         # Keep within horizontal bounds
         if self.x < self.radius:
@@ -575,7 +909,7 @@ class Meteor:
         self.health -= 1
         return self.health <= 0
     
-    def split(self, speed_multiplier: float) -> List['Meteor']:
+    def split(self, speed_multiplier: float, pool: Optional['Pool'] = None) -> List['Meteor']:
         """Create smaller meteors when destroyed"""
         new_meteors = []
         
@@ -587,12 +921,14 @@ class Meteor:
             return new_meteors  # Small meteors don't split
         
         # Create 2 smaller meteors
+        make_meteor = pool.acquire if pool else Meteor
+        rng = self.rng
         for _ in range(2):
-            offset_x = random.uniform(-20, 20)
-            offset_y = random.uniform(-20, 20)
-            new_meteor = Meteor(self.x + offset_x, self.y + offset_y, new_size, speed_multiplier)
-            new_meteor.vx = random.uniform(-1.5, 1.5)
-            new_meteor.vy = random.uniform(1, 2)
+            offset_x = rng.uniform(-20, 20)
+            offset_y = rng.uniform(-20, 20)
+            new_meteor = make_meteor(self.x + offset_x, self.y + offset_y, new_size, speed_multiplier, rng)
+            new_meteor.vx = rng.uniform(-90, 90)
+            new_meteor.vy = rng.uniform(60, 120)
             new_meteors.append(new_meteor)
         
         return new_meteors
@@ -608,17 +944,28 @@ class Meteor:
             return COLOR_METEOR_MEDIUM
         return COLOR_METEOR_LARGE
     
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, sprites: Optional['MeteorSpriteCache'] = None,
+             alpha: float = 1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        if sprites is not None:
+            sprite, half = sprites.get(self)
+            surface.blit(sprite, (int(x) - half, int(y) - half))
+            return
+        self.draw_shape(surface, x, y, self.rotation)
+    
+    def draw_shape(self, surface: pygame.Surface, cx: float, cy: float, rotation: float):
+        """Draw the polygon and damage cracks centred on (cx, cy)."""
         # Calculate rotated vertices
         rotated_vertices = []
-        angle_rad = math.radians(self.rotation)
+        angle_rad = math.radians(rotation)
         cos_a = math.cos(angle_rad)
         sin_a = math.sin(angle_rad)
         
         for vx, vy in self.vertices:
             rx = vx * cos_a - vy * sin_a
             ry = vx * sin_a + vy * cos_a
-            rotated_vertices.append((self.x + rx, self.y + ry))
+            rotated_vertices.append((cx + rx, cy + ry))
         
         # Draw meteor body
         pygame.draw.polygon(surface, self.get_color(), rotated_vertices)
@@ -630,31 +977,89 @@ class Meteor:
             crack_color = (50, 50, 50)
             num_cracks = int((1 - damage_ratio) * 3) + 1
             for i in range(num_cracks):
-                angle = (i / num_cracks) * math.pi * 2 + self.rotation * 0.01
-                start = (self.x + math.cos(angle) * self.radius * 0.3,
-                        self.y + math.sin(angle) * self.radius * 0.3)
-                end = (self.x + math.cos(angle) * self.radius * 0.8,
-                      self.y + math.sin(angle) * self.radius * 0.8)
+                angle = (i / num_cracks) * math.pi * 2 + rotation * 0.01
+                start = (cx + math.cos(angle) * self.radius * 0.3,
+                        cy + math.sin(angle) * self.radius * 0.3)
+                end = (cx + math.cos(angle) * self.radius * 0.8,
+                      cy + math.sin(angle) * self.radius * 0.8)
                 pygame.draw.line(surface, crack_color, start, end, 2)
 
 
+class MeteorSpriteCache:
+    """Meteor sprites pre-rasterised at quantised rotation angles.
+
+    Each shape (a size's outline template, see Meteor.shape_id) gets one sprite
+    per damage state and rotation step, rendered on first use. Shapes are
+    evicted whole, least recently drawn first, once the cache holds more
+    than max_bytes of pixels.
+    """
+    
+    def __init__(self, steps: int = METEOR_ROTATION_STEPS, max_bytes: int = METEOR_SPRITE_CACHE_BYTES):
+        self.steps = steps
+        self.max_bytes = max_bytes
+        self.shapes: OrderedDict = OrderedDict()  # shape_id -> {(health, step): Surface}
+        self.nbytes = 0
+        self.misses = 0
+    
+    def get(self, meteor: Meteor) -> Tuple[pygame.Surface, int]:
+        """Return the sprite for the meteor's current state and its half-size."""
+        sprites = self.shapes.get(meteor.shape_id)
+        if sprites is None:
+            sprites = self.shapes[meteor.shape_id] = {}
+        else:
+            self.shapes.move_to_end(meteor.shape_id)
+        
+        step = round(meteor.rotation * self.steps / 360) % self.steps
+        half = meteor.radius + 2
+        key = (meteor.health, step)
+        sprite = sprites.get(key)
+        if sprite is None:
+            sprite = self._render(meteor, step * 360 / self.steps, half)
+            sprites[key] = sprite
+            self.nbytes += sprite.get_bytesize() * sprite.get_width() * sprite.get_height()
+            self.misses += 1
+            self._evict()
+        return sprite, half
+    
+    def _render(self, meteor: Meteor, rotation: float, half: int) -> pygame.Surface:
+        sprite = pygame.Surface((half * 2 + 1, half * 2 + 1))
+        sprite.fill(METEOR_COLORKEY)
+        meteor.draw_shape(sprite, half, half, rotation)
+        sprite.set_colorkey(METEOR_COLORKEY, pygame.RLEACCEL)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        return sprite
+    
+    def _evict(self):
+        while self.nbytes > self.max_bytes and len(self.shapes) > 1:
+            _, sprites = self.shapes.popitem(last=False)
+            for sprite in sprites.values():
+                self.nbytes -= sprite.get_bytesize() * sprite.get_width() * sprite.get_height()
+
+
 # =============================================================================
 # POWER-UP
 # =============================================================================
 
 class PowerUp:
-    def __init__(self, x: float, y: float, powerup_type: PowerUpType):
+    def __init__(self, x: float, y: float, powerup_type: PowerUpType, rng: random.Random = _default_rng):
+        self.reset(x, y, powerup_type, rng)
+    
+    def reset(self, x: float, y: float, powerup_type: PowerUpType, rng: random.Random = _default_rng):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.type = powerup_type
         self.radius = 15
         self.vy = POWERUP_SPEED
         self.active = True
-        self.pulse_time = random.uniform(0, math.pi * 2)
+        self.pulse_time = rng.uniform(0, math.pi * 2)
     
-    def update(self, dt: float, time_multiplier: float = 1.0):
-        self.y += self.vy * time_multiplier
-        self.pulse_time += dt * 5 * time_multiplier
+    def update(self, dt: float):
+        self.prev_x, self.prev_y = self.x, self.y
+        self.y += self.vy * dt
+        self.pulse_time += dt * 5
         
         if self.y > SCREEN_HEIGHT + self.radius:
             self.active = False
@@ -663,56 +1068,188 @@ class PowerUp:
         return pygame.Rect(self.x - self.radius, self.y - self.radius,
                           self.radius * 2, self.radius * 2)
     
-    def draw(self, surface: pygame.Surface):
-        # Pulsing glow effect
-        pulse = 0.8 + 0.2 * math.sin(self.pulse_time)
-        glow_radius = int(self.radius * 1.3 * pulse)
-        
-        # Draw glow
-        glow_surface = pygame.Surface((glow_radius * 2 + 10, glow_radius * 2 + 10), pygame.SRCALPHA)
+    # Glow sprites by (colour, radius) and icon sprites by type, shared by
+    # all power-ups. The pulse only spans a handful of whole-pixel radii.
+    _glows: dict = {}
+    _icons: dict = {}
+    
+    @classmethod
+    def glow_sprite(cls, color: Tuple[int, int, int], glow_radius: int) -> pygame.Surface:
+        sprite = cls._glows.get((color, glow_radius))
+        if sprite is None:
+            sprite = pygame.Surface((glow_radius * 2 + 10, glow_radius * 2 + 10), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, 50), (glow_radius + 5, glow_radius + 5), glow_radius)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            cls._glows[(color, glow_radius)] = sprite
+        return sprite
+    
+    @classmethod
+    def icon_sprite(cls, powerup_type: PowerUpType) -> pygame.Surface:
+        sprite = cls._icons.get(powerup_type)
+        if sprite is None:
+            sprite = get_font(24).render(POWERUP_ICONS[powerup_type], True, (255, 255, 255))
+            cls._icons[powerup_type] = sprite
+        return sprite
+    
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0, glow: int = 2):
+        """glow: 2 = pulsing, 1 = steady, 0 = none."""
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
         color = POWERUP_COLORS[self.type]
-        pygame.draw.circle(glow_surface, (*color, 50), 
-                          (glow_radius + 5, glow_radius + 5), glow_radius)
-        surface.blit(glow_surface, (int(self.x - glow_radius - 5), int(self.y - glow_radius - 5)))
+        
+        # Pulsing glow effect
+        if glow:
+            pulse = 0.8 + 0.2 * math.sin(self.pulse_time) if glow > 1 else 0.8
+            glow_radius = int(self.radius * 1.3 * pulse)
+            glow_surface = self.glow_sprite(color, glow_radius)
+            surface.blit(glow_surface, (int(x - glow_radius - 5), int(y - glow_radius - 5)))
         
         # Draw main circle
-        pygame.draw.circle(surface, color, (int(self.x), int(self.y)), self.radius)
-        pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), self.radius, 2)
+        pygame.draw.circle(surface, color, (int(x), int(y)), self.radius)
+        pygame.draw.circle(surface, (255, 255, 255), (int(x), int(y)), self.radius, 2)
         
         # Draw icon
-        font = pygame.font.Font(None, 24)
-        icon_text = POWERUP_ICONS[self.type]
-        text_surface = font.render(icon_text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(int(self.x), int(self.y)))
+        text_surface = self.icon_sprite(self.type)
+        text_rect = text_surface.get_rect(center=(int(x), int(y)))
         surface.blit(text_surface, text_rect)
 
 
+# =============================================================================
+# QUALITY GOVERNOR
+# =============================================================================
+
+@dataclass
+class QualityTier:
+    name: str
+    particle_scale: float  # fraction of each effect's particles spawned
+    glow: int              # power-up glow: 2 pulsing, 1 steady, 0 none
+    star_fraction: float   # fraction of the star field drawn
+
+
+QUALITY_TIERS = [
+    QualityTier("high", 1.0, 2, 1.0),
+    QualityTier("medium", 0.5, 2, 0.5),
+    QualityTier("low", 0.25, 1, 0.25),
+    QualityTier("minimal", 0.1, 0, 0.1),
+]
+
+
+class FrameGovernor:
+    """Trades visual detail for frame time.
+
+    record() takes each frame's update+draw time. When the average over
+    the last GOVERNOR_WINDOW frames exceeds the budget, quality drops one
+    tier; once it stays below GOVERNOR_RESTORE of the budget for
+    GOVERNOR_RESTORE_DELAY frames, it comes back up one tier. Each change
+    starts a fresh window, so one spike cannot move it twice.
+    """
+    
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS, window: int = GOVERNOR_WINDOW):
+        self.budget_ms = budget_ms
+        self.samples: deque = deque(maxlen=window)
+        self.total = 0.0
+        self.tier = 0
+        self.since_change = 0
+        self.changes = 0
+    
+    @property
+    def quality(self) -> QualityTier:
+        return QUALITY_TIERS[self.tier]
+    
+    @property
+    def average_ms(self) -> float:
+        return self.total / len(self.samples) if self.samples else 0.0
+    
+    @property
+    def peak_ms(self) -> float:
+        return max(self.samples, default=0.0)
+    
+    def record(self, frame_ms: float) -> bool:
+        """Add one frame's time; returns True if the tier changed."""
+        if len(self.samples) == self.samples.maxlen:
+            self.total -= self.samples[0]
+        self.samples.append(frame_ms)
+        self.total += frame_ms
+        self.since_change += 1
+        if len(self.samples) < self.samples.maxlen:
+            return False
+        
+        average = self.average_ms
+        if average > self.budget_ms and self.tier < len(QUALITY_TIERS) - 1:
+            self._set_tier(self.tier + 1)
+            return True
+        if (average < self.budget_ms * GOVERNOR_RESTORE and self.tier > 0
+                and self.since_change >= GOVERNOR_RESTORE_DELAY):
+            self._set_tier(self.tier - 1)
+            return True
+        return False
+    
+    def _set_tier(self, tier: int):
+        self.tier = tier
+        self.samples.clear()
+        self.total = 0.0
+        self.since_change = 0
+        self.changes += 1
+
+
 # =============================================================================
 # GAME
 # =============================================================================
 
 class Game:
-    def __init__(self):
+    # Class-level defaults also cover games built with Game.__new__ (tests, benchmarks).
+    seed: Optional[int] = None
+    tick_rate: int = TICK_RATE
+    star_count: int = STAR_COUNT
+    headless = False       # draw without flipping the display
+    invulnerable = False   # meteors that get through cost no lives
+    autopilot: Optional['Autopilot'] = None  # replaces keyboard and mouse input
+    governor: Optional[FrameGovernor] = None  # adapts quality to frame time in run()
+    
+    def __init__(self, seed: Optional[int] = None, tick_rate: int = TICK_RATE, headless: bool = False,
+                 star_count: int = STAR_COUNT, frame_budget_ms: Optional[float] = FRAME_BUDGET_MS):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.headless = headless
+        self.star_count = star_count
+        if frame_budget_ms:
+            self.governor = FrameGovernor(frame_budget_ms)
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Meteor Defender")
         self.clock = pygame.time.Clock()
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
-        self.font_tiny = pygame.font.Font(None, 24)
+        self.font_large = get_font(72)
+        self.font_medium = get_font(48)
+        self.font_small = get_font(32)
+        self.font_tiny = get_font(24)
+        self._labels: dict = {}    # slot -> ((text, colour, font), surface)
+        self._overlays: dict = {}  # rgba -> full-screen surface
+        self._hearts: Tuple[int, Optional[pygame.Surface]] = (0, None)
         
         self.state = GameState.TITLE_SCREEN
         self.high_score = 0
+        self.show_debug = False
         
         self.reset_game()
     
     def reset_game(self):
+        # Every random draw in a game comes from this generator, so a seed
+        # and the same inputs replay the same game.
+        self.rng = random.Random(self.seed)
         self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
         self.bullets: List[Bullet] = []
         self.meteors: List[Meteor] = []
         self.powerups: List[PowerUp] = []
-        self.particles = ParticleSystem()
-        self.star_field = StarField()
+        self.particles = ParticleSystem(seed=self.rng.getrandbits(64))
+        self.meteor_grid = SpatialHash()
+        self.meteor_sprites = MeteorSpriteCache()
+        self.bullet_pool: Pool[Bullet] = Pool(Bullet)
+        self.meteor_pool: Pool[Meteor] = Pool(Meteor)
+        self.powerup_pool: Pool[PowerUp] = Pool(PowerUp)
+        self.alloc_rate = 0.0
+        self._alloc_mark = 0
+        self._alloc_time = 0.0
+        self.star_field = StarField(self.star_count, self.rng)
         
         self.score = 0
         self.lives = 3
@@ -734,6 +1271,55 @@ class Game:
         self.shop_selected = 0
         
         self.running = True
+        self.apply_quality()
+    
+    def label(self, slot: str, font: pygame.font.Font, text: str,
+              color: Tuple[int, int, int]) -> pygame.Surface:
+        """Rendered text for one on-screen slot.
+
+        The surface is only re-rendered when the text or colour shown in
+        that slot changes, e.g. when the score goes up.
+        """
+        key = (text, color, font)
+        cached = self._labels.get(slot)
+        if cached is None or cached[0] != key:
+            cached = self._labels[slot] = (key, font.render(text, True, color))
+        return cached[1]
+    
+    def overlay(self, rgba: Tuple[int, int, int, int]) -> pygame.Surface:
+        """A full-screen translucent fill, built once per colour."""
+        surface = self._overlays.get(rgba)
+        if surface is None:
+            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            surface.fill(rgba)
+            self._overlays[rgba] = surface
+        return surface
+    
+    @property
+    def allocations(self) -> int:
+        """Entity objects constructed so far (pool misses)."""
+        return self.bullet_pool.allocations + self.meteor_pool.allocations + self.powerup_pool.allocations
+    
+    def update_debug_stats(self, dt: float):
+        self._alloc_time += dt
+        if self._alloc_time >= 1.0:
+            allocations = self.allocations
+            self.alloc_rate = (allocations - self._alloc_mark) / self._alloc_time
+            self._alloc_mark = allocations
+            self._alloc_time = 0.0
+    
+    @property
+    def quality(self) -> QualityTier:
+        return self.governor.quality if self.governor else QUALITY_TIERS[0]
+    
+    def apply_quality(self):
+        quality = self.quality
+        self.particles.spawn_scale = quality.particle_scale
+        self.star_field.set_density(quality.star_fraction)
+    
+    @property
+    def fixed_dt(self) -> float:
+        return 1.0 / self.tick_rate
     
     @property
     def time_multiplier(self) -> float:
@@ -747,7 +1333,10 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
             
-            if event.type == pygame.KEYDOWN:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.show_debug = not self.show_debug
+            
+            elif event.type == pygame.KEYDOWN:
                 if self.state == GameState.TITLE_SCREEN:
                     if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
                         self.reset_game()
@@ -758,7 +1347,7 @@ class Game:
                 elif self.state == GameState.PLAYING:
                     if event.key == pygame.K_f:
                         # Shoot with F key
-                        new_bullets = self.player.shoot()
+                        new_bullets = self.player.shoot(self.bullet_pool)
                         self.bullets.extend(new_bullets)
                     elif event.key == pygame.K_SPACE:
                         # Dash with Space
@@ -799,7 +1388,7 @@ class Game:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if self.state == GameState.PLAYING:
                     if event.button == 1:  # Left mouse button
-                        new_bullets = self.player.shoot()
+                        new_bullets = self.player.shoot(self.bullet_pool)
                         self.bullets.extend(new_bullets)
     
     def activate_time_slow(self):
@@ -848,15 +1437,17 @@ class Game:
         return True
     
     def update(self, dt: float):
-        if self.state not in [GameState.PLAYING, GameState.SHOP]:
-            self.star_field.update(dt)
+        """Advance the simulation by one fixed step of dt seconds."""
+        self.update_debug_stats(dt)
+        
+        # Stars hold still behind the pause and shop overlays
+        if self.state in (GameState.PAUSED, GameState.SHOP):
             return
         
         # Update star field
         self.star_field.update(dt)
         
-        # If in shop, don't update game objects
-        if self.state == GameState.SHOP:
+        if self.state != GameState.PLAYING:
             return
         
         # Update time slow
@@ -869,51 +1460,59 @@ class Game:
             self.time_slow_cooldown_timer -= dt
         
         # Get pressed keys
-        keys = pygame.key.get_pressed()
+        if self.autopilot is not None:
+            keys = self.autopilot.act(self)
+            mouse_held = False
+        else:
+            keys = pygame.key.get_pressed()
+            mouse_held = pygame.mouse.get_pressed()[0]
         
         # Update player (player always moves at normal speed)
         self.player.update(dt, keys)
         
         # Continuous shooting while F or left mouse is held
-        if keys[pygame.K_f] or pygame.mouse.get_pressed()[0]:
-            new_bullets = self.player.shoot()
+        if keys[pygame.K_f] or mouse_held:
+            new_bullets = self.player.shoot(self.bullet_pool)
             self.bullets.extend(new_bullets)
         
         # Create dash trail particles
         if self.player.is_dashing:
             self.particles.create_dash_trail(self.player.x, self.player.y, COLOR_DASH)
         
+        # Everything but the player runs on slowed time
+        world_dt = dt * self.time_multiplier
+        
         # Update bullets (affected by time slow)
-        for bullet in self.bullets[:]:
-            bullet.update(dt, self.time_multiplier)
-            if not bullet.active:
-                self.bullets.remove(bullet)
+        for bullet in self.bullets:
+            bullet.update(world_dt)
+        self.bullet_pool.compact(self.bullets)
         
         # Update meteors (affected by time slow)
-        for meteor in self.meteors[:]:
-            meteor.update(dt, self.time_multiplier)
+        for meteor in self.meteors:
+            meteor.update(world_dt)
             
             # Check if meteor reached bottom
             if meteor.y > SCREEN_HEIGHT + meteor.radius:
-                self.meteors.remove(meteor)
-                self.lives -= 1
+                meteor.active = False
+                if not self.invulnerable:
+                    self.lives -= 1
                 if self.lives <= 0:
                     self.game_over()
                     return
+        self.meteor_pool.compact(self.meteors)
         
         # Update power-ups (affected by time slow)
-        for powerup in self.powerups[:]:
-            powerup.update(dt, self.time_multiplier)
-            if not powerup.active:
-                self.powerups.remove(powerup)
+        for powerup in self.powerups:
+            powerup.update(world_dt)
+        self.powerup_pool.compact(self.powerups)
         
         # Update particles
-        self.particles.update(dt, self.time_multiplier)
+        self.particles.update(world_dt)
         
         # Spawn meteors (affected by time slow)
-        self.spawn_timer += dt * self.time_multiplier
+        self.spawn_timer += world_dt
         if self.spawn_timer >= self.spawn_delay:
-            self.spawn_timer = 0
+            self.spawn_timer -= self.spawn_delay
             self.spawn_meteor()
         
         # Check collisions
@@ -924,14 +1523,14 @@ class Game:
             self.next_wave()
     
     def spawn_meteor(self):
-        x = random.randint(50, SCREEN_WIDTH - 50)
+        x = self.rng.randint(50, SCREEN_WIDTH - 50)
         y = -50
         
         # Determine meteor size based on wave
         large_chance = min(0.3, self.wave * 0.02)
         medium_chance = min(0.5, 0.2 + self.wave * 0.03)
         
-        rand = random.random()
+        rand = self.rng.random()
         if rand < large_chance:
             size = MeteorSize.LARGE
         elif rand < large_chance + medium_chance:
@@ -939,59 +1538,75 @@ class Game:
         else:
             size = MeteorSize.SMALL
         
-        self.meteors.append(Meteor(x, y, size, self.speed_multiplier))
+        self.meteors.append(self.meteor_pool.acquire(x, y, size, self.speed_multiplier, self.rng))
     
     def check_collisions(self):
-        # Bullet-Meteor collisions
-        for bullet in self.bullets[:]:
+        # Broadphase: bucket meteors by grid cell so each bullet is only
+        # tested against the meteors near its path. Removals are deferred
+        # to the end of the pass.
+        grid = self.meteor_grid
+        grid.clear()
+        for meteor in self.meteors:
+            # Cover the whole circle swept this tick
+            dx = meteor.x - meteor.prev_x
+            dy = meteor.y - meteor.prev_y
+            grid.insert(meteor, meteor.x - dx / 2, meteor.y - dy / 2,
+                        meteor.radius + math.hypot(dx, dy) / 2)
+        
+        # Bullet-Meteor collisions, swept over the tick: each bullet's path
+        # is taken relative to each nearby meteor's own motion, so a fast
+        # bullet cannot jump over a meteor between two steps. The meteor
+        # it reaches first takes the hit.
+        new_meteors = []
+        for bullet in self.bullets:
             if not bullet.active:
                 continue
             
-            bullet_rect = bullet.get_rect()
-            
-            for meteor in self.meteors[:]:
+            hit = None
+            hit_t = 2.0
+            for meteor in grid.query_segment(bullet.prev_x, bullet.prev_y, bullet.x, bullet.y):
                 if not meteor.active:
                     continue
+                t = segment_circle_time(bullet.prev_x - meteor.prev_x, bullet.prev_y - meteor.prev_y,
+                                        bullet.x - meteor.x, bullet.y - meteor.y, meteor.radius)
+                if t is not None and t < hit_t:
+                    hit, hit_t = meteor, t
+            
+            if hit is None:
+                continue
+            meteor = hit
+            bullet.active = False
+            
+            if meteor.hit():
+                # Meteor destroyed
+                meteor.active = False
+                self.score += METEOR_POINTS[meteor.size]
+                self.meteors_destroyed += 1
                 
-                # Simple circle-rect collision
-                meteor_rect = meteor.get_rect()
-                if bullet_rect.colliderect(meteor_rect):
-                    bullet.active = False
-                    self.bullets.remove(bullet)
-                    
-                    if meteor.hit():
-                        # Meteor destroyed
-                        self.score += METEOR_POINTS[meteor.size]
-                        self.meteors_destroyed += 1
-                        
-                        # Create explosion
-                        self.particles.create_explosion(
-                            meteor.x, meteor.y, meteor.get_color(),
-                            num_particles=20, speed=6
-                        )
-                        
-                        # Split meteor
-                        new_meteors = meteor.split(self.speed_multiplier)
-                        self.meteors.extend(new_meteors)
-                        
-                        # Maybe drop power-up
-                        if random.random() < POWERUP_DROP_CHANCE:
-                            self.spawn_powerup(meteor.x, meteor.y)
-                        
-                        self.meteors.remove(meteor)
-                    else:
-                        # Meteor damaged - small particle effect
-                        self.particles.create_explosion(
-                            bullet.x, bullet.y, (255, 200, 0),
-                            num_particles=5, speed=3
-                        )
-                    break
+                # Create explosion
+                self.particles.create_explosion(
+                    meteor.x, meteor.y, meteor.get_color(),
+                    num_particles=20, speed=360
+                )
+                
+                # Split meteor
+                new_meteors.extend(meteor.split(self.speed_multiplier, self.meteor_pool))
+                
+                # Maybe drop power-up
+                if self.rng.random() < POWERUP_DROP_CHANCE:
+                    self.spawn_powerup(meteor.x, meteor.y)
+            else:
+                # Meteor damaged - small particle effect where the bullet struck
+                self.particles.create_explosion(
+                    lerp(bullet.prev_x, bullet.x, hit_t), lerp(bullet.prev_y, bullet.y, hit_t),
+                    (255, 200, 0), num_particles=5, speed=180
+                )
         
         # Player-PowerUp collisions
         player_rect = self.player.get_rect()
         
-        for powerup in self.powerups[:]:
-            if player_rect.colliderect(powerup.get_rect()):
+        for powerup in self.powerups:
+            if powerup.active and player_rect.colliderect(powerup.get_rect()):
                 self.score += 20  # Points for collecting power-up
                 
                 if powerup.type == PowerUpType.EXTRA_LIFE:
@@ -999,21 +1614,29 @@ class Game:
                 else:
                     self.player.apply_powerup(powerup.type)
                 
-                self.powerups.remove(powerup)
+                powerup.active = False
         
         # Player-Meteor collisions (with shield)
         if self.player.shield:
-            for meteor in self.meteors[:]:
-                dist = math.sqrt((self.player.x - meteor.x) ** 2 + 
-                               (self.player.y - meteor.y) ** 2)
-                if dist < meteor.radius + 25:  # Shield radius
+            reach = SHIELD_RADIUS + max(METEOR_RADIUS.values())
+            for meteor in grid.query_circle(self.player.x, self.player.y, reach):
+                if not meteor.active:
+                    continue
+                dist = math.hypot(self.player.x - meteor.x, self.player.y - meteor.y)
+                if dist < meteor.radius + SHIELD_RADIUS:
                     self.player.shield = False
                     self.particles.create_explosion(
                         meteor.x, meteor.y, meteor.get_color(),
-                        num_particles=20, speed=6
+                        num_particles=20, speed=360
                     )
-                    self.meteors.remove(meteor)
+                    meteor.active = False
                     break
+        
+        # Deferred removal
+        self.bullet_pool.compact(self.bullets)
+        self.meteor_pool.compact(self.meteors)
+        self.meteors.extend(new_meteors)
+        self.powerup_pool.compact(self.powerups)
     
     def spawn_powerup(self, x: float, y: float):
         # Weight power-up types
@@ -1025,13 +1648,13 @@ class Game:
         }
         
         total = sum(weights.values())
-        rand = random.randint(1, total)
+        rand = self.rng.randint(1, total)
         cumulative = 0
         
         for powerup_type, weight in weights.items():
             cumulative += weight
             if rand <= cumulative:
-                self.powerups.append(PowerUp(x, y, powerup_type))
+                self.powerups.append(self.powerup_pool.acquire(x, y, powerup_type, self.rng))
                 break
     
     def next_wave(self):
@@ -1051,16 +1674,16 @@ class Game:
         if self.score > self.high_score:
             self.high_score = self.score
     
-    def draw(self):
+    def draw(self, alpha: float = 1.0):
+        """Render the current state; alpha blends moving objects from their
+        previous step's position (0) to the current one (1)."""
         # Clear screen
         self.screen.fill(COLOR_BACKGROUND)
         
         # Draw time slow border effect
         if self.time_slow_active:
             # Draw blue tinted border
-            border_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(border_surface, (*COLOR_TIME_SLOW, 30), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(border_surface, (0, 0))
+            self.screen.blit(self.overlay((*COLOR_TIME_SLOW, 30)), (0, 0))
             # Draw border
             pygame.draw.rect(self.screen, COLOR_TIME_SLOW, (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), 5)
         
@@ -1070,33 +1693,37 @@ class Game:
         if self.state == GameState.TITLE_SCREEN:
             self.draw_title_screen()
         elif self.state == GameState.PLAYING:
-            self.draw_game()
+            self.draw_game(alpha)
         elif self.state == GameState.SHOP:
-            self.draw_game()
+            self.draw_game(alpha)
             self.draw_shop_overlay()
         elif self.state == GameState.PAUSED:
-            self.draw_game()
+            self.draw_game(alpha)
             self.draw_pause_overlay()
         elif self.state == GameState.GAME_OVER:
-            self.draw_game()
+            self.draw_game(alpha)
             self.draw_game_over_overlay()
         
-        pygame.display.flip()
+        if self.show_debug:
+            self.draw_debug_overlay()
+        
+        if not self.headless:
+            pygame.display.flip()
     
     def draw_title_screen(self):
         # Title
-        title_text = self.font_large.render("METEOR DEFENDER", True, COLOR_PLAYER)
+        title_text = self.label("title", self.font_large, "METEOR DEFENDER", COLOR_PLAYER)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
         self.screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font_small.render("Defend Earth from the meteor storm!", True, COLOR_TEXT)
+        subtitle_text = self.label("title.subtitle", self.font_small, "Defend Earth from the meteor storm!", COLOR_TEXT)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(subtitle_text, subtitle_rect)
         
         # High score
         if self.high_score > 0:
-            hs_text = self.font_medium.render(f"High Score: {self.high_score}", True, COLOR_SCORE)
+            hs_text = self.label("title.high_score", self.font_medium, f"High Score: {self.high_score}", COLOR_SCORE)
             hs_rect = hs_text.get_rect(center=(SCREEN_WIDTH // 2, 270))
             self.screen.blit(hs_text, hs_rect)
         
@@ -1116,23 +1743,23 @@ class Game:
         y_offset = 330
         for line in controls:
             color = COLOR_SCORE if "SPACE" in line else COLOR_TEXT
-            text = self.font_small.render(line, True, color)
+            text = self.label(f"title.{y_offset}", self.font_small, line, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 30
     
-    def draw_game(self):
+    def draw_game(self, alpha: float = 1.0):
         # Draw game objects
         for bullet in self.bullets:
-            bullet.draw(self.screen)
+            bullet.draw(self.screen, alpha)
         
         for meteor in self.meteors:
-            meteor.draw(self.screen)
+            meteor.draw(self.screen, self.meteor_sprites, alpha)
         
         for powerup in self.powerups:
-            powerup.draw(self.screen)
+            powerup.draw(self.screen, alpha, self.quality.glow)
         
-        self.player.draw(self.screen)
+        self.player.draw(self.screen, alpha)
         self.particles.draw(self.screen)
         
         # Draw UI
@@ -1140,40 +1767,45 @@ class Game:
     
     def draw_ui(self):
         # Score
-        score_text = self.font_small.render(f"SCORE: {self.score}", True, COLOR_SCORE)
+        score_text = self.label("hud.score", self.font_small, f"SCORE: {self.score}", COLOR_SCORE)
         self.screen.blit(score_text, (20, 20))
         
         # Wave
-        wave_text = self.font_small.render(f"WAVE {self.wave}", True, COLOR_TEXT)
+        wave_text = self.label("hud.wave", self.font_small, f"WAVE {self.wave}", COLOR_TEXT)
         wave_rect = wave_text.get_rect(center=(SCREEN_WIDTH // 2, 20))
         self.screen.blit(wave_text, wave_rect)
         
-        # Lives (hearts)
-        for i in range(self.lives):
-            heart_x = SCREEN_WIDTH - 40 - (i * 35)
-            self.draw_heart(heart_x, 25, 12)
+        # Lives (hearts), redrawn only when the count changes
+        lives, hearts = self._hearts
+        if hearts is None or lives != self.lives:
+            hearts = pygame.Surface((SCREEN_WIDTH, 40), pygame.SRCALPHA)
+            for i in range(min(self.lives, SCREEN_WIDTH // 35)):
+                heart_x = SCREEN_WIDTH - 40 - (i * 35)
+                self.draw_heart(hearts, heart_x, 25, 12)
+            self._hearts = (self.lives, hearts)
+        self.screen.blit(hearts, (0, 0))
         
         # Current gun indicator
-        gun_text = self.font_tiny.render(f"Gun: {GUN_NAMES[self.player.current_gun]}", True, COLOR_TEXT)
+        gun_text = self.label("hud.gun", self.font_tiny, f"Gun: {GUN_NAMES[self.player.current_gun]}", COLOR_TEXT)
         self.screen.blit(gun_text, (20, 50))
         
         # Dash cooldown
         y_offset = 75
         if self.player.dash_cooldown_timer > 0:
             dash_ready = max(0, self.player.dash_cooldown_timer)
-            dash_text = self.font_tiny.render(f"Dash: {dash_ready:.1f}s", True, (150, 150, 150))
+            dash_text = self.label("hud.dash", self.font_tiny, f"Dash: {dash_ready:.1f}s", (150, 150, 150))
         else:
-            dash_text = self.font_tiny.render("Dash: READY", True, COLOR_DASH)
+            dash_text = self.label("hud.dash", self.font_tiny, "Dash: READY", COLOR_DASH)
         self.screen.blit(dash_text, (20, y_offset))
         y_offset += 20
         
         # Time slow cooldown
         if self.time_slow_active:
-            time_text = self.font_tiny.render(f"Time Slow: {self.time_slow_timer:.1f}s", True, COLOR_TIME_SLOW)
+            time_text = self.label("hud.time", self.font_tiny, f"Time Slow: {self.time_slow_timer:.1f}s", COLOR_TIME_SLOW)
         elif self.time_slow_cooldown_timer > 0:
-            time_text = self.font_tiny.render(f"Time Slow: {self.time_slow_cooldown_timer:.1f}s", True, (150, 150, 150))
+            time_text = self.label("hud.time", self.font_tiny, f"Time Slow: {self.time_slow_cooldown_timer:.1f}s", (150, 150, 150))
         else:
-            time_text = self.font_tiny.render("Time Slow: READY", True, COLOR_TIME_SLOW)
+            time_text = self.label("hud.time", self.font_tiny, "Time Slow: READY", COLOR_TIME_SLOW)
         self.screen.blit(time_text, (20, y_offset))
         y_offset += 20
         
@@ -1188,36 +1820,57 @@ class Game:
         if self.player.multi_shot:
             self.draw_powerup_indicator("MULTI-SHOT", COLOR_POWERUP_MULTISHOT, powerup_y)
     
-    def draw_heart(self, x: float, y: float, size: float):
+    def draw_heart(self, surface: pygame.Surface, x: float, y: float, size: float):
         """Draw a heart shape"""
         # Two circles for top of heart
-        pygame.draw.circle(self.screen, COLOR_LIVES, (int(x - size/2), int(y)), int(size/2))
-        pygame.draw.circle(self.screen, COLOR_LIVES, (int(x + size/2), int(y)), int(size/2))
+        pygame.draw.circle(surface, COLOR_LIVES, (int(x - size/2), int(y)), int(size/2))
+        pygame.draw.circle(surface, COLOR_LIVES, (int(x + size/2), int(y)), int(size/2))
         # Triangle for bottom of heart
         points = [
             (x - size, y),
             (x + size, y),
             (x, y + size)
         ]
-        pygame.draw.polygon(self.screen, COLOR_LIVES, points)
+        pygame.draw.polygon(surface, COLOR_LIVES, points)
     
     def draw_powerup_indicator(self, text: str, color: Tuple[int, int, int], y: int):
-        indicator = self.font_small.render(text, True, color)
+        indicator = self.label(f"hud.indicator.{y}", self.font_small, text, color)
         self.screen.blit(indicator, (20, y))
     
+    def draw_debug_overlay(self):
+        """F3 overlay: frame rate, allocation rate and pool occupancy."""
+        lines = [
+            f"FPS: {self.clock.get_fps():.0f}",
+            f"Allocs/s: {self.alloc_rate:.1f}  (total {self.allocations})",
+            f"Bullets: {len(self.bullets)} live, {len(self.bullet_pool.free)} free",
+            f"Meteors: {len(self.meteors)} live, {len(self.meteor_pool.free)} free",
+            f"Power-ups: {len(self.powerups)} live, {len(self.powerup_pool.free)} free",
+            f"Particles: {len(self.particles)}",
+        ]
+        if self.governor:
+            governor = self.governor
+            lines += [
+                f"Quality: {governor.quality.name} (tier {governor.tier}, {governor.changes} changes)",
+                f"Frame: {governor.average_ms:.1f} avg, {governor.peak_ms:.1f} peak "
+                f"/ {governor.budget_ms:.1f} ms",
+            ]
+        panel = pygame.Surface((300, len(lines) * 18 + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        for i, line in enumerate(lines):
+            panel.blit(self.label(f"debug.{i}", self.font_tiny, line, COLOR_TEXT), (6, 5 + i * 18))
+        self.screen.blit(panel, (10, SCREEN_HEIGHT - panel.get_height() - 10))
+    
     def draw_shop_overlay(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay((0, 0, 0, 200)), (0, 0))
         
         # Shop title
-        title_text = self.font_large.render("SHOP", True, COLOR_SCORE)
+        title_text = self.label("shop.title", self.font_large, "SHOP", COLOR_SCORE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 60))
         self.screen.blit(title_text, title_rect)
         
         # Current score
-        score_text = self.font_medium.render(f"Score: {self.score}", True, COLOR_SCORE)
+        score_text = self.label("shop.score", self.font_medium, f"Score: {self.score}", COLOR_SCORE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 110))
         self.screen.blit(score_text, score_rect)
         
@@ -1261,99 +1914,504 @@ class Game:
                 color = (150, 100, 100)
                 status = ""
             
-            name_text = self.font_small.render(f"{item['name']}{status}", True, color)
+            name_text = self.label(f"shop.name.{i}", self.font_small, f"{item['name']}{status}", color)
             self.screen.blit(name_text, (170, y_offset))
             
-            price_text = self.font_small.render(f"{item['price']} pts", True, color)
+            price_text = self.label(f"shop.price.{i}", self.font_small, f"{item['price']} pts", color)
             self.screen.blit(price_text, (500, y_offset))
             
             # Description
-            desc_text = self.font_tiny.render(item['description'], True, (150, 150, 150))
+            desc_text = self.label(f"shop.desc.{i}", self.font_tiny, item['description'], (150, 150, 150))
             self.screen.blit(desc_text, (170, y_offset + 22))
             
             y_offset += 55
         
         # Instructions
-        inst_text = self.font_tiny.render("UP/DOWN: Select | ENTER: Buy | T/ESC: Close", True, COLOR_TEXT)
+        inst_text = self.label("shop.help", self.font_tiny, "UP/DOWN: Select | ENTER: Buy | T/ESC: Close", COLOR_TEXT)
         inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
         self.screen.blit(inst_text, inst_rect)
         
         # Current gun display
-        gun_text = self.font_small.render(f"Equipped: {GUN_NAMES[self.player.current_gun]}", True, COLOR_PLAYER)
+        gun_text = self.label("shop.gun", self.font_small, f"Equipped: {GUN_NAMES[self.player.current_gun]}", COLOR_PLAYER)
         gun_rect = gun_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
         self.screen.blit(gun_text, gun_rect)
     
     def draw_pause_overlay(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay((0, 0, 0, 150)), (0, 0))
         
         # Pause text
-        pause_text = self.font_large.render("PAUSED", True, COLOR_TEXT)
+        pause_text = self.label("pause.title", self.font_large, "PAUSED", COLOR_TEXT)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         self.screen.blit(pause_text, pause_rect)
         
         # Instructions
-        resume_text = self.font_small.render("Press P or ESC to Resume", True, COLOR_TEXT)
+        resume_text = self.label("pause.resume", self.font_small, "Press P or ESC to Resume", COLOR_TEXT)
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
         self.screen.blit(resume_text, resume_rect)
         
-        quit_text = self.font_small.render("Press Q to Quit to Title", True, COLOR_TEXT)
+        quit_text = self.label("pause.quit", self.font_small, "Press Q to Quit to Title", COLOR_TEXT)
         quit_rect = quit_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         self.screen.blit(quit_text, quit_rect)
     
     def draw_game_over_overlay(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay((0, 0, 0, 180)), (0, 0))
         
         # Game Over text
-        go_text = self.font_large.render("GAME OVER", True, COLOR_LIVES)
+        go_text = self.label("game_over.title", self.font_large, "GAME OVER", COLOR_LIVES)
         go_rect = go_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
         self.screen.blit(go_text, go_rect)
         
         # Final score
-        score_text = self.font_medium.render(f"Final Score: {self.score}", True, COLOR_SCORE)
+        score_text = self.label("game_over.score", self.font_medium, f"Final Score: {self.score}", COLOR_SCORE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
         self.screen.blit(score_text, score_rect)
         
         # High score notification
         if self.score >= self.high_score and self.score > 0:
-            hs_text = self.font_small.render("NEW HIGH SCORE!", True, COLOR_SCORE)
+            hs_text = self.label("game_over.high_score", self.font_small, "NEW HIGH SCORE!", COLOR_SCORE)
             hs_rect = hs_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
             self.screen.blit(hs_text, hs_rect)
         
         # Wave reached
-        wave_text = self.font_small.render(f"Wave Reached: {self.wave}", True, COLOR_TEXT)
+        wave_text = self.label("game_over.wave", self.font_small, f"Wave Reached: {self.wave}", COLOR_TEXT)
         wave_rect = wave_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         self.screen.blit(wave_text, wave_rect)
         
         # Instructions
-        restart_text = self.font_small.render("Press R to Restart", True, COLOR_TEXT)
+        restart_text = self.label("game_over.restart", self.font_small, "Press R to Restart", COLOR_TEXT)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
         self.screen.blit(restart_text, restart_rect)
         
-        quit_text = self.font_small.render("Press Q to Quit to Title", True, COLOR_TEXT)
+        quit_text = self.label("game_over.quit", self.font_small, "Press Q to Quit to Title", COLOR_TEXT)
         quit_rect = quit_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 160))
         self.screen.blit(quit_text, quit_rect)
     
     def run(self):
+        # Fixed-timestep loop: the simulation advances in steps of exactly
+        # fixed_dt, as many as the elapsed time allows, and the frame is
+        # drawn between the last two steps.
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            frame_time = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            work_start = time.perf_counter()
             
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            while accumulator >= self.fixed_dt:
+                self.update(self.fixed_dt)
+                accumulator -= self.fixed_dt
+            
+            alpha = accumulator / self.fixed_dt if self.state == GameState.PLAYING else 1.0
+            self.draw(alpha)
+            
+            if self.governor and self.governor.record((time.perf_counter() - work_start) * 1000):
+                self.apply_quality()
         
         pygame.quit()
 
 
+# =============================================================================
+# AUTOPILOT
+# =============================================================================
+
+class Autopilot:
+    """Scripted player for headless runs.
+
+    Every tick it steers under the nearest meteor above the ship, leading
+    it by the bullet's flight time, and holds fire. It dashes towards
+    targets that are far away, slows time when meteors pile up near the
+    bottom, and spends its score on SHOP_ITEMS in a fixed order. It uses
+    no randomness, so a seeded game plays out the same every run.
+    """
+    
+    SHOPPING_LIST = (
+        ShopItemType.GUN_SMG,
+        ShopItemType.GUN_RIFLE,
+        ShopItemType.POWERUP_MULTI_SHOT,
+        ShopItemType.POWERUP_RAPID_FIRE,
+    )
+    GUNS = {ShopItemType.GUN_SMG: GunType.SMG, ShopItemType.GUN_RIFLE: GunType.RIFLE}
+    DEADBAND = 4         # pixels of aiming error to tolerate
+    DASH_DISTANCE = 250  # dash when the target is further away than this
+    DANGER_LINE = SCREEN_HEIGHT * 2 // 3
+    
+    def __init__(self):
+        self.dashes = 0
+        self.purchases: List[ShopItemType] = []
+    
+    def act(self, game: 'Game') -> dict:
+        """Decide this tick's input; returns the held keys."""
+        self.shop(game)
+        keys: dict = defaultdict(bool)
+        player = game.player
+        target = self.target(game)
+        if target is None:
+            return keys
+        
+        keys[pygame.K_f] = True
+        lead = (player.y - target.y) / BULLET_SPEED
+        dx = target.x + target.vx * lead - player.x
+        if dx < -self.DEADBAND:
+            keys[pygame.K_a] = True
+        elif dx > self.DEADBAND:
+            keys[pygame.K_d] = True
+        
+        # dash() goes the way the ship moved last tick
+        if abs(dx) > self.DASH_DISTANCE and player.move_direction * dx > 0 and player.dash():
+            self.dashes += 1
+        
+        if sum(meteor.y > self.DANGER_LINE for meteor in game.meteors) >= 3:
+            game.activate_time_slow()
+        return keys
+    
+    @staticmethod
+    def target(game: 'Game') -> Optional[Meteor]:
+        player = game.player
+        above = [meteor for meteor in game.meteors if meteor.y < player.y - 20]
+        if not above:
+            return None
+        return min(above, key=lambda m: (m.x - player.x) ** 2 + (m.y - player.y) ** 2)
+    
+    def shop(self, game: 'Game'):
+        player = game.player
+        for item in self.SHOPPING_LIST:
+            if item == ShopItemType.POWERUP_MULTI_SHOT and player.multi_shot:
+                continue
+            if item == ShopItemType.POWERUP_RAPID_FIRE and player.rapid_fire:
+                continue
+            if self.GUNS.get(item) in player.owned_guns:
+                continue
+            if game.buy_shop_item(item):
+                self.purchases.append(item)
+            return  # one purchase per tick, or save up for the first item still wanted
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def benchmark_particles(count: int = PARTICLE_CAPACITY, frames: int = 300) -> float:
+    """Keep `count` particles alive and return the mean update+draw time in ms."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    particles = ParticleSystem(capacity=count)
+    rng = random.Random(0)
+    colors = [COLOR_METEOR_SMALL, COLOR_METEOR_MEDIUM, COLOR_METEOR_LARGE, (255, 200, 0)]
+    elapsed = 0.0
+    for _ in range(frames):
+        while len(particles) < count:
+            particles.create_explosion(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                                       rng.choice(colors), num_particles=20, speed=360)
+        surface.fill(COLOR_BACKGROUND)
+        start = time.perf_counter()
+        particles.update(1 / FPS)
+        particles.draw(surface)
+        elapsed += time.perf_counter() - start
+    ms = elapsed / frames * 1000
+    print(f"{count} particles: {ms:.2f} ms per frame (budget {1000 / FPS:.1f} ms)")
+    return ms
+
+
+def _legacy_check_collisions(game: 'Game'):
+    """The original all-pairs collision pass, kept for comparison."""
+    for bullet in game.bullets[:]:
+        if not bullet.active:
+            continue
+        bullet_rect = bullet.get_rect()
+        for meteor in game.meteors[:]:
+            if not meteor.active:
+                continue
+            if bullet_rect.colliderect(meteor.get_rect()):
+                bullet.active = False
+                game.bullets.remove(bullet)
+                if meteor.hit():
+                    game.score += METEOR_POINTS[meteor.size]
+                    game.meteors_destroyed += 1
+                    game.particles.create_explosion(meteor.x, meteor.y, meteor.get_color(),
+                                                    num_particles=20, speed=6)
+                    game.meteors.extend(meteor.split(game.speed_multiplier))
+                    if random.random() < POWERUP_DROP_CHANCE:
+                        game.spawn_powerup(meteor.x, meteor.y)
+                    game.meteors.remove(meteor)
+                else:
+                    game.particles.create_explosion(bullet.x, bullet.y, (255, 200, 0),
+                                                    num_particles=5, speed=3)
+                break
+    player_rect = game.player.get_rect()
+    for powerup in game.powerups[:]:
+        if player_rect.colliderect(powerup.get_rect()):
+            game.score += 20
+            if powerup.type == PowerUpType.EXTRA_LIFE:
+                game.lives = min(5, game.lives + 1)
+            else:
+                game.player.apply_powerup(powerup.type)
+            game.powerups.remove(powerup)
+    if game.player.shield:
+        for meteor in game.meteors[:]:
+            dist = math.sqrt((game.player.x - meteor.x) ** 2 + (game.player.y - meteor.y) ** 2)
+            if dist < meteor.radius + SHIELD_RADIUS:
+                game.player.shield = False
+                game.particles.create_explosion(meteor.x, meteor.y, meteor.get_color(),
+                                                num_particles=20, speed=6)
+                game.meteors.remove(meteor)
+                break
+
+
+def benchmark_collisions(meteor_counts=(50, 200, 1000), bullets: int = 120, reps: int = 50):
+    """Time one collision pass, all-pairs vs spatial hash, on seeded scenes."""
+    def scene(count: int, seed: int) -> 'Game':
+        game = Game.__new__(Game)  # no window needed
+        game.seed = seed
+        game.reset_game()
+        rng = game.rng
+        game.meteors = [
+            Meteor(rng.uniform(40, SCREEN_WIDTH - 40), rng.uniform(-40, SCREEN_HEIGHT - 100),
+                   rng.choice(list(MeteorSize)), rng=rng)
+            for _ in range(count)
+        ]
+        game.bullets = [
+            Bullet(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), 0, -BULLET_SPEED)
+            for _ in range(bullets)
+        ]
+        return game
+
+    print(f"{'meteors':>7} {'all-pairs ms':>13} {'hashed ms':>10} {'speedup':>8}")
+    results = []
+    for count in meteor_counts:
+        timings = []
+        for run in (_legacy_check_collisions, Game.check_collisions):
+            elapsed = 0.0
+            for rep in range(reps):
+                game = scene(count, rep)
+                start = time.perf_counter()
+                run(game)
+                elapsed += time.perf_counter() - start
+            timings.append(elapsed / reps * 1000)
+        legacy, hashed = timings
+        results.append((count, legacy, hashed))
+        print(f"{count:>7} {legacy:>13.3f} {hashed:>10.3f} {legacy / hashed:>7.1f}x")
+    return results
+
+
+def benchmark_meteor_draw(wave: int = 30, counts=(20, 40, 80), frames: int = 600):
+    """Time drawing a wave's meteors, vector polygons vs cached sprites.
+
+    Meteors fall, leave the screen or are shot down at random and are
+    replaced by fresh spawns, as in play. Every frame is timed, starting
+    from an empty cache.
+    """
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    kill_chance = 1 / (2 * FPS)  # about two seconds of life on screen
+    print(f"wave {wave}, {frames} frames")
+    print(f"{'meteors':>7} {'vector ms':>10} {'cached ms':>10} {'speedup':>8} "
+          f"{'misses':>7} {'cache MB':>9}")
+    results = []
+    for count in counts:
+        timings = []
+        for sprites in (None, MeteorSpriteCache()):
+            game = Game.__new__(Game)  # no window needed
+            game.seed = count
+            game.reset_game()
+            game.wave = wave
+            for _ in range(count):
+                game.spawn_meteor()
+            for meteor in game.meteors:
+                meteor.y = game.rng.uniform(0, SCREEN_HEIGHT)
+            elapsed = 0.0
+            for _ in range(frames):
+                for meteor in game.meteors:
+                    meteor.update(1 / FPS)
+                    if game.rng.random() < kill_chance and meteor.hit():
+                        meteor.active = False
+                    elif meteor.y > SCREEN_HEIGHT + meteor.radius:
+                        meteor.active = False
+                game.meteor_pool.compact(game.meteors)
+                while len(game.meteors) < count:
+                    game.spawn_meteor()
+                start = time.perf_counter()
+                for meteor in game.meteors:
+                    meteor.draw(surface, sprites)
+                elapsed += time.perf_counter() - start
+            timings.append(elapsed / frames * 1000)
+        vector, cached = timings
+        results.append((count, vector, cached))
+        print(f"{count:>7} {vector:>10.3f} {cached:>10.3f} {vector / cached:>7.1f}x "
+              f"{sprites.misses / (frames * count):>7.1%} {sprites.nbytes / (1 << 20):>9.1f}")
+    return results
+
+
+def _legacy_draw_stars(field: StarField, surface: pygame.Surface):
+    """The original per-star draw loop, kept for comparison."""
+    for x, y, size, brightness, speed, offset in zip(
+            field.x.tolist(), field.y.tolist(), field.size.tolist(), field.brightness.tolist(),
+            field.twinkle_speed.tolist(), field.twinkle_offset.tolist()):
+        twinkle = math.sin(field.time * speed + offset)
+        alpha = int(brightness * (0.7 + 0.3 * twinkle))
+        alpha = max(50, min(255, alpha))
+        color = (alpha, alpha, alpha)
+        pygame.draw.circle(surface, color, (int(x), int(y)), size)
+
+
+def benchmark_stars(counts=(STAR_COUNT, 1000, MAX_STARS), frames: int = 300):
+    """Time drawing the star field: per-star loop, vectorized, and frozen layer."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'stars':>5} {'loop ms':>8} {'numpy ms':>9} {'frozen ms':>10}")
+    results = []
+    for count in counts:
+        field = StarField(count, random.Random(count))
+        timings = []
+        for draw in (_legacy_draw_stars, StarField.draw, None):
+            elapsed = 0.0
+            for _ in range(frames):
+                surface.fill(COLOR_BACKGROUND)
+                if draw is not None:
+                    field.update(1 / FPS)
+                start = time.perf_counter()
+                (draw or StarField.draw)(field, surface)
+                elapsed += time.perf_counter() - start
+            timings.append(elapsed / frames * 1000)
+        results.append((count, *timings))
+        print(f"{count:>5} {timings[0]:>8.3f} {timings[1]:>9.3f} {timings[2]:>10.3f}")
+    return results
+
+
+def use_headless_video():
+    """Switch SDL to its dummy video driver: no window, nothing shown."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.quit()
+    pygame.display.init()
+
+
+@dataclass
+class WaveStats:
+    wave: int
+    update_ms: List[float] = field(default_factory=list)
+    draw_ms: List[float] = field(default_factory=list)
+    peak_meteors: int = 0
+    peak_bullets: int = 0
+    peak_powerups: int = 0
+    peak_particles: int = 0
+
+
+def run_stress(waves: int = 50, seed: int = 0, tick_rate: int = TICK_RATE, start_wave: int = 1,
+               draw: bool = False) -> List[WaveStats]:
+    """Let the autopilot play `waves` waves headless, as fast as possible.
+
+    Meteors that get through cost no lives, so the run always reaches the
+    last wave. Prints ticks/sec, p50/p99 update (and draw) time and peak
+    entity counts for each wave.
+    """
+    game = Game(seed=seed, tick_rate=tick_rate, headless=True)
+    game.invulnerable = True
+    game.autopilot = Autopilot()
+    game.state = GameState.PLAYING
+    for _ in range(start_wave - 1):
+        game.next_wave()
+    last_wave = game.wave + waves - 1
+    
+    stats: List[WaveStats] = []
+    start = time.perf_counter()
+    while game.wave <= last_wave:
+        wave = WaveStats(game.wave)
+        stats.append(wave)
+        while game.wave == wave.wave:
+            tick_start = time.perf_counter()
+            game.update(game.fixed_dt)
+            wave.update_ms.append((time.perf_counter() - tick_start) * 1000)
+            if draw:
+                draw_start = time.perf_counter()
+                game.draw()
+                wave.draw_ms.append((time.perf_counter() - draw_start) * 1000)
+            wave.peak_meteors = max(wave.peak_meteors, len(game.meteors))
+            wave.peak_bullets = max(wave.peak_bullets, len(game.bullets))
+            wave.peak_powerups = max(wave.peak_powerups, len(game.powerups))
+            wave.peak_particles = max(wave.peak_particles, len(game.particles))
+            if len(wave.update_ms) > WAVE_TIMEOUT * tick_rate:
+                print(f"wave {wave.wave} stalled after {WAVE_TIMEOUT} simulated seconds")
+                break
+        else:
+            continue
+        break
+    elapsed = time.perf_counter() - start
+    
+    header = f"{'wave':>4} {'ticks':>6} {'ticks/s':>8} {'p50 ms':>7} {'p99 ms':>7}"
+    if draw:
+        header += f" {'draw p50':>8} {'draw p99':>8}"
+    print(f"seed {seed}, {tick_rate} Hz, waves {stats[0].wave}-{stats[-1].wave}")
+    print(header + f" {'meteors':>7} {'bullets':>7} {'power-ups':>9} {'particles':>9}")
+    for wave in stats:
+        times = np.array(wave.update_ms)
+        total = times.sum() + sum(wave.draw_ms)
+        line = (f"{wave.wave:>4} {len(times):>6} {len(times) / total * 1000:>8.0f} "
+                f"{np.percentile(times, 50):>7.3f} {np.percentile(times, 99):>7.3f}")
+        if draw:
+            line += f" {np.percentile(wave.draw_ms, 50):>8.3f} {np.percentile(wave.draw_ms, 99):>8.3f}"
+        print(line + f" {wave.peak_meteors:>7} {wave.peak_bullets:>7} "
+                     f"{wave.peak_powerups:>9} {wave.peak_particles:>9}")
+    
+    all_times = np.concatenate([wave.update_ms for wave in stats])
+    print(f"{len(all_times)} ticks ({len(all_times) / tick_rate:.0f} s simulated) in {elapsed:.1f}s: "
+          f"{len(all_times) / elapsed:,.0f} ticks/s, update p50 {np.percentile(all_times, 50):.3f} ms, "
+          f"p99 {np.percentile(all_times, 99):.3f} ms; score {game.score}, "
+          f"{game.autopilot.dashes} dashes, {len(game.autopilot.purchases)} purchases")
+    return stats
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
 
-if __name__ == "__main__":
-    game = Game()
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Meteor Defender")
+    parser.add_argument("--seed", type=int, help="seed every random draw, for reproducible games")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE, metavar="HZ",
+                        help=f"fixed simulation steps per second (default {TICK_RATE})")
+    parser.add_argument("--bench-particles", nargs="?", type=int, const=PARTICLE_CAPACITY, metavar="N",
+                        help="time the particle system with N live particles and exit")
+    parser.add_argument("--bench-collisions", action="store_true",
+                        help="compare the collision passes at 50, 200 and 1000 meteors and exit")
+    parser.add_argument("--bench-meteors", action="store_true",
+                        help="compare vector and cached meteor drawing at wave 30 and exit")
+    parser.add_argument("--stars", type=int, default=STAR_COUNT, metavar="N",
+                        help=f"number of background stars, up to {MAX_STARS} (default {STAR_COUNT})")
+    parser.add_argument("--bench-stars", action="store_true",
+                        help=f"time star field drawing at {STAR_COUNT}, 1000 and {MAX_STARS} stars and exit")
+    parser.add_argument("--frame-budget", type=float, default=FRAME_BUDGET_MS, metavar="MS",
+                        help="update+draw time per frame before visual quality is lowered "
+                             f"(default {FRAME_BUDGET_MS:.1f}; 0 keeps full quality)")
+    parser.add_argument("--stress", type=int, metavar="WAVES",
+                        help="let a scripted autopilot play WAVES waves headless and report timings")
+    parser.add_argument("--start-wave", type=int, default=1, metavar="N",
+                        help="wave the stress run starts at (default 1)")
+    parser.add_argument("--stress-draw", action="store_true",
+                        help="also render every tick of the stress run off-screen")
+    args = parser.parse_args(argv)
+    if not 0 <= args.stars <= MAX_STARS:
+        parser.error(f"--stars must be between 0 and {MAX_STARS}")
+
+    if args.bench_particles:
+        benchmark_particles(args.bench_particles)
+        return
+    if args.bench_collisions:
+        benchmark_collisions()
+        return
+    if args.bench_meteors:
+        benchmark_meteor_draw()
+        return
+    if args.bench_stars:
+        benchmark_stars()
+        return
+    if args.stress:
+        use_headless_video()
+        run_stress(args.stress, seed=0 if args.seed is None else args.seed, tick_rate=args.tick_rate,
+                   start_wave=args.start_wave, draw=args.stress_draw)
+        return
+
+    game = Game(seed=args.seed, tick_rate=args.tick_rate, star_count=args.stars,
+                frame_budget_ms=args.frame_budget)
     game.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Tests for Meteor Defender's simulation helpers (run headless)."""
+
+import importlib.util
+import os
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Loaded by path: other games in this repo also have a main.py.
+_spec = importlib.util.spec_from_file_location(
+    "meteor_defender_main", os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+)
+md = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(md)
+
+
+def test_particles_compact_dead_slots():
+    particles = md.ParticleSystem(capacity=100)
+    particles.create_explosion(10, 10, (255, 0, 0), num_particles=40)
+    particles.life[:40:2] = -1.0  # kill every other particle
+    survivors = sorted(particles.x[1:40:2] + particles.vx[1:40:2] * np.float32(0.1))
+    particles.update(0.1)
+    assert len(particles) == 20
+    assert np.all(particles.life[:20] > 0)
+    assert np.allclose(sorted(particles.x[:20]), survivors)
+
+
+def test_particles_drop_spawns_beyond_capacity():
+    particles = md.ParticleSystem(capacity=30)
+    for _ in range(3):
+        particles.create_explosion(0, 0, (0, 255, 0), num_particles=20)
+    assert len(particles) == 30
+    particles.update(1.0)  # everything expires
+    assert len(particles) == 0
+    particles.draw(md.pygame.Surface((md.SCREEN_WIDTH, md.SCREEN_HEIGHT)))
+
+
+def make_game(seed=None, tick_rate=md.TICK_RATE):
+    game = md.Game.__new__(md.Game)  # no window needed
+    game.seed = seed
+    game.tick_rate = tick_rate
+    game.reset_game()
+    return game
+
+
+def test_seeded_games_replay_identically_at_any_tick_rate():
+    def play(seed, tick_rate, seconds=9):
+        game = make_game(seed, tick_rate)
+        game.state = md.GameState.PLAYING
+        game.lives = 1000  # let meteors fall through
+        for _ in range(seconds * tick_rate):
+            game.update(game.fixed_dt)
+        return game
+
+    a, b = play(7, 60), play(7, 60)
+    assert [(m.x, m.y, m.vertices) for m in a.meteors] == [(m.x, m.y, m.vertices) for m in b.meteors]
+    assert a.meteors and len(a.particles) == len(b.particles)
+    assert [(m.x, m.y) for m in play(8, 60).meteors] != [(m.x, m.y) for m in a.meteors]
+
+    # Spawn timers may fire one step apart, so allow one 30 Hz step of travel.
+    slow = play(7, 30)
+    assert len(slow.meteors) == len(a.meteors)
+    for fast_meteor, slow_meteor in zip(a.meteors, slow.meteors):
+        step = np.hypot(fast_meteor.vx, fast_meteor.vy) / 30
+        assert np.hypot(fast_meteor.x - slow_meteor.x, fast_meteor.y - slow_meteor.y) <= step + 1e-6
+
+
+def test_spatial_hash_finds_objects_across_cell_edges():
+    grid = md.SpatialHash(cell_size=80)
+    grid.insert("a", 79, 79, 15)
+    grid.insert("b", 300, 300, 10)
+    assert grid.query_segment(90, 90, 95, 85) == ["a"] and grid.query_segment(70, 70, 75, 70) == ["a"]
+    assert grid.query_segment(200, 200, 230, 230) == []
+    assert sorted(grid.query_segment(330, 310, 70, 70)) == ["a", "b"]  # each listed once
+    assert grid.query_circle(100, 100, 50) == ["a"]
+
+
+def test_bullets_hit_meteor_circle_not_its_bounding_box():
+    game = make_game()
+    meteor = md.Meteor(400, 300, md.MeteorSize.LARGE)
+    game.meteors = [meteor]
+    r = md.METEOR_RADIUS[md.MeteorSize.LARGE]
+    corner = md.Bullet(400 + r * 0.9, 300 + r * 0.9, 0, -md.BULLET_SPEED)
+    inside = md.Bullet(400, 300 + r * 0.9, 0, -md.BULLET_SPEED)
+    game.bullets = [corner, inside]
+    game.check_collisions()
+    assert game.bullets == [corner]
+    assert game.meteors == [meteor] and meteor.health == meteor.max_health - 1
+
+
+def test_pool_reuses_released_objects_and_meteor_vertex_lists():
+    pool = md.Pool(md.Meteor)
+    live = [pool.acquire(100, 0, md.MeteorSize.LARGE) for _ in range(4)]
+    vertex_lists = {id(m.vertices) for m in live}
+    live[0].active = live[2].active = False
+    pool.compact(live)
+    assert len(live) == 2 and all(m.active for m in live)
+    reused = [pool.acquire(50, 0, md.MeteorSize.SMALL) for _ in range(2)]
+    assert pool.allocations == 4
+    for meteor in reused:
+        assert meteor.active and meteor.health == md.METEOR_HEALTH[md.MeteorSize.SMALL]
+        assert id(meteor.vertices) in vertex_lists and len(meteor.vertices) == meteor.num_vertices
+
+
+def test_meteor_sprite_cache_quantises_angles_and_evicts_old_shapes():
+    meteor = md.Meteor(100, 100, md.MeteorSize.LARGE)
+    meteor.rotation = 10.0
+    side = meteor.radius * 2 + 5
+    cache = md.MeteorSpriteCache(steps=64, max_bytes=2 * side * side * 4)
+    sprite, half = cache.get(meteor)
+    assert sprite.get_at((half, half))[:3] == meteor.get_color()
+    meteor.rotation += 360 / 64 * 0.4 + 360  # same step, one turn later
+    assert cache.get(meteor)[0] is sprite
+    meteor.health -= 1
+    assert cache.get(meteor)[0] is not sprite and cache.misses == 2
+    other = md.Meteor(200, 100, md.MeteorSize.LARGE)
+    other._set_shape((meteor.shape_id[1] + 1) % md.METEOR_SHAPES_PER_SIZE)
+    cache.get(other)
+    assert list(cache.shapes) == [other.shape_id] and cache.nbytes <= cache.max_bytes
+
+
+def test_meteors_share_a_bounded_set_of_shape_sprites():
+    game = make_game()
+    for _ in range(200):
+        game.spawn_meteor()
+    shapes = {meteor.shape_id for meteor in game.meteors}
+    assert len(shapes) <= len(md.MeteorSize) * md.METEOR_SHAPES_PER_SIZE
+    cache = md.MeteorSpriteCache()
+    for meteor in game.meteors:
+        meteor.rotation = meteor.health = 1
+        cache.get(meteor)
+    assert cache.misses == len(shapes)
+
+
+def test_stress_autopilot_plays_waves_headless():
+    stats = md.run_stress(waves=2, seed=1)
+    assert [wave.wave for wave in stats] == [1, 2]
+    assert all(wave.update_ms and wave.peak_meteors and wave.peak_bullets for wave in stats)
+
+
+def test_autopilot_works_through_the_shopping_list():
+    game = make_game(seed=1)
+    game.score = 100000
+    autopilot = md.Autopilot()
+    for _ in range(5):
+        autopilot.shop(game)
+    assert autopilot.purchases == list(md.Autopilot.SHOPPING_LIST)
+    assert {md.GunType.SMG, md.GunType.RIFLE} <= set(game.player.owned_guns)
+
+
+def test_star_field_matches_per_star_drawing_and_reuses_frozen_layer():
+    field = md.StarField(500, md.random.Random(3))
+    field.update(0.5)
+    surfaces = [md.pygame.Surface((md.SCREEN_WIDTH, md.SCREEN_HEIGHT)) for _ in range(3)]
+    md._legacy_draw_stars(field, surfaces[0])
+    field.draw(surfaces[1])
+    field.draw(surfaces[2])  # nothing moved: drawn from the cached layer
+    assert field._layer is not None
+    pixels = [md.pygame.surfarray.array2d(surface) for surface in surfaces]
+    assert np.array_equal(pixels[0], pixels[1]) and np.array_equal(pixels[0], pixels[2])
+
+
+def test_hud_labels_and_power_up_sprites_are_reused():
+    game = md.Game(headless=True)
+    game.state = md.GameState.PLAYING
+    game.draw()
+    score_label = game._labels["hud.score"][1]
+    game.draw()
+    assert game._labels["hud.score"][1] is score_label
+    game.score += 10
+    game.draw()
+    assert game._labels["hud.score"][1] is not score_label
+
+    a = md.PowerUp(100, 100, md.PowerUpType.SHIELD)
+    b = md.PowerUp(200, 100, md.PowerUpType.SHIELD)
+    a.pulse_time = b.pulse_time = 0.0
+    a.draw(game.screen)
+    glows = dict(md.PowerUp._glows)
+    b.draw(game.screen)
+    assert md.PowerUp._glows == glows and md.PowerUp.icon_sprite(a.type) is md.PowerUp.icon_sprite(b.type)
+
+
+def test_frame_governor_sheds_and_restores_quality():
+    governor = md.FrameGovernor(budget_ms=10, window=5)
+    changes = [governor.record(20) for _ in range(10)]
+    assert changes == [False] * 4 + [True] + [False] * 4 + [True]
+    assert governor.quality.name == "low"
+
+    game = make_game()
+    game.governor = governor
+    game.apply_quality()
+    game.particles.create_explosion(0, 0, (255, 0, 0), num_particles=20)
+    assert len(game.particles) == 5 and game.star_field.visible == 25
+
+    for _ in range(md.GOVERNOR_RESTORE_DELAY - 1):
+        assert not governor.record(3)
+    assert governor.record(3) and governor.quality.name == "medium"
+
+
+def test_fast_bullets_cannot_tunnel_through_meteors_at_low_tick_rates():
+    game = make_game(tick_rate=10)
+    near = md.Meteor(400, 300, md.MeteorSize.SMALL)
+    far = md.Meteor(400, 240, md.MeteorSize.SMALL)
+    for meteor in (near, far):
+        meteor.vx = meteor.vy = 0
+    game.meteors = [far, near]
+    bullet = md.Bullet(400, 340, 0, -md.BULLET_SPEED)
+    game.bullets = [bullet]
+    bullet.update(game.fixed_dt)  # 60 px: starts and ends outside `near`
+    assert bullet.y == 280
+    game.check_collisions()
+    assert game.bullets == [] and game.meteors == [far]
+
+    # Moving meteors: the path is tested relative to the meteor's motion.
+    assert md.segment_circle_time(0, 30, 0, -30, 15) == 0.25
+    assert md.segment_circle_time(20, 30, 20, -30, 15) is None
+    assert md.segment_circle_time(0, 30, 0, 20, 15) is None